@@ -17,6 +17,7 @@ import pyaudio
 import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import threading
 import queue
 import time
@@ -25,16 +26,52 @@ import os
 import sys
 import json
 from datetime import datetime, timedelta
-from collections import deque
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+import hashlib
 from enum import Enum
 import serial
 import serial.tools.list_ports
 import pyttsx3
 import io
+import shutil
+import subprocess
 import tempfile
 import requests
 import math
 import uuid
+import logging
+import re
+import traceback
+
+# Gated diagnostics for the weather/DTMF test paths: when debug mode is
+# off the calls reduce to a level check instead of formatting and
+# writing to stdout on every run of the 30-minute weather timer
+logger = logging.getLogger("repeater.weather")
+logger.setLevel(logging.WARNING)
+
+# Pre-compiled input validators for the weather entries: partial forms
+# accept in-progress typing, full forms gate the final parse so bad
+# input is rejected at the keystroke instead of via a float() exception
+_LAT_PARTIAL = re.compile(r'^-?\d{0,2}(\.\d*)?$')
+_LON_PARTIAL = re.compile(r'^-?\d{0,3}(\.\d*)?$')
+_ZIP_PARTIAL = re.compile(r'^\d{0,5}$')
+_COORD_FULL = re.compile(r'^-?\d{1,3}(\.\d+)?$')
+
+# Optional: Numba JIT-compiles the DSP hot loops to native code when installed.
+# Everything works without it - the plain NumPy paths are used as fallback.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional: SciPy gives faster, alias-free polyphase resampling of TTS audio.
+# Falls back to linear interpolation (np.interp) when not installed.
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
 
 class PTTMode(Enum):
     VOX = "VOX"
@@ -46,6 +83,11 @@ class RecordingMode(Enum):
     CONTINUOUS_DELAY = "Continuous Delay Line"
     REPEATER = "Repeater Mode"
 
+# Value -> member maps so config strings resolve with one dict lookup
+# instead of a linear scan over the enum
+_PTT_BY_VALUE = {m.value: m for m in PTTMode}
+_RECMODE_BY_VALUE = {m.value: m for m in RecordingMode}
+
 class WeatherService:
     """Fetches weather information from Weather.gov API (US only, no API key needed)"""
     def __init__(self):
@@ -59,18 +101,143 @@ class WeatherService:
         self.user_agent = "HamRadioRepeater/1.0 (Python-requests)"
         self.use_manual_coords = False  # New: Skip ZIP lookup
         self.debug_mode = False  # Toggle verbose output
-        
+        # On-disk geocode cache (next to repeater_config.json) - ZIP->lat/lon
+        # almost never changes, so don't re-fetch it on every startup
+        self._geocode_cache_file = "geocode_cache.json"
+        self._geocode_cache_ttl = 180 * 24 * 3600  # 180 days
+        # Cached weather.gov forecast URL - the points/{lat,lon} -> forecast
+        # URL mapping is static per coordinate, so only resolve it once
+        self._forecast_url = None
+        # One pooled HTTPS session for all weather/geocode calls - reusing
+        # the TCP+TLS connection skips a full handshake on every request
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": self.user_agent,
+            "Accept": "application/geo+json"
+        })
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=requests.adapters.Retry(
+                total=2, backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504]))
+        self._session.mount("https://", adapter)
+        # Background refresher keeps last_weather warm so announcement
+        # getters never block on HTTP (worst case was ~20s of timeouts)
+        self._refresh_thread = None
+
+    def _load_geocode_cache(self):
+        """Load the on-disk geocode cache (ZIP -> lat/lon)."""
+        try:
+            if os.path.exists(self._geocode_cache_file):
+                with open(self._geocode_cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"   Could not read geocode cache: {e}")
+        return {}
+
+    def _save_geocode_cache(self, cache):
+        """Write the geocode cache back to disk"""
+        try:
+            with open(self._geocode_cache_file, 'w') as f:
+                json.dump(cache, f, indent=4)
+        except Exception as e:
+            print(f"⚠️ Could not save geocode cache: {e}")
+
+    def _resolve_forecast_url(self):
+        """Get the forecastHourly URL for our coordinates (step 1 of the fetch).
+
+        Checks memory, then the on-disk cache, then asks weather.gov.
+        Caching this halves the number of HTTPS requests per refresh.
+        """
+        if self._forecast_url:
+            return self._forecast_url
+
+        coord_key = f"{self.latitude:.4f},{self.longitude:.4f}"
+
+        cache = self._load_geocode_cache()
+        cached_url = cache.get("forecast_urls", {}).get(coord_key)
+        if cached_url:
+            if self.debug_mode:
+                print(f"   Using cached forecast URL: {cached_url}")
+            self._forecast_url = cached_url
+            return cached_url
+
+        points_url = f"https://api.weather.gov/points/{coord_key}"
+        if self.debug_mode:
+            print(f"   Step 1: Getting weather station...")
+            print(f"   URL: {points_url}")
+
+        points_response = self._session.get(points_url, timeout=(3.05, 10))
+        if self.debug_mode:
+            print(f"   Response status: {points_response.status_code}")
+
+        if points_response.status_code != 200:
+            print(f"❌ Points request failed with status {points_response.status_code}")
+            print(f"   Response: {points_response.text[:200]}")
+
+            if points_response.status_code == 404:
+                print(f"   This location may be outside the US")
+                print(f"   Weather.gov only covers United States")
+            elif points_response.status_code == 500:
+                print(f"   Weather.gov server error - try again later")
+
+            return None
+
+        points_data = points_response.json()
+
+        if "properties" not in points_data:
+            print(f"❌ Invalid response from weather.gov")
+            if self.debug_mode:
+                print(f"   Response keys: {points_data.keys()}")
+            return None
+
+        if "forecastHourly" not in points_data["properties"]:
+            print(f"❌ No forecast URL in response")
+            if self.debug_mode:
+                print(f"   Available properties: {points_data['properties'].keys()}")
+            return None
+
+        forecast_url = points_data["properties"]["forecastHourly"]
+        if self.debug_mode:
+            print(f"   Forecast URL: {forecast_url}")
+
+        self._forecast_url = forecast_url
+        cache.setdefault("forecast_urls", {})[coord_key] = forecast_url
+        self._save_geocode_cache(cache)
+        return forecast_url
+
+    def _invalidate_forecast_url(self):
+        """Drop the cached forecast URL (in memory and on disk)."""
+        coord_key = f"{self.latitude:.4f},{self.longitude:.4f}"
+        self._forecast_url = None
+        cache = self._load_geocode_cache()
+        if cache.get("forecast_urls", {}).pop(coord_key, None) is not None:
+            self._save_geocode_cache(cache)
+
     def set_coordinates(self, lat, lon):
         """Manually set coordinates (bypass ZIP lookup)"""
         self.latitude = lat
         self.longitude = lon
         self.use_manual_coords = True
+        self._forecast_url = None  # Coordinates changed - re-resolve on next fetch
         print(f"📍 Manual coordinates set: {lat:.4f}, {lon:.4f}")
         
     def zip_to_coordinates(self, zip_code):
         """Convert ZIP code to lat/lon using Census.gov geocoding API"""
         if self.debug_mode:
             print(f"\n🔍 Looking up ZIP code: {zip_code}")
+
+        # Check the on-disk cache first - one successful lookup is good for
+        # months, saves a network round-trip per startup and works offline
+        cache = self._load_geocode_cache()
+        entry = cache.get(zip_code)
+        if entry and time.time() - entry.get("ts", 0) < self._geocode_cache_ttl:
+            self.latitude = entry["lat"]
+            self.longitude = entry["lon"]
+            print(f"✅ ZIP {zip_code} → Lat: {self.latitude:.4f}, Lon: {self.longitude:.4f} (cached)")
+            return True
+
         try:
             url = f"https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
             params = {
@@ -81,8 +248,8 @@ class WeatherService:
             if self.debug_mode:
                 print(f"   Calling: {url}")
                 print(f"   Params: {params}")
-            
-            response = requests.get(url, params=params, timeout=10)
+
+            response = self._session.get(url, params=params, timeout=(3.05, 10))
             if self.debug_mode:
                 print(f"   Response status: {response.status_code}")
             
@@ -99,6 +266,8 @@ class WeatherService:
                     self.latitude = coords["y"]
                     self.longitude = coords["x"]
                     print(f"✅ ZIP {zip_code} → Lat: {self.latitude:.4f}, Lon: {self.longitude:.4f}")
+                    cache[zip_code] = {"lat": self.latitude, "lon": self.longitude, "ts": time.time()}
+                    self._save_geocode_cache(cache)
                     return True
                 else:
                     print(f"❌ No matches found for ZIP: {zip_code}")
@@ -120,7 +289,6 @@ class WeatherService:
         except Exception as e:
             print(f"❌ ZIP code lookup failed: {type(e).__name__}: {e}")
             if self.debug_mode:
-                import traceback
                 traceback.print_exc()
             return False
     
@@ -147,97 +315,66 @@ class WeatherService:
         
         if self.debug_mode:
             print(f"\n🌤️ Fetching weather for: {self.latitude:.4f}, {self.longitude:.4f}")
-        
+
         try:
-            # Get weather station URL
-            headers = {
-                "User-Agent": self.user_agent,
-                "Accept": "application/geo+json"
-            }
-            points_url = f"https://api.weather.gov/points/{self.latitude:.4f},{self.longitude:.4f}"
+            # Step 1: Resolve the forecast URL (cached - it's static per coordinate)
+            forecast_url = self._resolve_forecast_url()
+            if not forecast_url:
+                return None
+
+            # Step 2: Get forecast
             if self.debug_mode:
-                print(f"   Step 1: Getting weather station...")
-                print(f"   URL: {points_url}")
-            
-            points_response = requests.get(points_url, headers=headers, timeout=10)
+                print(f"   Step 2: Getting forecast data...")
+            forecast_response = self._session.get(forecast_url, timeout=(3.05, 10))
             if self.debug_mode:
-                print(f"   Response status: {points_response.status_code}")
-            
-            if points_response.status_code == 200:
-                points_data = points_response.json()
-                
-                # Check for forecast URL
-                if "properties" not in points_data:
-                    print(f"❌ Invalid response from weather.gov")
-                    if self.debug_mode:
-                        print(f"   Response keys: {points_data.keys()}")
+                print(f"   Response status: {forecast_response.status_code}")
+
+            if forecast_response.status_code in (404, 410):
+                # Cached forecast URL went stale - re-resolve once and retry
+                print(f"⚠️ Cached forecast URL returned {forecast_response.status_code} - re-resolving")
+                self._invalidate_forecast_url()
+                forecast_url = self._resolve_forecast_url()
+                if not forecast_url:
                     return None
-                    
-                if "forecastHourly" not in points_data["properties"]:
-                    print(f"❌ No forecast URL in response")
+                forecast_response = self._session.get(forecast_url, timeout=(3.05, 10))
+
+            if forecast_response.status_code == 200:
+                forecast_data = forecast_response.json()
+
+                if "properties" not in forecast_data or "periods" not in forecast_data["properties"]:
+                    print(f"❌ Invalid forecast data structure")
                     if self.debug_mode:
-                        print(f"   Available properties: {points_data['properties'].keys()}")
+                        print(f"   Keys: {forecast_data.keys()}")
                     return None
-                
-                forecast_url = points_data["properties"]["forecastHourly"]
-                if self.debug_mode:
-                    print(f"   Forecast URL: {forecast_url}")
-                
-                # Get forecast
-                if self.debug_mode:
-                    print(f"   Step 2: Getting forecast data...")
-                forecast_response = requests.get(forecast_url, headers=headers, timeout=10)
-                if self.debug_mode:
-                    print(f"   Response status: {forecast_response.status_code}")
-                
-                if forecast_response.status_code == 200:
-                    forecast_data = forecast_response.json()
-                    
-                    if "properties" not in forecast_data or "periods" not in forecast_data["properties"]:
-                        print(f"❌ Invalid forecast data structure")
-                        if self.debug_mode:
-                            print(f"   Keys: {forecast_data.keys()}")
-                        return None
-                    
-                    periods = forecast_data["properties"]["periods"]
-                    if not periods:
-                        print(f"❌ No forecast periods available")
-                        return None
-                        
-                    current = periods[0]
-                    if self.debug_mode:
-                        print(f"   Current period: {current.get('name', 'Unknown')}")
-                    
-                    # Parse weather data
-                    weather = {
-                        "temperature": current.get("temperature", 0),
-                        "unit": current.get("temperatureUnit", "F"),
-                        "conditions": current.get("shortForecast", "Unknown"),
-                        "wind_speed": current.get("windSpeed", "Unknown"),
-                        "wind_direction": current.get("windDirection", "Unknown"),
-                        "timestamp": time.time()
-                    }
-                    
-                    self.last_weather = weather
-                    self.last_update = time.time()
-                    print(f"✅ Weather updated: {weather['temperature']}°{weather['unit']}, {weather['conditions']}")
-                    return weather
-                else:
-                    print(f"❌ Forecast request failed with status {forecast_response.status_code}")
-                    print(f"   Response: {forecast_response.text[:200]}")
+
+                periods = forecast_data["properties"]["periods"]
+                if not periods:
+                    print(f"❌ No forecast periods available")
                     return None
+
+                current = periods[0]
+                if self.debug_mode:
+                    print(f"   Current period: {current.get('name', 'Unknown')}")
+
+                # Parse weather data
+                weather = {
+                    "temperature": current.get("temperature", 0),
+                    "unit": current.get("temperatureUnit", "F"),
+                    "conditions": current.get("shortForecast", "Unknown"),
+                    "wind_speed": current.get("windSpeed", "Unknown"),
+                    "wind_direction": current.get("windDirection", "Unknown"),
+                    "timestamp": time.time()
+                }
+
+                self.last_weather = weather
+                self.last_update = time.time()
+                print(f"✅ Weather updated: {weather['temperature']}°{weather['unit']}, {weather['conditions']}")
+                return weather
             else:
-                print(f"❌ Points request failed with status {points_response.status_code}")
-                print(f"   Response: {points_response.text[:200]}")
-                
-                if points_response.status_code == 404:
-                    print(f"   This location may be outside the US")
-                    print(f"   Weather.gov only covers United States")
-                elif points_response.status_code == 500:
-                    print(f"   Weather.gov server error - try again later")
-                    
+                print(f"❌ Forecast request failed with status {forecast_response.status_code}")
+                print(f"   Response: {forecast_response.text[:200]}")
                 return None
-                    
+
         except requests.exceptions.Timeout:
             print(f"❌ Weather request timed out - check internet connection")
             return None
@@ -246,28 +383,212 @@ class WeatherService:
             return None
         except Exception as e:
             print(f"❌ Weather fetch failed: {type(e).__name__}: {e}")
-            import traceback
             traceback.print_exc()
             return None
     
+    def start_background_refresh(self):
+        """Start the periodic background refresher (idempotent)."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh_loop(self):
+        """Keep last_weather fresh so the announcement getters never block."""
+        while True:
+            try:
+                if self.enabled:
+                    self.fetch_weather()  # honors update_interval internally
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"Weather background refresh error: {e}")
+            time.sleep(60)
+
+    def _cached_weather(self, wait_timeout=2.0):
+        """Return the cached weather, fetching on-demand only when empty.
+
+        The on-demand fetch runs in its own thread with a short wait so a
+        caller on the audio path can't be stalled by slow HTTP timeouts.
+        """
+        weather = self.last_weather
+        if weather or not self.enabled:
+            # Stale-while-revalidate: serve the cached reading immediately
+            # and let a background fetch bring it current for the next caller
+            if (weather and self.enabled
+                    and time.time() - self.last_update >= self.update_interval):
+                threading.Thread(target=self.fetch_weather, daemon=True).start()
+            return weather
+
+        done = threading.Event()
+
+        def _fetch():
+            try:
+                self.fetch_weather()
+            finally:
+                done.set()
+
+        threading.Thread(target=_fetch, daemon=True).start()
+        done.wait(timeout=wait_timeout)
+        return self.last_weather
+
     def get_weather_announcement(self):
-        """Generate weather announcement text"""
-        weather = self.fetch_weather()
+        """Generate weather announcement text (non-blocking, uses cache)"""
+        weather = self._cached_weather()
         if not weather:
             return "Weather information unavailable"
-        
+
         text = f"Current weather: {weather['temperature']} degrees {weather['unit']}, "
         text += f"{weather['conditions']}, "
         text += f"wind {weather['wind_speed']} from the {weather['wind_direction']}"
         return text
-    
+
     def get_temperature_only(self):
-        """Get just temperature for ID"""
-        weather = self.fetch_weather()
+        """Get just temperature for ID (non-blocking, uses cache)"""
+        weather = self._cached_weather()
         if not weather:
             return ""
         return f"temperature {weather['temperature']} degrees"
 
+def _goertzel_batch(samples, coeffs):
+    """Goertzel recurrence over a bank of DTMF frequencies (NumPy fallback).
+
+    Vectorizes the per-sample update across the frequency bank, which is
+    the fastest interpreted form. Returns squared magnitudes: callers
+    compare against squared thresholds, so the sqrt pass is never needed.
+    """
+    q1 = np.zeros(coeffs.shape[0])
+    q2 = np.zeros(coeffs.shape[0])
+
+    for sample in samples:
+        q0 = coeffs * q1 - q2 + sample
+        q2 = q1
+        q1 = q0
+
+    return q1 * q1 + q2 * q2 - q1 * q2 * coeffs
+
+def _goertzel_batch_scalar(samples, coeffs):
+    """Goertzel bank with scalar recurrences (the Numba-compiled form).
+
+    One frequency per outer iteration with the recurrence state in plain
+    scalars: Numba keeps q1/q2 in registers and allocates nothing per
+    sample, unlike the array-expression fallback above. Returns squared
+    magnitudes like _goertzel_batch.
+    """
+    out = np.empty(coeffs.shape[0])
+    for j in range(coeffs.shape[0]):
+        coeff = coeffs[j]
+        q1 = 0.0
+        q2 = 0.0
+        for i in range(samples.shape[0]):
+            q0 = coeff * q1 - q2 + samples[i]
+            q2 = q1
+            q1 = q0
+        out[j] = q1 * q1 + q2 * q2 - q1 * q2 * coeff
+    return out
+
+def _i16_to_f32_norm(src, dst):
+    """Convert int16 samples to normalized float32 into a preallocated buffer.
+
+    Compiled by Numba to a plain native loop: for the small low-latency
+    chunks (512-1024 samples) this beats np.frombuffer + np.multiply,
+    whose fixed dispatch/allocator overhead dominates at that size.
+    """
+    for i in range(len(src)):
+        dst[i] = src[i] * (1.0 / 32768.0)
+
+def _peak_mean(buf):
+    """Peak and mean of abs(buf) in one fused pass (audio level metering).
+
+    Replaces two separate np.abs().max()/.mean() passes (and their int16
+    temporaries) with a single loop Numba compiles to vectorized native code.
+    """
+    peak = 0
+    total = 0.0
+    for i in range(len(buf)):
+        v = buf[i]
+        if v < 0:
+            v = -v
+        if v > peak:
+            peak = v
+        total += v
+    if len(buf) == 0:
+        return 0, 0.0
+    return peak, total / len(buf)
+
+def _apply_gain_i16(src, gain, out):
+    """Multiply-saturate int16 samples by gain into a preallocated buffer.
+
+    Fuses the gain multiply, clip and int16 cast that otherwise take three
+    NumPy passes (with two float temporaries) per audio callback.
+    """
+    for i in range(len(src)):
+        val = src[i] * gain
+        if val > 32767.0:
+            val = 32767.0
+        elif val < -32768.0:
+            val = -32768.0
+        out[i] = np.int16(val)
+
+def _sum_abs_i16(buf):
+    """Integer sum of abs(buf) in one fused pass (delay-line level gate).
+
+    The delay-line PTT detector needs only the mean (no peak), and keeping
+    the accumulator integer lets the caller gate on a precomputed integer
+    threshold with no float promotion of the chunk.
+    """
+    # int64 seed: under plain NumPy the accumulator would otherwise stay
+    # int16 and wrap on any audible chunk
+    total = np.int64(0)
+    for i in range(len(buf)):
+        v = buf[i]
+        if v < 0:
+            v = -v
+        total += v
+    return total
+
+def _any_above_i16(buf, thr):
+    """True if any sample exceeds thr in magnitude (early-exit scan).
+
+    The delay-line gate only asks "is anything loud?", so on a busy
+    channel this returns within the first few samples instead of always
+    reducing the whole chunk.
+    """
+    for i in range(len(buf)):
+        v = buf[i]
+        if v > thr or v < -thr:
+            return True
+    return False
+
+def _vox_step(level, threshold, attack_samples, release_samples,
+              active, consecutive_high, consecutive_low):
+    """One step of the VOX attack/release hysteresis.
+
+    Pulled out of VOXDetector so Numba can compile it: the state machine
+    runs once per audio callback, and as a native function it's a handful
+    of comparisons with no attribute lookups.
+    """
+    if level > threshold:
+        consecutive_high += 1
+        consecutive_low = 0
+        if consecutive_high >= attack_samples:
+            active = True
+    else:
+        consecutive_low += 1
+        consecutive_high = 0
+        if consecutive_low >= release_samples:
+            active = False
+    return active, consecutive_high, consecutive_low
+
+if njit is not None:
+    _goertzel_batch = njit(cache=True, fastmath=True)(_goertzel_batch_scalar)
+    _i16_to_f32_norm = njit(cache=True)(_i16_to_f32_norm)
+    _peak_mean = njit(cache=True, fastmath=True)(_peak_mean)
+    _apply_gain_i16 = njit(cache=True, fastmath=True)(_apply_gain_i16)
+    _sum_abs_i16 = njit(cache=True)(_sum_abs_i16)
+    _any_above_i16 = njit(cache=True)(_any_above_i16)
+    _vox_step = njit(cache=True)(_vox_step)
+
+
 class DTMFDetector:
     """Detects DTMF tones in audio using Goertzel algorithm"""
     
@@ -278,11 +599,24 @@ class DTMFDetector:
         '7': (852, 1209), '8': (852, 1336), '9': (852, 1477), 'C': (852, 1633),
         '*': (941, 1209), '0': (941, 1336), '#': (941, 1477), 'D': (941, 1633)
     }
-    
+
+    # Keypad layout: rows are the 4 low frequencies, columns the 4 high frequencies
+    DTMF_KEYS = (('1', '2', '3', 'A'),
+                 ('4', '5', '6', 'B'),
+                 ('7', '8', '9', 'C'),
+                 ('*', '0', '#', 'D'))
+
     def __init__(self, sample_rate=44100):
         self.sample_rate = sample_rate
         self.enabled = False
-        self.buffer = deque(maxlen=int(sample_rate * 0.1))  # 100ms buffer
+        # 100ms sample buffer as a preallocated float32 ring (no per-sample
+        # Python object boxing on the audio callback path)
+        self._buffer_len = int(sample_rate * 0.1)
+        self._ring = np.zeros(self._buffer_len, dtype=np.float32)
+        self._ring_pos = 0
+        self._ring_count = 0
+        # Reusable int16->float32 conversion buffer (sized on first chunk)
+        self._scale_buf = None
         self.last_tone = None
         self.last_tone_time = 0
         self.tone_timeout = 0.5  # seconds
@@ -291,57 +625,125 @@ class DTMFDetector:
         self.last_digit_time = 0
         self.min_tone_duration = 0.08  # 80ms minimum (was 50ms) - reduces false positives
         self.detection_threshold = 0.15  # Higher threshold = less sensitive = fewer false positives
+        # Squared thresholds: the Goertzel kernel returns squared magnitudes
+        # and the RMS gate compares mean power, so no sqrt is ever taken
+        self._thresh_sq = self.detection_threshold ** 2
+        self._rms_gate_sq = (self.detection_threshold * 0.3) ** 2
         self.debug_mode = False  # Toggle verbose output
-        
-    def goertzel(self, samples, freq):
-        """Goertzel algorithm for detecting specific frequency"""
+
+        # Precompute Goertzel coefficients for all 8 DTMF frequencies so one
+        # vectorized pass scores every digit (instead of 16 scalar loops)
+        # Public so callers can size their PyAudio frames_per_buffer to match:
+        # chunks of exactly this length take a zero-copy path in detect_tone
+        self.analyze_window = int(sample_rate * 0.05)  # 50ms
+        self._min_tone_samples = int(sample_rate * self.min_tone_duration)
+        freqs = np.array([697, 770, 852, 941, 1209, 1336, 1477, 1633], dtype=np.float64)
+        k = np.floor(0.5 + (self.analyze_window * freqs / sample_rate))
+        coeffs = 2.0 * np.cos((2.0 * np.pi * k) / self.analyze_window)
+        # Split into row (low) and column (high) banks: every digit needs a
+        # low tone, so the high bank only runs when a low tone is present
+        self._goertzel_coeffs_low = np.ascontiguousarray(coeffs[:4])
+        self._goertzel_coeffs_high = np.ascontiguousarray(coeffs[4:])
+
+        # Warm up the JIT off the audio thread so the first real detection
+        # doesn't pay the one-time compile latency
+        if njit is not None:
+            _goertzel_batch(np.zeros(8, dtype=np.float32), self._goertzel_coeffs_low)
+            _i16_to_f32_norm(memoryview(b'\x00\x00').cast('h'),
+                             np.zeros(1, dtype=np.float32))
+
+    def goertzel(self, samples, coeffs):
+        """Vectorized Goertzel: evaluate all frequencies in a single pass.
+
+        Returns squared magnitudes - compare against squared thresholds.
+        Delegates to the module-level kernel, which Numba JIT-compiles to
+        native code when available; otherwise it runs as plain NumPy with
+        the recurrence state held in length-8 vectors.
+        """
+        return _goertzel_batch(samples, coeffs)
+
+    def _ring_write(self, samples):
+        """Copy samples into the ring buffer, wrapping as needed."""
         n = len(samples)
-        k = int(0.5 + (n * freq / self.sample_rate))
-        omega = (2.0 * math.pi * k) / n
-        coeff = 2.0 * math.cos(omega)
-        
-        q0 = 0.0
-        q1 = 0.0
-        q2 = 0.0
-        
-        for sample in samples:
-            q0 = coeff * q1 - q2 + sample
-            q2 = q1
-            q1 = q0
-        
-        magnitude = math.sqrt(q1 * q1 + q2 * q2 - q1 * q2 * coeff)
-        return magnitude
-    
+        if n >= self._buffer_len:
+            self._ring[:] = samples[-self._buffer_len:]
+            self._ring_pos = 0
+        else:
+            end = self._ring_pos + n
+            if end <= self._buffer_len:
+                self._ring[self._ring_pos:end] = samples
+            else:
+                split = self._buffer_len - self._ring_pos
+                self._ring[self._ring_pos:] = samples[:split]
+                self._ring[:end - self._buffer_len] = samples[split:]
+            self._ring_pos = end % self._buffer_len
+        self._ring_count = min(self._ring_count + n, self._buffer_len)
+
+    def _ring_window(self, n):
+        """Return the most recent n samples as a contiguous array.
+
+        Returns a view when the window doesn't straddle the wrap point,
+        so the common case is copy-free.
+        """
+        pos = self._ring_pos
+        if pos >= n:
+            return self._ring[pos - n:pos]
+        return np.concatenate((self._ring[pos - n:], self._ring[:pos]))
+
     def detect_tone(self, audio_chunk):
         """Detect DTMF tone in audio chunk"""
         if not self.enabled:
             return None
-        
-        # Add to buffer
-        samples = np.frombuffer(audio_chunk, dtype=np.int16).astype(np.float32) / 32768.0
-        self.buffer.extend(samples)
-        
-        # Need enough samples
-        if len(self.buffer) < self.sample_rate * self.min_tone_duration:
-            return None
-        
-        # Get samples for analysis
-        analyze_samples = list(self.buffer)[-int(self.sample_rate * 0.05):]  # Last 50ms
-        
-        # Detect all frequency pairs
+
+        # Convert int16 -> normalized float32 in one fused pass into a
+        # persistent buffer (no fresh allocation per chunk)
+        n_samples = len(audio_chunk) // 2
+        if self._scale_buf is None or len(self._scale_buf) != n_samples:
+            self._scale_buf = np.empty(n_samples, dtype=np.float32)
+        if njit is not None and n_samples < 2048:
+            # Small low-latency chunks: a compiled loop over a raw memoryview
+            # skips NumPy's per-call dispatch overhead entirely
+            _i16_to_f32_norm(memoryview(audio_chunk).cast('h'), self._scale_buf)
+        else:
+            src = np.frombuffer(audio_chunk, dtype=np.int16)
+            np.multiply(src, np.float32(1.0 / 32768.0), out=self._scale_buf)
+        # When the producer delivers exactly one analysis window per call
+        # (frames_per_buffer == analyze_window), analyze the converted chunk
+        # in place - no ring copy and no window slice per callback
+        if n_samples == self.analyze_window:
+            self._ring_count = min(self._ring_count + n_samples, self._buffer_len)
+            if self._ring_count < self._min_tone_samples:
+                return None
+            analyze_samples = self._scale_buf
+        else:
+            self._ring_write(self._scale_buf)
+
+            # Need enough samples
+            if self._ring_count < self._min_tone_samples:
+                return None
+
+            # Get samples for analysis
+            analyze_samples = self._ring_window(self.analyze_window)  # Last 50ms
+
         best_tone = None
-        best_magnitude = 0
-        
-        for digit, (low_freq, high_freq) in self.DTMF_FREQS.items():
-            low_mag = self.goertzel(analyze_samples, low_freq)
-            high_mag = self.goertzel(analyze_samples, high_freq)
-            
-            # Both frequencies must be present
-            magnitude = min(low_mag, high_mag)
-            
-            if magnitude > self.detection_threshold and magnitude > best_magnitude:
-                best_magnitude = magnitude
-                best_tone = digit
+
+        # Cheap RMS gate: a repeater channel is silent (or carrying voice, not
+        # DTMF) most of the time, so skip the Goertzel work entirely when the
+        # window can't possibly contain a tone above threshold
+        mean_power = float(np.mean(analyze_samples * analyze_samples))
+        if mean_power >= self._rms_gate_sq:
+            # Two-stage scoring: every digit needs a low tone, so the high
+            # bank is only evaluated when a low tone actually clears the
+            # threshold - which skips half the Goertzel work on voice/noise
+            low_mags = self.goertzel(analyze_samples, self._goertzel_coeffs_low)
+            row = int(np.argmax(low_mags))
+            if low_mags[row] > self._thresh_sq:
+                high_mags = self.goertzel(analyze_samples, self._goertzel_coeffs_high)
+                col = int(np.argmax(high_mags))
+                # A digit's score is min(low, high); the pair only counts
+                # when both tones clear the threshold
+                if high_mags[col] > self._thresh_sq:
+                    best_tone = self.DTMF_KEYS[row][col]
         
         # Debounce - same tone must be consistent
         current_time = time.time()
@@ -382,7 +784,8 @@ class DTMFDetector:
         elif digit == '#':
             # # = Submit current buffer as command (even if less than 4 digits)
             if self.digit_buffer:
-                print(f"✅ DTMF submit: {self.digit_buffer}")
+                if self.debug_mode:
+                    print(f"✅ DTMF submit: {self.digit_buffer}")
                 return self.digit_buffer
             return ""
         
@@ -401,11 +804,12 @@ class DTMFDetector:
             if not is_duplicate or time_since_last > debounce_time:
                 self.digit_buffer += digit
                 self.last_digit_time = current_time
-                # Always show when command is ready, only show progress in debug mode
-                if len(self.digit_buffer) >= 4:
-                    print(f"📟 DTMF: {self.digit_buffer} ▶️ READY")
-                elif self.debug_mode:
-                    print(f"📟 DTMF: {self.digit_buffer}")
+                # Only show dialing progress in debug mode
+                if self.debug_mode:
+                    if len(self.digit_buffer) >= 4:
+                        print(f"📟 DTMF: {self.digit_buffer} ▶️ READY")
+                    else:
+                        print(f"📟 DTMF: {self.digit_buffer}")
             else:
                 # Duplicate within debounce time - ignore (key still held)
                 pass
@@ -423,9 +827,10 @@ class DTMFDetector:
         if len(self.digit_buffer) >= 4:
             command = self.digit_buffer[:4]
             self.digit_buffer = self.digit_buffer[4:]  # Remove used digits
-            print(f"🎯 Extracted command: {command}")
-            if self.digit_buffer:
-                print(f"📟 Buffer now: {self.digit_buffer}")
+            if self.debug_mode:
+                print(f"🎯 Extracted command: {command}")
+                if self.digit_buffer:
+                    print(f"📟 Buffer now: {self.digit_buffer}")
             return command
         return None
     
@@ -439,6 +844,7 @@ class ConfigManager:
     """Manages saving and loading configuration"""
     def __init__(self, config_file="repeater_config.json"):
         self.config_file = config_file
+        self.debug_mode = False  # Gate per-save prints (saves fire on every slider tick)
         self.default_config = {
             # Repeater settings
             "callsign": "WRKC123",
@@ -483,7 +889,8 @@ class ConfigManager:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as f:
                     config = json.load(f)
-                print(f"Configuration loaded from {self.config_file}")
+                if self.debug_mode:
+                    print(f"Configuration loaded from {self.config_file}")
                 return config
             else:
                 print("No config file found, using defaults")
@@ -493,11 +900,18 @@ class ConfigManager:
             return self.default_config.copy()
     
     def save_config(self, config):
-        """Save configuration to file"""
+        """Save configuration to file (atomic: temp file then rename)"""
         try:
-            with open(self.config_file, 'w') as f:
+            # Write the whole file to a temp path and rename it over the
+            # old one so a crash mid-write can't leave a truncated config
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(config, f, indent=4)
-            print(f"Configuration saved to {self.config_file}")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            if self.debug_mode:
+                print(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -505,12 +919,24 @@ class ConfigManager:
 
 class PTTController:
     """Handles PTT control via serial/USB GPIO"""
+
+    # Command-relay byte sequences (x003qjjrql and similar Chinese modules).
+    # All known formats are concatenated so each PTT transition is exactly
+    # one serial write() instead of three
+    _PTT_ON_BLOB = (bytes([0xA0, 0x01, 0x01, 0xA2]) +  # Common format 1
+                    bytes([0xFF, 0x01, 0x01]) +         # Common format 2
+                    bytes([0x01]))                      # Simple single byte
+    _PTT_OFF_BLOB = (bytes([0xA0, 0x01, 0x00, 0xA1]) +  # Common format 1
+                     bytes([0xFF, 0x01, 0x00]) +         # Common format 2
+                     bytes([0x00]))                      # Simple single byte
+
     def __init__(self):
         self.serial_port = None
         self.port_name = None
         self.is_connected = False
         self.ptt_active = False
         self.relay_type = "RTS"  # "RTS" or "COMMAND"
+        self.debug_mode = False  # Gate per-transition prints off the PTT path
         
     def set_relay_type(self, relay_type):
         """Set relay type: 'RTS' for RTS/DTR control, 'COMMAND' for byte commands"""
@@ -523,7 +949,8 @@ class PTTController:
             if self.serial_port:
                 self.disconnect()
                 
-            self.serial_port = serial.Serial(port_name, baudrate, timeout=1)
+            # write_timeout=0: never let a relay write block the PTT path
+            self.serial_port = serial.Serial(port_name, baudrate, timeout=1, write_timeout=0)
             self.port_name = port_name
             self.is_connected = True
             print(f"Connected to {port_name} at {baudrate} baud")
@@ -547,21 +974,16 @@ class PTTController:
         if self.is_connected and self.serial_port:
             try:
                 if self.relay_type == "COMMAND":
-                    # Command-based relay (x003qjjrql and similar Chinese modules)
-                    # Try common relay ON commands
-                    commands = [
-                        bytes([0xA0, 0x01, 0x01, 0xA2]),  # Common format 1
-                        bytes([0xFF, 0x01, 0x01]),         # Common format 2
-                        bytes([0x01]),                     # Simple single byte
-                    ]
-                    for cmd in commands:
-                        self.serial_port.write(cmd)
-                        print(f"🔴 PTT ON - Sent command: {cmd.hex()}")
+                    # Command-based relay: all common ON formats in one write
+                    self.serial_port.write(self._PTT_ON_BLOB)
+                    if self.debug_mode:
+                        print(f"🔴 PTT ON - Sent commands: {self._PTT_ON_BLOB.hex()}")
                 else:
                     # RTS/DTR control
                     self.serial_port.setRTS(True)
                     self.serial_port.setDTR(True)
-                    print("🔴 PTT ON - RTS/DTR set HIGH")
+                    if self.debug_mode:
+                        print("🔴 PTT ON - RTS/DTR set HIGH")
                     
                 self.ptt_active = True
             except Exception as e:
@@ -572,20 +994,16 @@ class PTTController:
         if self.is_connected and self.serial_port:
             try:
                 if self.relay_type == "COMMAND":
-                    # Command-based relay OFF
-                    commands = [
-                        bytes([0xA0, 0x01, 0x00, 0xA1]),  # Common format 1
-                        bytes([0xFF, 0x01, 0x00]),         # Common format 2
-                        bytes([0x00]),                     # Simple single byte
-                    ]
-                    for cmd in commands:
-                        self.serial_port.write(cmd)
-                        print(f"⚪ PTT OFF - Sent command: {cmd.hex()}")
+                    # Command-based relay: all common OFF formats in one write
+                    self.serial_port.write(self._PTT_OFF_BLOB)
+                    if self.debug_mode:
+                        print(f"⚪ PTT OFF - Sent commands: {self._PTT_OFF_BLOB.hex()}")
                 else:
                     # RTS/DTR control
                     self.serial_port.setRTS(False)
                     self.serial_port.setDTR(False)
-                    print("⚪ PTT OFF - RTS/DTR set LOW")
+                    if self.debug_mode:
+                        print("⚪ PTT OFF - RTS/DTR set LOW")
                     
                 self.ptt_active = False
             except Exception as e:
@@ -606,28 +1024,20 @@ class VOXDetector:
         self.sample_rate = 44100
         self.attack_samples = int(self.sample_rate * attack_time / 1024)
         self.release_samples = int(self.sample_rate * release_time / 1024)
-        self.level_history = deque(maxlen=max(self.attack_samples, self.release_samples))
         self.is_active = False
         self.consecutive_high = 0
         self.consecutive_low = 0
-    
+
+        # Warm up the JIT so the first callback doesn't pay compile latency
+        if njit is not None:
+            _vox_step(0.0, 1.0, 1, 1, False, 0, 0)
+
     def process(self, audio_level):
         """Process audio level and return VOX state"""
-        self.level_history.append(audio_level)
-        
-        if audio_level > self.threshold:
-            self.consecutive_high += 1
-            self.consecutive_low = 0
-            
-            if self.consecutive_high >= self.attack_samples:
-                self.is_active = True
-        else:
-            self.consecutive_low += 1
-            self.consecutive_high = 0
-            
-            if self.consecutive_low >= self.release_samples:
-                self.is_active = False
-        
+        self.is_active, self.consecutive_high, self.consecutive_low = _vox_step(
+            float(audio_level), float(self.threshold),
+            self.attack_samples, self.release_samples,
+            self.is_active, self.consecutive_high, self.consecutive_low)
         return self.is_active
     
     def reset(self):
@@ -639,17 +1049,66 @@ class VOXDetector:
 class TTSGenerator:
     """Text-to-speech generator for announcements.
 
+    Prefers the espeak-ng CLI when it's on PATH: it starts in tens of
+    milliseconds, streams WAV to stdout (no temp-file round-trip) and can't
+    hang the way pyttsx3 can.
+
     NOTE:
-    pyttsx3 can occasionally deadlock/hang after the first run on some systems when
-    a single engine instance is reused from a background thread. To make repeated
-    announcements reliable (and allow clean stop/start), we create a fresh engine
-    per announcement under a lock and write to a unique temp WAV each time.
+    pyttsx3 (the fallback) can occasionally deadlock/hang after the first run
+    on some systems when a single engine instance is reused from a background
+    thread. To make repeated announcements reliable (and allow clean
+    stop/start), we create a fresh engine per announcement under a lock and
+    write to a unique temp WAV each time.
     """
     def __init__(self, sample_rate=44100, rate=150, volume=0.9):
         self.sample_rate = sample_rate
         self.rate = rate
         self.volume = volume
         self._lock = threading.Lock()
+        self._espeak_available = shutil.which("espeak-ng") is not None
+        # Rendered-speech cache: repeated announcements (station ID, canned
+        # messages) skip pyttsx3 entirely. Small LRU in memory, .npy on disk.
+        self._mem_cache = OrderedDict()
+        self._mem_cache_size = 32
+        self._disk_cache_dir = os.path.join(os.path.expanduser("~"), ".soft_repeater", "tts_cache")
+
+    def _cache_path(self, key):
+        return os.path.join(self._disk_cache_dir, f"{key}.npy")
+
+    def _cache_insert(self, key, audio):
+        """Insert into the in-memory LRU, evicting the oldest past capacity."""
+        self._mem_cache[key] = audio
+        self._mem_cache.move_to_end(key)
+        while len(self._mem_cache) > self._mem_cache_size:
+            self._mem_cache.popitem(last=False)
+
+    def _cache_get(self, key):
+        """Look up rendered speech in memory, then on disk."""
+        if key in self._mem_cache:
+            self._mem_cache.move_to_end(key)
+            return self._mem_cache[key]
+        try:
+            path = self._cache_path(key)
+            if os.path.exists(path):
+                audio = np.load(path)
+                audio.flags.writeable = False
+                self._cache_insert(key, audio)
+                return audio
+        except Exception:
+            pass
+        return None
+
+    def _cache_put(self, key, audio):
+        """Store rendered speech in the memory LRU and on disk."""
+        # Cached arrays are handed straight to playback when there's no
+        # pre-delay - freeze them so a caller can't corrupt the cache
+        audio.flags.writeable = False
+        self._cache_insert(key, audio)
+        try:
+            os.makedirs(self._disk_cache_dir, exist_ok=True)
+            np.save(self._cache_path(key), audio)
+        except Exception as e:
+            print(f"TTS: Could not write cache file: {e}")
 
     def _new_engine(self):
         engine = pyttsx3.init()
@@ -658,7 +1117,110 @@ class TTSGenerator:
         return engine
 
     def generate_announcement(self, text, pre_delay=1.0):
-        """Generate audio data from text with optional pre-delay silence."""
+        """Generate audio data from text with optional pre-delay silence.
+
+        Rendered speech is cached by (text, rate, volume, sample_rate), so
+        repeated announcements are a cache read instead of a full pyttsx3
+        run. The pre-delay silence is applied after the lookup since it can
+        vary per call.
+        """
+        key = hashlib.sha1(
+            f"{text}|{self.rate}|{self.volume}|{self.sample_rate}".encode()).hexdigest()
+
+        speech = self._cache_get(key)
+        if speech is None:
+            speech = self._synthesize(text)
+            if speech is None:
+                # Synthesis failed - return fallback silence, don't cache it
+                return np.zeros(int(self.sample_rate * 2), dtype=np.int16)
+            self._cache_put(key, speech)
+        else:
+            print(f"TTS: Using cached audio for: '{text}'")
+
+        pre_silence_samples = int(self.sample_rate * float(pre_delay)) if pre_delay and pre_delay > 0 else 0
+        if pre_silence_samples <= 0:
+            return speech
+
+        audio_data = np.zeros(pre_silence_samples + len(speech), dtype=np.int16)
+        audio_data[pre_silence_samples:] = speech
+        print(f"TTS: Added {pre_delay}s pre-delay, total length: {len(audio_data)} samples ({len(audio_data)/self.sample_rate:.2f}s)")
+        return audio_data
+
+    def _synthesize(self, text):
+        """Render text to int16 PCM at self.sample_rate (None on failure)."""
+        if self._espeak_available:
+            audio_data = self._synthesize_espeak(text)
+            if audio_data is not None:
+                return audio_data
+            print("TTS: espeak-ng failed - falling back to pyttsx3")
+        return self._synthesize_pyttsx3(text)
+
+    def _synthesize_espeak(self, text):
+        """Render text via the espeak-ng CLI (None on failure)."""
+        try:
+            print(f"TTS: Generating speech with espeak-ng for: '{text}'")
+            amplitude = max(0, min(200, int(self.volume * 200)))
+            proc = subprocess.run(
+                ["espeak-ng", "--stdout", "-s", str(int(self.rate)), "-a", str(amplitude), text],
+                capture_output=True, timeout=15)
+
+            if proc.returncode != 0 or len(proc.stdout) <= 44:
+                print(f"ERROR: espeak-ng failed (exit code {proc.returncode})")
+                return None
+
+            with wave.open(io.BytesIO(proc.stdout), 'rb') as wf:
+                nchannels = wf.getnchannels()
+                original_rate = wf.getframerate()
+                frames = wf.readframes(wf.getnframes())
+
+            if not frames:
+                # espeak-ng leaves the RIFF size fields unset when streaming
+                # to stdout - fall back to everything after the 44-byte header
+                frames = proc.stdout[44:]
+
+            audio_data = self._process_pcm(frames, nchannels, original_rate)
+            print("TTS: Generation complete!")
+            return audio_data
+
+        except Exception as e:
+            print(f"TTS espeak-ng generation failed: {e}")
+            return None
+
+    def _process_pcm(self, frames, nchannels, original_rate):
+        """Convert raw int16 PCM bytes to mono int16 at self.sample_rate."""
+        samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+
+        # If multi-channel, downmix to mono by averaging the channels
+        # (both engines usually output mono anyway)
+        if nchannels > 1:
+            samples = samples.reshape(-1, nchannels).mean(axis=1)
+
+        # Resample if needed
+        if original_rate != self.sample_rate and original_rate > 0:
+            print(f"TTS: Resampling from {original_rate} to {self.sample_rate}")
+            if resample_poly is not None:
+                # Polyphase FIR resampling (compiled, no audible aliasing)
+                frac = Fraction(self.sample_rate, original_rate).limit_denominator(1000)
+                samples = resample_poly(samples, frac.numerator, frac.denominator)
+            else:
+                duration = len(samples) / original_rate
+                new_length = max(1, int(duration * self.sample_rate))
+                samples = np.interp(
+                    np.linspace(0, len(samples), new_length, endpoint=False),
+                    np.arange(len(samples)),
+                    samples
+                )
+
+        # Boost volume by 50% (audibility) and clip in place on the
+        # float samples, then land them in a single int16 allocation
+        np.multiply(samples, 1.5, out=samples)
+        np.clip(samples, -32768, 32767, out=samples)
+        audio_data = samples.astype(np.int16)
+        print(f"TTS: Audio data length: {len(audio_data)} samples, peak: {np.abs(audio_data).max()}")
+        return audio_data
+
+    def _synthesize_pyttsx3(self, text):
+        """Render text via pyttsx3 and a temp WAV (None on failure)."""
         temp_path = None
         try:
             # Use a unique temp file every time (avoids Windows file-lock edge cases)
@@ -682,7 +1244,7 @@ class TTSGenerator:
             # Verify file exists and has content
             if not temp_path or not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
                 print("ERROR: TTS did not create a valid audio file!")
-                return np.zeros(int(self.sample_rate * 2), dtype=np.int16)
+                return None
 
             # Read WAV and convert to int16 mono
             with wave.open(temp_path, 'rb') as wf:
@@ -691,45 +1253,17 @@ class TTSGenerator:
                 frames = wf.readframes(wf.getnframes())
                 if not frames:
                     print("ERROR: TTS generated empty audio!")
-                    return np.zeros(int(self.sample_rate * 2), dtype=np.int16)
-
-                audio_data = np.frombuffer(frames, dtype=np.int16)
-
-                # If multi-channel, downmix by taking one channel (pyttsx3 usually outputs mono)
-                if wf.getnchannels() > 1:
-                    audio_data = audio_data[::wf.getnchannels()]
+                    return None
 
-                # Resample if needed
-                original_rate = wf.getframerate()
-                if original_rate != self.sample_rate and original_rate > 0:
-                    print(f"TTS: Resampling from {original_rate} to {self.sample_rate}")
-                    duration = len(audio_data) / original_rate
-                    new_length = max(1, int(duration * self.sample_rate))
-                    audio_data = np.interp(
-                        np.linspace(0, len(audio_data), new_length, endpoint=False),
-                        np.arange(len(audio_data)),
-                        audio_data
-                    ).astype(np.int16)
-
-                # Boost volume by 50% to ensure it's audible
-                audio_data = np.clip(audio_data.astype(np.float32) * 1.5, -32768, 32767).astype(np.int16)
-                print(f"TTS: Audio data length: {len(audio_data)} samples, peak: {np.abs(audio_data).max()}")
-
-            # Add pre-delay silence for PTT to key up
-            if pre_delay and pre_delay > 0:
-                pre_silence_samples = int(self.sample_rate * float(pre_delay))
-                if pre_silence_samples > 0:
-                    audio_data = np.concatenate([np.zeros(pre_silence_samples, dtype=np.int16), audio_data])
-                    print(f"TTS: Added {pre_delay}s pre-delay, total length: {len(audio_data)} samples ({len(audio_data)/self.sample_rate:.2f}s)")
+                audio_data = self._process_pcm(frames, wf.getnchannels(), wf.getframerate())
 
             print("TTS: Generation complete!")
             return audio_data
 
         except Exception as e:
             print(f"TTS generation failed: {e}")
-            import traceback
             traceback.print_exc()
-            return np.zeros(int(self.sample_rate * 2), dtype=np.int16)
+            return None
         finally:
             if temp_path:
                 try:
@@ -748,7 +1282,11 @@ class RepeaterController:
     def __init__(self, callsign="WRKC123", id_interval=600):
         self.callsign = callsign
         self.id_interval = id_interval  # seconds (10 minutes default)
-        self.last_id_time = time.time()
+        # Clock source for the ID/timeout timers. ParrotBox rebinds this to
+        # its audio-frame sample clock so the checks that run per callback
+        # never make a wall-clock syscall (and can't be skewed by NTP)
+        self.clock = time.time
+        self.last_id_time = self.clock()
         self.last_activity_time = 0
         self.timeout_duration = 180  # 3 minutes max transmission
         self.tail_message = "73"  # End of transmission message
@@ -759,14 +1297,42 @@ class RepeaterController:
         self.courtesy_tone_volume = 0.5  # 0.0 to 1.0 (50% default)
         self.tail_silence_duration = 0.5  # seconds of silence after TX to drop VOX
         self.auto_id_enabled = True  # Enable/disable automatic ID announcements
-        
+        # Rendered tone caches: the generate_* methods run on the audio
+        # callback path, so the sine/envelope work is done once per settings
+        # combination instead of on every VOX drop
+        self._courtesy_cache = None
+        self._courtesy_key = None
+        self._prekey_cache = None
+        self._prekey_key = None
+        self._tail_cache = None
+        self._tail_key = None
+        # Raw-PCM forms of the cached tones: the chunk getters slice bytes
+        # directly, so caching the tobytes() conversion keeps it off the
+        # audio callback along with the rendering itself
+        self._courtesy_bytes = None
+        self._courtesy_bytes_key = None
+        self._prekey_bytes = None
+        self._prekey_bytes_key = None
+        # Shared DSP tables for tone rendering: a 4096-entry sine LUT
+        # (indexed by a phase accumulator - much cheaper than np.sin per
+        # sample) and per-sample-rate 10ms fade ramps for the envelopes
+        self._sine_lut = np.sin(2 * np.pi * np.arange(4096) / 4096).astype(np.float32)
+        self._fade_cache = {}
+        # ID announcement text cache: the text only changes when the wall
+        # clock minute rolls over (time/date/weather all coarser than that)
+        self._id_text_cache = (None, "")
+
     def needs_id(self):
         """Check if station ID is needed"""
-        elapsed = time.time() - self.last_id_time
+        elapsed = self.clock() - self.last_id_time
         return elapsed >= self.id_interval
     
     def generate_id_announcement(self):
-        """Generate station ID announcement text"""
+        """Generate station ID announcement text (cached per wall-clock minute)"""
+        minute = int(time.time() // 60)
+        if minute == self._id_text_cache[0]:
+            return self._id_text_cache[1]
+
         now = datetime.now()
         date_str = now.strftime("%B %d")
         time_str = now.strftime("%I:%M %p")
@@ -781,64 +1347,172 @@ class RepeaterController:
                 weather_text = self.weather_service.get_temperature_only()
                 if weather_text:
                     announcement += f" {weather_text}."
-        
+
+        self._id_text_cache = (minute, announcement)
         return announcement
     
     def mark_id_sent(self):
         """Mark that ID was just sent"""
-        self.last_id_time = time.time()
-    
+        self.last_id_time = self.clock()
+
     def mark_activity(self):
         """Mark recent activity"""
-        self.last_activity_time = time.time()
-    
+        self.last_activity_time = self.clock()
+
     def is_timeout(self):
         """Check if transmission timeout exceeded"""
         if self.last_activity_time == 0:
             return False
-        elapsed = time.time() - self.last_activity_time
+        elapsed = self.clock() - self.last_activity_time
         return elapsed >= self.timeout_duration
     
+    def _fade_ramp(self, sample_rate):
+        """10ms linear fade-in ramp for a sample rate (cached)."""
+        ramp = self._fade_cache.get(sample_rate)
+        if ramp is None:
+            ramp = np.linspace(0, 1, int(0.01 * sample_rate), dtype=np.float32)
+            self._fade_cache[sample_rate] = ramp
+        return ramp
+
+    def _render_tone(self, freq, duration, volume, sample_rate):
+        """Render an enveloped sine beep as int16 (shared by the tone caches)."""
+        n = int(sample_rate * duration)
+        # Sine via LUT gather: a phase accumulator indexes the shared
+        # 4096-entry table instead of evaluating np.sin per sample
+        # float32 throughout: half the memory traffic of the default
+        # float64, and more than enough precision for int16 output
+        phase_inc = np.float32(freq * 4096.0 / sample_rate)
+        phases = (np.arange(n, dtype=np.float32) * phase_inc).astype(np.uint32) & 4095
+        tone = self._sine_lut[phases]
+
+        # Envelope to prevent clicks: fade in/out over the cached ramp
+        ramp = self._fade_ramp(sample_rate)
+        tone[:len(ramp)] *= ramp
+        tone[-len(ramp):] *= ramp[::-1]
+
+        tone *= volume
+        audio = (tone * 32767).astype(np.int16)
+        # These arrays are handed out repeatedly and sliced on the audio
+        # callback thread - freeze them so nothing can scribble on the cache
+        audio.flags.writeable = False
+        return audio
+
     def generate_courtesy_tone(self, sample_rate=44100):
-        """Generate courtesy tone beep"""
-        duration = self.courtesy_tone_duration
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        tone = np.sin(2 * np.pi * self.courtesy_tone_freq * t)
-        
-        # Envelope to prevent clicks
-        envelope = np.ones_like(tone)
-        fade_samples = int(0.01 * sample_rate)
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-        
-        tone = tone * envelope * self.courtesy_tone_volume  # Use configurable volume
-        return (tone * 32767).astype(np.int16)
-    
+        """Courtesy tone beep (cached - regenerated only when settings change)"""
+        key = (sample_rate, self.courtesy_tone_freq,
+               self.courtesy_tone_duration, self.courtesy_tone_volume)
+        if self._courtesy_cache is None or self._courtesy_key != key:
+            self._courtesy_cache = self._render_tone(
+                self.courtesy_tone_freq, self.courtesy_tone_duration,
+                self.courtesy_tone_volume, sample_rate)
+            self._courtesy_key = key
+        return self._courtesy_cache
+
     def generate_prekey_beep(self, sample_rate=44100):
-        """Generate a lead-in tone to wake radio VOX before speech.
+        """Lead-in tone to wake radio VOX before speech (cached).
 
         Many radio VOX circuits need a few hundred milliseconds to fully open.
         A longer lead-in tone greatly reduces clipped first syllables/words.
         """
-        duration = 0.50  # 500ms lead-in (VOX wakeup)
-        t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
-        # Use a higher tone that reliably triggers VOX without being too harsh
-        tone = np.sin(2 * np.pi * 1500 * t)
-        
-        # Envelope to prevent clicks
-        envelope = np.ones_like(tone)
-        fade_samples = int(0.01 * sample_rate)
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
-        
-        tone = tone * envelope * 0.45  # Moderate volume to reliably trigger VOX
-        return (tone * 32767).astype(np.int16)
-    
+        # 500ms lead-in at 1500 Hz: high enough to reliably trigger VOX
+        # without being too harsh, moderate volume
+        key = (sample_rate,)
+        if self._prekey_cache is None or self._prekey_key != key:
+            self._prekey_cache = self._render_tone(1500, 0.50, 0.45, sample_rate)
+            self._prekey_key = key
+        return self._prekey_cache
+
+    def generate_courtesy_tone_bytes(self, sample_rate=44100):
+        """Courtesy tone as raw PCM bytes (cached alongside the ndarray)"""
+        key = (sample_rate, self.courtesy_tone_freq,
+               self.courtesy_tone_duration, self.courtesy_tone_volume)
+        if self._courtesy_bytes is None or self._courtesy_bytes_key != key:
+            self._courtesy_bytes = self.generate_courtesy_tone(sample_rate).tobytes()
+            self._courtesy_bytes_key = key
+        return self._courtesy_bytes
+
+    def generate_prekey_bytes(self, sample_rate=44100):
+        """Pre-key beep as raw PCM bytes (cached alongside the ndarray)"""
+        key = (sample_rate,)
+        if self._prekey_bytes is None or self._prekey_bytes_key != key:
+            self._prekey_bytes = self.generate_prekey_beep(sample_rate).tobytes()
+            self._prekey_bytes_key = key
+        return self._prekey_bytes
+
     def generate_tail_silence(self, sample_rate=44100):
-        """Generate tail silence to drop VOX"""
-        duration = self.tail_silence_duration
-        samples = int(sample_rate * duration)
-        return np.zeros(samples, dtype=np.int16)
+        """Tail silence to drop VOX (cached)"""
+        key = (sample_rate, self.tail_silence_duration)
+        if self._tail_cache is None or self._tail_key != key:
+            audio = np.zeros(int(sample_rate * self.tail_silence_duration), dtype=np.int16)
+            audio.flags.writeable = False
+            self._tail_cache = audio
+            self._tail_key = key
+        return self._tail_cache
+
+class SPSCQueue:
+    """Lock-free single-producer/single-consumer queue.
+
+    The ready-announcement queue is polled from the real-time audio
+    callback on every cycle; queue.Queue takes an RLock (and may touch a
+    Condition) on each empty()/get_nowait() call, contending with the TTS
+    thread. With exactly one producer and one consumer, plain index
+    updates are atomic under the GIL, so no locking is needed. Mirrors
+    the queue.Queue API the call sites already use.
+    """
+    def __init__(self, capacity=16):
+        self._slots = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # next slot to read (consumer thread only)
+        self._tail = 0  # next slot to write (producer thread only)
+
+    def put(self, item):
+        """Producer side. Drops the item if the queue is full.
+
+        Silent on overflow: the audio callback produces into the DTMF
+        ring, so no print (stdout lock) may hide here. Callers that care
+        can check the return value and log off the real-time path.
+        """
+        if self._tail - self._head >= self._capacity:
+            return False
+        # Write the slot before publishing the new tail so the consumer
+        # never observes a slot it can't safely read
+        self._slots[self._tail % self._capacity] = item
+        self._tail += 1
+        return True
+
+    def get_nowait(self):
+        """Consumer side. Raises queue.Empty when nothing is queued."""
+        if self._head == self._tail:
+            raise queue.Empty
+        idx = self._head % self._capacity
+        item = self._slots[idx]
+        self._slots[idx] = None  # drop the reference so audio gets freed
+        self._head += 1
+        return item
+
+    def clear(self):
+        """Consumer side. Drop everything currently queued.
+
+        Bounded by the tail observed on entry, so it terminates even if
+        the producer publishes concurrently (those items survive).
+        """
+        tail = self._tail
+        while self._head < tail:
+            self._slots[self._head % self._capacity] = None
+            self._head += 1
+
+    def empty(self):
+        return self._head == self._tail
+
+    def qsize(self):
+        return self._tail - self._head
+
+
+# Sentinel queued in place of announcement text to request a test beep.
+# It rides the normal TTS pipeline so the TTS thread stays the ready
+# queue's single producer.
+_TEST_BEEP = object()
+
 
 class ParrotBox:
     def __init__(self):
@@ -859,11 +1533,38 @@ class ParrotBox:
         # Recording mode
         self.recording_mode = RecordingMode.REPEATER
         self.max_record_time = 30.0
-        
-        # Buffer management
+        # One CHUNK of silence, encoded once - the idle/muted paths return
+        # this constant instead of allocating np.zeros().tobytes() per call
+        self._silence = np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+        # Shared output staging buffer: chunk producers write into the int16
+        # view (shares memory with the bytearray) instead of slicing, padding
+        # and .tobytes()-ing fresh temporaries. PyAudio requires a real bytes
+        # return, so one final copy per callback remains - but only one.
+        self._out_bytes = bytearray(self.CHUNK * 2)
+        self._out_view = np.frombuffer(self._out_bytes, dtype=np.int16)
+        # Mode dispatch: set_recording_mode rebinds _process_fn so the
+        # callback calls the current handler directly - no dict lookup or
+        # enum compare per chunk
+        self._mode_handlers = {
+            RecordingMode.REPEATER: self.process_repeater_mode,
+            RecordingMode.CONTINUOUS_DELAY: self._process_delay_mode,
+            RecordingMode.TIMED_REPLAY: self._process_timed_replay_mode,
+            RecordingMode.MANUAL: self._process_manual_mode,
+        }
+        self._process_fn = self._mode_handlers[self.recording_mode]
+        
+        # Buffer management: preallocated delay-line ring, one CHUNK-sized
+        # int16 row per callback. A deque of bytes would free the oldest
+        # bytes object and allocate a new one on every push - this writes
+        # in place with zero allocations. Row at _delay_write is the oldest
+        # (next to be overwritten), i.e. the DELAY_SECONDS-old audio, and
+        # the pre-key lookahead is just an O(1) modular row index into the
+        # same ring. Rows are contiguous, so each handler read is a view;
+        # .tobytes() happens only at the PyAudio boundary.
         self.buffer_size = int(self.RATE / self.CHUNK * self.DELAY_SECONDS)
-        self.audio_buffer = deque(maxlen=self.buffer_size)
-        
+        self.audio_buffer = np.zeros((self.buffer_size, self.CHUNK), dtype=np.int16)
+        self._delay_write = 0
+
         # Recording storage
         self.recorded_audio = []
         self.is_recording = False
@@ -871,11 +1572,8 @@ class ParrotBox:
         self.record_start_time = 0
         self.playback_index = 0
         self.playback_audio = []  # separate playback buffer (keeps recordings clean)
-        
-        # Fill buffer with silence
-        silence = np.zeros(self.CHUNK, dtype=np.int16)
-        for _ in range(self.buffer_size):
-            self.audio_buffer.append(silence.tobytes())
+        self._playback_beep = None  # pre-key beep pending before playback
+        self._restart_at = 0.0  # timed-replay re-record deadline (audio clock)
         
         # PTT Control
         self.ptt_controller = PTTController()
@@ -889,12 +1587,50 @@ class ParrotBox:
         self.repeater = RepeaterController()
         self.tts = TTSGenerator(self.RATE)
         self.announcement_queue = queue.Queue()
-        self.announcement_ready_queue = queue.Queue()  # Pre-generated announcements
+        # Pre-generated announcements: TTS thread produces, audio callback
+        # consumes - lock-free so the callback never contends on an RLock
+        self.announcement_ready_queue = SPSCQueue(16)
+        # Small pool for network side-work (weather warm-ups) so HTTP
+        # round-trips overlap TTS generation instead of preceding it
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        # Reusable input-gain scratch buffer (sized on first use) so applying
+        # gain never allocates inside the audio callback; the output side
+        # writes into the shared _out_view staging buffer
+        self._gain_scratch_in = None
+
+        # Scratch for the delay-line level checks: np.abs writes into this
+        # instead of allocating a temp array twice per callback
+        self._abs_scratch = np.empty(self.CHUNK, dtype=np.int32)
+        # Integer magnitude threshold for the 0.5% delay-line gate, and
+        # the sum-to-percent scale used only by the transition prints
+        self._delay_gate_thr = int(0.005 * 32768)
+        self._sum_to_pct = (100.0 / 32768.0) / self.CHUNK
+
+        # Callback-path console output is queued here and printed by a
+        # daemon thread so the audio callback never blocks on stdout
+        self._log_q = queue.SimpleQueue()
+        threading.Thread(target=self._log_worker, daemon=True,
+                         name="parrot-log").start()
+
+        # Warm up the audio-path JITs here so the first callback doesn't
+        # pay the compile latency
+        if njit is not None:
+            _peak_mean(np.zeros(1, dtype=np.int16))
+            _apply_gain_i16(np.zeros(1, dtype=np.int16), 1.0,
+                            np.zeros(1, dtype=np.int16))
+            _sum_abs_i16(np.zeros(1, dtype=np.int16))
+            _any_above_i16(np.zeros(1, dtype=np.int16), 163)
         self.is_announcing = False
-        self.announcement_audio = None
-        self.announcement_index = 0
+        # Announcement playback state: a list of segments (prekey beep,
+        # speech, ...) played back to back - avoids concatenating them
+        # into one big buffer on the audio thread
+        self.announcement_segments = None
+        self.announcement_seg_idx = 0
+        self.announcement_index = 0  # byte index within the current segment
         self.pending_courtesy_tone = False
         self.courtesy_tone_audio = None
+        self.courtesy_tone_bytes = None
         self.courtesy_tone_index = 0
         self.pending_tail_silence = False
         self.tail_silence_audio = None
@@ -902,32 +1638,41 @@ class ParrotBox:
         self.ptt_pre_delay = 1.0  # 1 second PTT delay
         self.last_vox_state = False  # Track VOX state changes
         
-        # Feedback protection
-        self.feedback_protection_enabled = True
-        self.feedback_holdoff_time = 1.5  # seconds to ignore input after output
-        self.last_output_time = 0
-        self.is_in_holdoff = False
-        
         # VOX grace period - keep VOX off briefly after announcements to allow next to start
         self.vox_grace_period = 0.3  # 300ms grace period after announcements
-        self.last_announcement_time = 0
+        self._grace_until = 0
         
         # Start TTS generation thread
         self.tts_thread = None
         self.tts_running = False
-        
+        # Renders run on a small pool so back-to-back DTMF requests don't
+        # stack their synthesis latency; results still play in order
+        self._tts_pool = ThreadPoolExecutor(max_workers=3)
+        
+        # Virtual clock driven by the audio stream: frame count accumulated
+        # once per callback. Callback-path timers (grace, holdoff, repeater
+        # ID/timeout) read this instead of making a time.time() syscall
+        self._sample_clock = 0
+
         # Audio levels
         self.input_level = 0
         self.output_level = 0
+        # Set by the GUI while its level meters are polling - lets the
+        # audio callback skip metering work when nothing displays it
+        self._levels_needed = False
         
-        # Audio gain controls (live volume adjustment)
+        # Audio gain controls (live volume adjustment).  The LUTs map every
+        # int16 bit pattern to its gain-scaled, saturated result and are
+        # rebuilt off the audio thread whenever a gain slider moves
         self.input_gain = 1.0  # 0.0 to 2.0
         self.output_gain = 1.0  # 0.0 to 2.0
+        self._in_gain_lut = None
+        self._out_gain_lut = None
         
         # Feedback protection
         self.feedback_protection_enabled = True
         self.feedback_holdoff_time = 1.0  # seconds to mute input after output
-        self.last_output_time = 0
+        self._holdoff_until = 0
         self.is_in_holdoff = False
         
         # Continuous delay mode
@@ -936,13 +1681,20 @@ class ParrotBox:
         self.delay_prekey_audio = None
         self.delay_prekey_index = 0
         self.ptt_prekey_time = 0.5  # Seconds to activate PTT before audio (adjustable)
+        # Lookahead distance in ring rows, cached against the pre-key time
+        # it was derived from (the GUI writes ptt_prekey_time directly)
+        self._prekey_chunks = int((self.ptt_prekey_time * self.RATE) / self.CHUNK)
+        self._prekey_chunks_for = self.ptt_prekey_time
         
         # Weather service
         self.weather = WeatherService()
         self.include_weather_in_id = False
         
-        # DTMF detection and commands
+        # DTMF detection and commands. Chunks are handed to a worker thread
+        # through a lock-free ring (callback produces, worker consumes)
         self.dtmf = DTMFDetector(self.RATE)
+        self._dtmf_ring = SPSCQueue(64)
+        self._dtmf_thread = None
         self.dtmf_commands = {
             "0001": "weather",
             "0002": "time",
@@ -972,7 +1724,9 @@ class ParrotBox:
         
         # Debug mode
         self.debug_mode = False  # Toggle verbose console output
-        
+        self._audio_debug_counter = 0  # Periodic input-debug divider
+        self._last_audio_debug = 0
+
         # Callbacks
         self.on_recording_complete = None
         self.on_vox_state_change = None
@@ -989,11 +1743,16 @@ class ParrotBox:
         """Reset transient runtime flags so announcements/ID can be sent repeatedly."""
         # Announcement/Tone state
         self.is_announcing = False
-        self.announcement_audio = None
-        self.announcement_index = 0
+        # Announcement playback state: a list of segments (prekey beep,
+        # speech, ...) played back to back - avoids concatenating them
+        # into one big buffer on the audio thread
+        self.announcement_segments = None
+        self.announcement_seg_idx = 0
+        self.announcement_index = 0  # byte index within the current segment
 
         self.pending_courtesy_tone = False
         self.courtesy_tone_audio = None
+        self.courtesy_tone_bytes = None
         self.courtesy_tone_index = 0
 
         self.pending_tail_silence = False
@@ -1003,9 +1762,9 @@ class ParrotBox:
         # Feedback/VOX state
         self.last_vox_state = False
         self.vox.reset()
-        self.last_output_time = 0
+        self._holdoff_until = 0
         self.is_in_holdoff = False
-        self.last_announcement_time = 0
+        self._grace_until = 0
 
         # Mode recording state
         self.is_recording = False
@@ -1014,10 +1773,15 @@ class ParrotBox:
         self.playback_index = 0
         self.record_start_time = 0
         self.playback_audio = []
+        self._playback_beep = None
+        self._restart_at = 0.0
 
         if clear_queues:
             self._drain_queue(self.announcement_queue)
-            self._drain_queue(self.announcement_ready_queue)
+            # The SPSC ready queue has exactly one consumer (the audio
+            # callback); clear() advances the head in one pass instead of
+            # making this thread a second get_nowait consumer
+            self.announcement_ready_queue.clear()
 
 
     
@@ -1103,6 +1867,14 @@ class ParrotBox:
             print("Audio stream opened successfully")
             
             self.is_running = True
+
+            # Rebase the virtual clock and point the repeater timers at it -
+            # they tick with the audio stream from here on
+            self._sample_clock = 0
+            self.repeater.clock = self.now
+            self.repeater.last_id_time = 0
+            self.repeater.last_activity_time = 0
+
             self.stream.start_stream()
             self.vox.reset()
             
@@ -1110,6 +1882,15 @@ class ParrotBox:
             self.tts_running = True
             self.tts_thread = threading.Thread(target=self.tts_generation_loop, daemon=True)
             self.tts_thread.start()
+
+            # Keep weather cached in the background so DTMF/ID announcements
+            # never wait on HTTP
+            self.weather.start_background_refresh()
+
+            # DTMF worker: consumes chunks from the ring and runs detection
+            # off the real-time audio thread
+            self._dtmf_thread = threading.Thread(target=self._dtmf_loop, daemon=True)
+            self._dtmf_thread.start()
             
             # Start ID timer thread for repeater mode
             if self.recording_mode == RecordingMode.REPEATER:
@@ -1120,7 +1901,6 @@ class ParrotBox:
             
         except Exception as e:
             print(f"Error starting audio stream: {e}")
-            import traceback
             traceback.print_exc()
             raise
     
@@ -1133,9 +1913,6 @@ class ParrotBox:
         self.is_running = False
         self.tts_running = False
 
-        # Reset transient state so manual ID / messages work after stopping
-        self.reset_runtime_state(clear_queues=True)
-        
         if self.stream:
             try:
                 # Give the stream a moment to finish current callback
@@ -1151,33 +1928,78 @@ class ParrotBox:
                     pass
             finally:
                 self.stream = None
-        
+
+        # Reset transient state so manual ID / messages work after
+        # stopping. Done after the stream is down: the audio callback is
+        # the ready queue's consumer, so the queues are only cleared once
+        # it can no longer race this thread
+        self.reset_runtime_state(clear_queues=True)
+
         self.ptt_controller.ptt_off()
         print("Parrot Box stopped")
     
     def tts_generation_loop(self):
-        """Background thread for generating TTS announcements"""
+        """Background driver for generating TTS announcements.
+
+        Queued texts are submitted to a small executor so several renders
+        can overlap (back-to-back DTMF commands no longer stack their
+        synthesis latency), but finished audio is flushed to the ready
+        queue strictly in submission order.
+        """
+        pending = deque()
         while self.tts_running:
             try:
-                # Wait for announcement request (with timeout so we can check tts_running)
+                # Wait for announcement request (with timeout so we can check
+                # tts_running and flush completed renders)
                 try:
-                    text = self.announcement_queue.get(timeout=0.5)
+                    text = self.announcement_queue.get(timeout=0.1)
+                    if text is _TEST_BEEP:
+                        pending.append(self._tts_pool.submit(
+                            self.repeater.generate_courtesy_tone, self.RATE))
+                    else:
+                        print(f"🎤 Generating TTS in background: {text[:60]}...")
+                        pending.append(self._tts_pool.submit(
+                            self.tts.generate_announcement, text, self.ptt_pre_delay))
                 except queue.Empty:
-                    continue
-                
-                print(f"🎤 Generating TTS in background: {text[:60]}...")
-                # Generate the audio (this takes time, but it's in a background thread)
-                audio_data = self.tts.generate_announcement(text, self.ptt_pre_delay)
-                
-                # Put the pre-generated audio in the ready queue
-                self.announcement_ready_queue.put(audio_data)
-                queue_size = self.announcement_ready_queue.qsize()
-                print(f"✅ TTS generation complete! Ready to play (queue size: {queue_size})")
-                print(f"   ⏳ Waiting for VOX to drop and system to be free...")
-                
+                    pass
+
+                # Deliver completed renders in submission order
+                while pending and pending[0].done():
+                    # Handed over as raw PCM bytes: the callback-side
+                    # getter slices bytes, and the conversion copy
+                    # belongs here on the worker thread
+                    audio_data = pending.popleft().result().tobytes()
+                    self.announcement_ready_queue.put(audio_data)
+                    queue_size = self.announcement_ready_queue.qsize()
+                    print(f"✅ TTS generation complete! Ready to play (queue size: {queue_size})")
+                    print(f"   ⏳ Waiting for VOX to drop and system to be free...")
+
             except Exception as e:
                 print(f"TTS generation thread error: {e}")
     
+    def _dtmf_loop(self):
+        """Background worker: runs DTMF detection off the audio thread.
+
+        Polls the SPSC ring every 5ms when idle - far inside the ~100ms
+        DTMF response tolerance, and the callback never takes a lock.
+        """
+        while self.is_running:
+            try:
+                chunk = self._dtmf_ring.get_nowait()
+            except queue.Empty:
+                time.sleep(0.005)
+                continue
+
+            try:
+                digit = self.dtmf.detect_tone(chunk)
+                if digit:
+                    self.dtmf.add_digit(digit)
+                    command = self.dtmf.get_command()
+                    if command:
+                        self.handle_dtmf_command(command)
+            except Exception as e:
+                print(f"DTMF worker error: {e}")
+
     def id_timer_loop(self):
         """Background thread for repeater ID timing"""
         while self.is_running:
@@ -1185,6 +2007,11 @@ class ParrotBox:
             
             if self.recording_mode == RecordingMode.REPEATER:
                 if self.repeater.auto_id_enabled and self.repeater.needs_id() and not self.vox.is_active:
+                    # Warm the weather cache concurrently: the ID text uses
+                    # whatever reading is cached, while the HTTP refresh
+                    # overlaps the TTS generation for the next announcement
+                    if self.weather.enabled:
+                        self._io_pool.submit(self.weather.fetch_weather)
                     # Queue ID announcement
                     self.queue_announcement(self.repeater.generate_id_announcement())
                     self.repeater.mark_id_sent()
@@ -1192,25 +2019,61 @@ class ParrotBox:
     def queue_announcement(self, text):
         """Queue a TTS announcement"""
         self.announcement_queue.put(text)
+
+    def queue_test_beep(self):
+        """Queue a courtesy-tone beep through the announcement pipeline"""
+        self.announcement_queue.put(_TEST_BEEP)
     
+    def now(self):
+        """Audio-stream virtual time in seconds.
+
+        Derived from the accumulated frame count, so per-callback timing
+        checks cost one division instead of a clock syscall each - and the
+        result can't jump when NTP steps the wall clock.
+        """
+        return self._sample_clock / self.RATE
+
+    def _log(self, msg):
+        """Queue a console message from the audio callback.
+
+        print() takes the stdout lock and can block on a slow console;
+        the callback hands the string off here and a daemon thread does
+        the actual printing off the real-time path.
+        """
+        self._log_q.put_nowait(msg)
+
+    def _log_worker(self):
+        """Drain queued callback messages and print them."""
+        while True:
+            print(self._log_q.get())
+
     def audio_callback(self, in_data, frame_count, time_info, status):
         """Process audio input and output based on mode"""
         try:
             if status:
                 print(f"Audio status: {status}")
+
+            # Advance the virtual clock once per callback
+            self._sample_clock += frame_count
             
-            # Calculate input level
-            input_array = np.frombuffer(in_data, dtype=np.int16)
-            raw_peak = np.abs(input_array).max()
-            raw_mean = np.abs(input_array).mean()
-            self.input_level = raw_mean / 32768.0 * 100
+            # VOX and the GUI meter are the only consumers of the input
+            # level - when neither needs it (and debug is off), skip the
+            # metering pass entirely
+            should_use_vox = self.recording_mode == RecordingMode.REPEATER or self.vox_enabled
+            input_array = None
+            if self._levels_needed or self.debug_mode or should_use_vox:
+                # Calculate input level (fused peak+mean - one pass, no temporaries)
+                input_array = np.frombuffer(in_data, dtype=np.int16)
+                if njit is not None:
+                    raw_peak, raw_mean = _peak_mean(input_array)
+                else:
+                    abs_in = np.abs(input_array)
+                    raw_peak = abs_in.max()
+                    raw_mean = abs_in.mean()
+                self.input_level = raw_mean / 32768.0 * 100
             
             # Debug audio input periodically (every 2 seconds when there's audio)
             if self.debug_mode:
-                if not hasattr(self, '_last_audio_debug'):
-                    self._last_audio_debug = 0
-                    self._audio_debug_counter = 0
-                
                 self._audio_debug_counter += 1
                 if self._audio_debug_counter % 86 == 0:  # About every 2 seconds at 44100/1024
                     if raw_peak > 0:
@@ -1222,35 +2085,46 @@ class ParrotBox:
                     else:
                         print(f"⚠️ NO AUDIO INPUT - Raw peak: 0, mean: 0")
             
-            # Apply input gain
+            # Apply input gain (fused multiply-saturate into a scratch buffer;
+            # at unity gain in_data passes straight through untouched)
             if self.input_gain != 1.0:
-                input_array = np.clip(input_array * self.input_gain, -32768, 32767).astype(np.int16)
+                if input_array is None:
+                    input_array = np.frombuffer(in_data, dtype=np.int16)
+                if njit is not None:
+                    if self._gain_scratch_in is None or len(self._gain_scratch_in) != len(input_array):
+                        self._gain_scratch_in = np.empty(len(input_array), dtype=np.int16)
+                    _apply_gain_i16(input_array, self.input_gain, self._gain_scratch_in)
+                    input_array = self._gain_scratch_in
+                else:
+                    # One gather per sample: the LUT has scaling and
+                    # saturation baked in, and the uint16 view is free
+                    input_array = self._in_gain_lut[input_array.view(np.uint16)]
                 in_data = input_array.tobytes()
             
-            # DTMF Detection (only in repeater mode when VOX is active)
+            # DTMF Detection (only in repeater mode when VOX is active).
+            # Just enqueue the chunk - the Goertzel runs on the DTMF worker
+            # thread so its variable cost never lands on the audio callback
             if self.recording_mode == RecordingMode.REPEATER and self.dtmf.enabled:
-                digit = self.dtmf.detect_tone(in_data)
-                if digit:
-                    self.dtmf.add_digit(digit)
-                    command = self.dtmf.get_command()
-                    if command:
-                        self.handle_dtmf_command(command)
+                if not self._dtmf_ring.put(in_data):
+                    # Worker stalled; note the drop via the log thread
+                    self._log("⚠️ DTMF ring full - dropping chunk")
             
             # VOX processing
             # Note: Repeater mode ALWAYS uses VOX to detect incoming audio
             # Other modes only use VOX if enabled by user
-            should_use_vox = self.recording_mode == RecordingMode.REPEATER or self.vox_enabled
-            
             if should_use_vox:
-                # Check VOX grace period - keep VOX off briefly after announcements
+                # Check VOX grace period - keep VOX off briefly after announcements.
+                # The grace window is stored as an absolute deadline so the
+                # steady-state check is a single comparison
                 in_grace_period = False
-                if self.last_announcement_time > 0:
-                    grace_elapsed = time.time() - self.last_announcement_time
-                    if grace_elapsed < self.vox_grace_period:
+                if self._grace_until > 0:
+                    now = self.now()
+                    if now < self._grace_until:
                         in_grace_period = True
-                    elif grace_elapsed < self.vox_grace_period + 0.05:  # Just expired
-                        print("✅ Grace period complete - VOX can trigger normally")
-                        self.last_announcement_time = 0  # Reset
+                    else:
+                        if now < self._grace_until + 0.05:  # Just expired
+                            self._log("✅ Grace period complete - VOX can trigger normally")
+                        self._grace_until = 0  # Reset
                 
                 # Determine if system is busy (don't process VOX when busy or in grace period)
                 not_busy = (not self.is_announcing and 
@@ -1268,30 +2142,31 @@ class ParrotBox:
                     was_active = self.vox.is_active
                     self.vox.is_active = False
                     if was_active and in_grace_period:
-                        print("🔇 Forcing VOX inactive (grace period - preventing re-trigger)")
+                        self._log("🔇 Forcing VOX inactive (grace period - preventing re-trigger)")
                     elif was_active:
-                        print("🔇 Forcing VOX inactive (system busy)")
+                        self._log("🔇 Forcing VOX inactive (system busy)")
                 
                 # Detect VOX state changes for repeater mode
                 if self.recording_mode == RecordingMode.REPEATER:
                     # Debug: Show VOX transitions
                     if not_busy and self.last_vox_state != vox_state:
                         if vox_state:
-                            print(f"🎤 VOX ACTIVE (level: {self.input_level:.1f}%)")
+                            self._log(f"🎤 VOX ACTIVE (level: {self.input_level:.1f}%)")
                         else:
-                            print(f"🔇 VOX INACTIVE (level: {self.input_level:.1f}%)")
+                            self._log(f"🔇 VOX INACTIVE (level: {self.input_level:.1f}%)")
                     
                     # VOX just dropped - add courtesy tone then tail silence (only when not busy)
                     if (self.last_vox_state and not vox_state and 
                         not self.pending_tail_silence and not_busy):
-                        print("🎙️ VOX dropped after transmission")
+                        self._log("🎙️ VOX dropped after transmission")
                         
                         # Add courtesy tone if enabled
                         if self.repeater.enable_courtesy_tone:
                             self.pending_courtesy_tone = True
                             self.courtesy_tone_audio = self.repeater.generate_courtesy_tone(self.RATE)
+                            self.courtesy_tone_bytes = self.repeater.generate_courtesy_tone_bytes(self.RATE)
                             self.courtesy_tone_index = 0
-                            print(f"🔔 Queuing courtesy tone: {len(self.courtesy_tone_audio)} samples, volume: {self.repeater.courtesy_tone_volume*100:.0f}%")
+                            self._log(f"🔔 Queuing courtesy tone: {len(self.courtesy_tone_audio)} samples, volume: {self.repeater.courtesy_tone_volume*100:.0f}%")
                         else:
                             # No courtesy tone, go straight to tail silence
                             self.pending_tail_silence = True
@@ -1317,16 +2192,30 @@ class ParrotBox:
                         self.start_recording()
             
             # Handle different recording modes
-            output_data = self.process_audio_mode(in_data)
-            
-            # Calculate output level
-            output_array = np.frombuffer(output_data, dtype=np.int16)
-            self.output_level = np.abs(output_array).mean() / 32768.0 * 100
-            
-            # Apply output gain
+            output_data = self.process_audio_mode(in_data, input_array)
+            
+            # Calculate output level (same fused kernel as the input meter;
+            # only the GUI reads it, so skip the pass when no meter is shown)
+            output_array = None
+            if self._levels_needed:
+                output_array = np.frombuffer(output_data, dtype=np.int16)
+                if njit is not None:
+                    _, out_mean = _peak_mean(output_array)
+                else:
+                    out_mean = np.abs(output_array).mean()
+                self.output_level = out_mean / 32768.0 * 100
+
+            # Apply output gain (same fused kernel as the input side, writing
+            # straight into the shared staging buffer)
             if self.output_gain != 1.0:
-                output_array = np.clip(output_array * self.output_gain, -32768, 32767).astype(np.int16)
-                output_data = output_array.tobytes()
+                if output_array is None:
+                    output_array = np.frombuffer(output_data, dtype=np.int16)
+                if njit is not None and len(output_array) == self.CHUNK:
+                    _apply_gain_i16(output_array, self.output_gain, self._out_view)
+                    output_data = bytes(self._out_bytes)
+                else:
+                    output_array = self._out_gain_lut[output_array.view(np.uint16)]
+                    output_data = output_array.tobytes()
             
             # PTT Control
             self.handle_ptt()
@@ -1339,28 +2228,38 @@ class ParrotBox:
             silence = np.zeros(frame_count, dtype=np.int16).tobytes()
             return (silence, pyaudio.paContinue)
     
-    def process_audio_mode(self, in_data):
+    def process_audio_mode(self, in_data, in_arr=None):
         """Process audio based on current mode"""
-        
+
+        # Fast path: no playback chain active and nothing queued - go
+        # straight to the mode handler (the steady-state idle case that
+        # runs every 23ms)
+        if (not self.is_announcing and not self.pending_courtesy_tone
+                and not self.pending_tail_silence
+                and self.announcement_ready_queue.empty()):
+            return self._process_fn(in_data, in_arr)
+
         # Check for ready announcements (priority over everything except active transmission)
         # Allow announcements during holdoff, but not during active VOX or existing announcement
         can_start = not self.is_announcing and not self.pending_courtesy_tone and not self.vox.is_active
-        queue_has_item = not self.announcement_ready_queue.empty()
-        
+
         if can_start:
             try:
-                # Non-blocking check for ready announcement
+                # Single non-blocking poll - no empty() preflight, the
+                # get_nowait() itself tells us whether anything is ready
                 audio_data = self.announcement_ready_queue.get_nowait()
-                print("\n" + "🔊"*30)
-                print("▶️  PLAYING DTMF RESPONSE NOW!")
-                print("🔊"*30 + "\n")
-                
-                # Add pre-key beep to trigger radio VOX before actual audio
-                prekey_beep = self.repeater.generate_prekey_beep(self.RATE)
-                audio_data = np.concatenate([prekey_beep, audio_data])
-                print(f"   Added {len(prekey_beep)/self.RATE:.3f}s pre-key beep to wake radio VOX")
+                self._log("\n" + "🔊"*30)
+                self._log("▶️  PLAYING DTMF RESPONSE NOW!")
+                self._log("🔊"*30 + "\n")
                 
-                self.announcement_audio = audio_data
+                # Add pre-key beep to trigger radio VOX before actual audio.
+                # Queued as separate raw-PCM bytes segments - no
+                # np.concatenate of a multi-second buffer inside the callback
+                prekey_beep = self.repeater.generate_prekey_bytes(self.RATE)
+                self._log(f"   Added {len(prekey_beep)/2/self.RATE:.3f}s pre-key beep to wake radio VOX")
+
+                self.announcement_segments = [prekey_beep, audio_data]
+                self.announcement_seg_idx = 0
                 self.announcement_index = 0
                 self.is_announcing = True
                 # Clear any pending tail silence when starting announcement
@@ -1373,17 +2272,7 @@ class ParrotBox:
                 self.vox.is_active = False
             except queue.Empty:
                 pass
-        elif queue_has_item:
-            # Debug: Why can't we start announcement?
-            reasons = []
-            if self.is_announcing:
-                reasons.append("is_announcing")
-            if self.pending_courtesy_tone:
-                reasons.append("pending_courtesy_tone")
-            if self.vox.is_active:
-                reasons.append("vox.is_active")
-            print(f"⏸️  Announcement ready but blocked by: {', '.join(reasons)}")
-        
+
         # Play announcement if active
         if self.is_announcing:
             output = self.get_announcement_chunk()
@@ -1391,7 +2280,7 @@ class ParrotBox:
                 return output
             else:
                 self.is_announcing = False
-                print("Announcement playback complete")
+                self._log("Announcement playback complete")
                 # Force VOX inactive to ensure next announcement can start
                 self.vox.is_active = False
                 self.last_vox_state = False
@@ -1399,8 +2288,9 @@ class ParrotBox:
                 if self.recording_mode == RecordingMode.REPEATER and self.repeater.enable_courtesy_tone:
                     self.pending_courtesy_tone = True
                     self.courtesy_tone_audio = self.repeater.generate_courtesy_tone(self.RATE)
+                    self.courtesy_tone_bytes = self.repeater.generate_courtesy_tone_bytes(self.RATE)
                     self.courtesy_tone_index = 0
-                    print(f"🔔 Queuing courtesy tone: {len(self.courtesy_tone_audio)} samples, volume: {self.repeater.courtesy_tone_volume*100:.0f}%")
+                    self._log(f"🔔 Queuing courtesy tone: {len(self.courtesy_tone_audio)} samples, volume: {self.repeater.courtesy_tone_volume*100:.0f}%")
                 else:
                     # No courtesy tone, go straight to tail silence
                     self.pending_tail_silence = True
@@ -1414,7 +2304,7 @@ class ParrotBox:
                 return output
             else:
                 self.pending_courtesy_tone = False
-                print("Courtesy tone complete")
+                self._log("Courtesy tone complete")
                 # Force VOX inactive to ensure next announcement can start
                 self.vox.is_active = False
                 self.last_vox_state = False
@@ -1432,100 +2322,135 @@ class ParrotBox:
                 self.pending_tail_silence = False
                 # Reset VOX state to prevent false drop detection
                 self.last_vox_state = False
-                print("Tail silence complete - VOX should drop now")
+                self._log("Tail silence complete - VOX should drop now")
         
         # Normal mode processing
-        if self.recording_mode == RecordingMode.REPEATER:
-            # Repeater mode: pass-through with minimal delay
-            return self.process_repeater_mode(in_data)
-        
-        elif self.recording_mode == RecordingMode.CONTINUOUS_DELAY:
-            self.audio_buffer.append(in_data)
-            if self.is_recording:
-                self.recorded_audio.append(in_data)
-            
-            # Get delayed audio from buffer
-            delayed_audio = self.audio_buffer[0]
-            
-            # PTT PRE-KEY: Look ahead in buffer to activate PTT BEFORE audio arrives
-            # Calculate how many chunks ahead to look (pre-key time)
-            prekey_chunks = int((self.ptt_prekey_time * self.RATE) / self.CHUNK)
-            
-            # Check audio level at look-ahead position (newer audio not yet output)
-            lookahead_has_audio = False
-            if len(self.audio_buffer) > prekey_chunks:
-                # Look at audio that will be output in 'ptt_prekey_time' seconds
-                lookahead_index = min(prekey_chunks, len(self.audio_buffer) - 1)
-                lookahead_audio = self.audio_buffer[lookahead_index]
-                lookahead_array = np.frombuffer(lookahead_audio, dtype=np.int16)
-                lookahead_level = np.abs(lookahead_array).mean() / 32768.0 * 100
-                lookahead_has_audio = lookahead_level > 0.5
-            
-            # Also check current output audio
-            audio_array = np.frombuffer(delayed_audio, dtype=np.int16)
-            audio_level = np.abs(audio_array).mean() / 32768.0 * 100
-            current_has_audio = audio_level > 0.5
-            
-            # PTT should be active if EITHER:
-            # 1. Audio is coming soon (look-ahead detected), OR
-            # 2. Audio is currently playing (already transmitting)
-            was_active = self.delay_has_audio
-            self.delay_has_audio = lookahead_has_audio or current_has_audio
-            
-            # Debug PTT state changes with look-ahead info
-            if self.delay_has_audio and not was_active:
-                if lookahead_has_audio:
-                    print(f"🔴 PTT PRE-KEY ACTIVE (Delay Line) - Audio coming in {self.ptt_prekey_time:.1f}s")
-                    print(f"   Look-ahead level: {lookahead_level:.1f}%, Current level: {audio_level:.1f}%")
-                else:
-                    print(f"🔴 PTT ACTIVE (Delay Line) - Audio level: {audio_level:.1f}%")
-            elif not self.delay_has_audio and was_active:
-                print(f"⚪ PTT INACTIVE (Delay Line) - Audio level: {audio_level:.1f}%")
-            
-            return delayed_audio
-        
-        elif self.recording_mode == RecordingMode.TIMED_REPLAY:
-            # Timed Auto-Replay:
-            # Continuously loop: record for max_record_time, then play back, then record again.
-            # This mode should work even if software VOX is disabled.
-            if not self.is_recording and not self.is_playing_back:
-                self.start_recording()
-
-            if self.is_recording:
-                self.recorded_audio.append(in_data)
-                elapsed = time.time() - self.record_start_time
-                if elapsed >= self.max_record_time:
-                    self.stop_recording()
-                    self.start_playback()
-                return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
-            
-            elif self.is_playing_back:
-                if self.playback_index < len(self.playback_audio):
-                    output = self.playback_audio[self.playback_index]
-                    self.playback_index += 1
-                    return output
-                else:
-                    self.stop_playback()
-                    return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+        return self._process_fn(in_data, in_arr)
+
+    def _level_pct(self, arr):
+        """Mean-abs level of a chunk as a percent (cold transition prints).
+
+        Uses the fused kernel under Numba; plain NumPy reduces the abs
+        scratch buffer with an int64 accumulator instead of running the
+        kernel as a 1024-iteration Python loop on the audio thread.
+        """
+        if njit is not None:
+            return _sum_abs_i16(arr) * self._sum_to_pct
+        np.abs(arr, out=self._abs_scratch)
+        return int(self._abs_scratch.sum(dtype=np.int64)) * self._sum_to_pct
+
+    def _process_delay_mode(self, in_data, in_arr=None):
+        """Continuous delay line: output audio DELAY_SECONDS behind input."""
+        # Overwrite the oldest ring row in place (no per-push allocation),
+        # reusing the callback's int16 view when it already made one
+        if in_arr is None:
+            in_arr = np.frombuffer(in_data, dtype=np.int16)
+        self.audio_buffer[self._delay_write] = in_arr
+        self._delay_write = (self._delay_write + 1) % self.buffer_size
+        if self.is_recording:
+            self.recorded_audio.append(in_data)
+
+        # Get delayed audio from buffer (the oldest row)
+        delayed_array = self.audio_buffer[self._delay_write]
+
+        # PTT PRE-KEY: Look ahead in buffer to activate PTT BEFORE audio arrives
+        # Chunks ahead to look - recomputed only when the pre-key setting
+        # actually changed (a float compare per callback, not a div+cast)
+        if self.ptt_prekey_time != self._prekey_chunks_for:
+            self._prekey_chunks = int((self.ptt_prekey_time * self.RATE) / self.CHUNK)
+            self._prekey_chunks_for = self.ptt_prekey_time
+        prekey_chunks = self._prekey_chunks
+
+        # Check audio level at look-ahead position (newer audio not yet output)
+        lookahead_has_audio = False
+        if self.buffer_size > prekey_chunks:
+            # Look at audio that will be output in 'ptt_prekey_time' seconds
+            lookahead_index = min(prekey_chunks, self.buffer_size - 1)
+            lookahead_array = self.audio_buffer[(self._delay_write + lookahead_index) % self.buffer_size]
+            if njit is not None:
+                lookahead_has_audio = _any_above_i16(lookahead_array,
+                                                     self._delay_gate_thr)
             else:
-                return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
-        
-        elif self.recording_mode == RecordingMode.MANUAL:
-            if self.is_recording:
-                self.recorded_audio.append(in_data)
-                return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
-            elif self.is_playing_back:
-                if self.playback_index < len(self.playback_audio):
-                    output = self.playback_audio[self.playback_index]
-                    self.playback_index += 1
-                    return output
-                else:
-                    self.stop_playback()
-                    return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+                np.abs(lookahead_array, out=self._abs_scratch)
+                lookahead_has_audio = int(self._abs_scratch.max()) > self._delay_gate_thr
+
+        # Also check current output audio. Under Numba the gate early-exits
+        # at the first loud sample; the NumPy fallback reduces the scratch
+        # buffer. Percents for the cold transition prints are derived below
+        if njit is not None:
+            current_has_audio = _any_above_i16(delayed_array, self._delay_gate_thr)
+        else:
+            np.abs(delayed_array, out=self._abs_scratch)
+            current_has_audio = int(self._abs_scratch.max()) > self._delay_gate_thr
+
+        # PTT should be active if EITHER:
+        # 1. Audio is coming soon (look-ahead detected), OR
+        # 2. Audio is currently playing (already transmitting)
+        was_active = self.delay_has_audio
+        self.delay_has_audio = lookahead_has_audio or current_has_audio
+
+        # Debug PTT state changes with look-ahead info
+        if self.delay_has_audio and not was_active:
+            audio_level = self._level_pct(delayed_array)
+            if lookahead_has_audio:
+                lookahead_level = self._level_pct(lookahead_array)
+                self._log(f"🔴 PTT PRE-KEY ACTIVE (Delay Line) - Audio coming in {self.ptt_prekey_time:.1f}s")
+                self._log(f"   Look-ahead level: {lookahead_level:.1f}%, Current level: {audio_level:.1f}%")
             else:
-                return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+                self._log(f"🔴 PTT ACTIVE (Delay Line) - Audio level: {audio_level:.1f}%")
+        elif not self.delay_has_audio and was_active:
+            audio_level = self._level_pct(delayed_array)
+            self._log(f"⚪ PTT INACTIVE (Delay Line) - Audio level: {audio_level:.1f}%")
+        
+        return delayed_array.tobytes()
+
+    def _process_timed_replay_mode(self, in_data, in_arr=None):
+        """Timed Auto-Replay: loop record for max_record_time, then play back.
+
+        This mode should work even if software VOX is disabled.
+        """
+        if not self.is_recording and not self.is_playing_back:
+            # Honor the post-playback settle delay stamped by stop_playback
+            # (returns silence until the deadline passes)
+            if self.now() < self._restart_at:
+                return self._silence
+            self.start_recording()
+
+        if self.is_recording:
+            self.recorded_audio.append(in_data)
+            # Audio-clock elapsed time - keeps the last wall-clock read
+            # off the callback path
+            elapsed = self.now() - self.record_start_time
+            if elapsed >= self.max_record_time:
+                self.stop_recording()
+                self.start_playback()
+            return self._silence
+        
+        elif self.is_playing_back:
+            output = self._next_playback_chunk()
+            if output is not None:
+                return output
+            self.stop_playback()
+            return self._silence
+        else:
+            return self._silence
+        
+
+    def _process_manual_mode(self, in_data, in_arr=None):
+        """Manual mode: record or play back under explicit user control."""
+        if self.is_recording:
+            self.recorded_audio.append(in_data)
+            return self._silence
+        elif self.is_playing_back:
+            output = self._next_playback_chunk()
+            if output is not None:
+                return output
+            self.stop_playback()
+            return self._silence
+        else:
+            return self._silence
     
-    def process_repeater_mode(self, in_data):
+    def process_repeater_mode(self, in_data, in_arr=None):
         """Process audio in repeater mode (pass-through)"""
         # Feedback protection: check if we're in holdoff period
         if self.feedback_protection_enabled:
@@ -1537,109 +2462,130 @@ class ParrotBox:
             if currently_outputting:
                 # We're actively outputting - definitely in holdoff
                 self.is_in_holdoff = True
-                self.last_output_time = time.time()
-                return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+                self._holdoff_until = self.now() + self.feedback_holdoff_time
+                return self._silence
             
             # Check if still in holdoff period after output stopped
-            if self.last_output_time > 0:
-                elapsed = time.time() - self.last_output_time
-                if elapsed < self.feedback_holdoff_time:
-                    # Still in holdoff
-                    if not self.is_in_holdoff:
-                        self.is_in_holdoff = True
-                        print(f"🔇 Feedback holdoff active ({self.feedback_holdoff_time}s) - muting input")
-                    return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
-                else:
-                    # Holdoff expired
-                    if self.is_in_holdoff:
-                        self.is_in_holdoff = False
-                        # Reset VOX state to prevent false drop detection
-                        self.last_vox_state = False
-                        # Start grace period to prevent immediate VOX re-trigger
-                        self.last_announcement_time = time.time()
-                        print("🔊 Feedback holdoff complete - starting grace period")
+            # (deadline comparison - no elapsed-time arithmetic per chunk)
+            if self.now() < self._holdoff_until:
+                # Still in holdoff
+                if not self.is_in_holdoff:
+                    self.is_in_holdoff = True
+                    self._log(f"🔇 Feedback holdoff active ({self.feedback_holdoff_time}s) - muting input")
+                return self._silence
+            else:
+                # Holdoff expired
+                if self.is_in_holdoff:
+                    self.is_in_holdoff = False
+                    # Reset VOX state to prevent false drop detection
+                    self.last_vox_state = False
+                    # Start grace period to prevent immediate VOX re-trigger
+                    self._grace_until = self.now() + self.vox_grace_period
+                    self._log("🔊 Feedback holdoff complete - starting grace period")
         
         # Normal operation - pass through when VOX active
         if self.vox.is_active:
             return in_data  # Pass through immediately
         else:
-            return np.zeros(self.CHUNK, dtype=np.int16).tobytes()
+            return self._silence
     
     def get_announcement_chunk(self):
         """Get next chunk of announcement audio"""
-        if self.announcement_audio is None or self.announcement_index >= len(self.announcement_audio):
+        segments = self.announcement_segments
+        if segments is None:
             return None
-        
+
+        # Advance past exhausted segments (prekey -> speech, no copies)
+        while (self.announcement_seg_idx < len(segments) and
+               self.announcement_index >= len(segments[self.announcement_seg_idx])):
+            self.announcement_seg_idx += 1
+            self.announcement_index = 0
+
+        if self.announcement_seg_idx >= len(segments):
+            return None
+
         # Mark that we're outputting audio (for feedback protection)
         if self.feedback_protection_enabled:
-            self.last_output_time = time.time()
-        
-        end_index = min(self.announcement_index + self.CHUNK, len(self.announcement_audio))
-        chunk = self.announcement_audio[self.announcement_index:end_index]
-        
+            self._holdoff_until = self.now() + self.feedback_holdoff_time
+
         # Debug: Check if we're actually outputting audio
-        if self.announcement_index == 0:
-            print(f"Starting announcement playback - total samples: {len(self.announcement_audio)}")
-        
-        # Pad if needed
-        if len(chunk) < self.CHUNK:
-            chunk = np.pad(chunk, (0, self.CHUNK - len(chunk)), mode='constant')
-        
+        if self.announcement_seg_idx == 0 and self.announcement_index == 0:
+            total_samples = sum(len(s) for s in segments) // 2
+            self._log(f"Starting announcement playback - total samples: {total_samples}")
+
+        # Segments are raw PCM bytes; the index advances in bytes, and a
+        # full chunk is a single bytes slice - no int16 staging copy
+        segment = segments[self.announcement_seg_idx]
+        chunk_bytes = self.CHUNK * 2
+        end_index = min(self.announcement_index + chunk_bytes, len(segment))
+        n = end_index - self.announcement_index
+
+        if n == chunk_bytes:
+            out = segment[self.announcement_index:end_index]
+        else:
+            # Final short chunk: pad through the shared staging buffer
+            self._out_bytes[:n] = segment[self.announcement_index:end_index]
+            self._out_view[n // 2:] = 0
+            out = bytes(self._out_bytes)
+
         self.announcement_index = end_index
-        
-        # Debug every second
-        if self.announcement_index % (self.RATE) < self.CHUNK:
-            progress = (self.announcement_index / len(self.announcement_audio)) * 100
-            print(f"Announcement playback: {progress:.1f}% - chunk peak: {np.abs(np.frombuffer(chunk.tobytes(), dtype=np.int16)).max()}")
-        
-        return chunk.tobytes()
+        return out
     
     def get_courtesy_tone_chunk(self):
         """Get next chunk of courtesy tone audio"""
-        if self.courtesy_tone_audio is None or self.courtesy_tone_index >= len(self.courtesy_tone_audio):
+        if self.courtesy_tone_bytes is None or self.courtesy_tone_index >= len(self.courtesy_tone_bytes):
             return None
         
         # Mark that we're outputting audio (for feedback protection)
         if self.feedback_protection_enabled:
-            self.last_output_time = time.time()
-        
-        end_index = min(self.courtesy_tone_index + self.CHUNK, len(self.courtesy_tone_audio))
-        chunk = self.courtesy_tone_audio[self.courtesy_tone_index:end_index]
-        
+            self._holdoff_until = self.now() + self.feedback_holdoff_time
+        
+        # Index advances in bytes over the cached raw-PCM form; a full
+        # chunk is a single bytes slice with no int16 staging copy
+        tone_bytes = self.courtesy_tone_bytes
+        chunk_bytes = self.CHUNK * 2
+        end_index = min(self.courtesy_tone_index + chunk_bytes, len(tone_bytes))
+        n = end_index - self.courtesy_tone_index
+
         # Calculate progress percentage
-        progress = (self.courtesy_tone_index / len(self.courtesy_tone_audio)) * 100
+        progress = (self.courtesy_tone_index / len(tone_bytes)) * 100
         if progress < 10:  # Only print at the start
-            peak = np.abs(chunk).max()
-            print(f"🔔 Playing courtesy tone: {progress:.1f}% - peak level: {peak}")
-        
-        # Pad if needed
-        if len(chunk) < self.CHUNK:
-            chunk = np.pad(chunk, (0, self.CHUNK - len(chunk)), mode='constant')
-        
+            # Fused abs+max on the cached int16 array - no bytes round-trip
+            chunk = self.courtesy_tone_audio[
+                self.courtesy_tone_index // 2:end_index // 2]
+            if njit is not None:
+                peak, _ = _peak_mean(chunk)
+            else:
+                peak = np.abs(chunk).max()
+            self._log(f"🔔 Playing courtesy tone: {progress:.1f}% - peak level: {peak}")
+
+        if n == chunk_bytes:
+            out = tone_bytes[self.courtesy_tone_index:end_index]
+        else:
+            # Final short chunk: pad through the shared staging buffer
+            self._out_bytes[:n] = tone_bytes[self.courtesy_tone_index:end_index]
+            self._out_view[n // 2:] = 0
+            out = bytes(self._out_bytes)
+
         self.courtesy_tone_index = end_index
-        return chunk.tobytes()
+        return out
     
     def get_tail_silence_chunk(self):
         """Get next chunk of tail silence audio"""
         if self.tail_silence_audio is None or self.tail_silence_index >= len(self.tail_silence_audio):
             # Tail silence complete - start holdoff period
             if self.feedback_protection_enabled:
-                self.last_output_time = time.time()
+                self._holdoff_until = self.now() + self.feedback_holdoff_time
                 self.is_in_holdoff = True
                 # Reset VOX state to prevent false drop detection after holdoff
                 self.last_vox_state = False
-                print(f"Starting feedback protection holdoff ({self.feedback_holdoff_time}s)")
+                self._log(f"Starting feedback protection holdoff ({self.feedback_holdoff_time}s)")
             return None
         
         end_index = min(self.tail_silence_index + self.CHUNK, len(self.tail_silence_audio))
-        chunk = self.tail_silence_audio[self.tail_silence_index:end_index]
-        
-        # Pad if needed
-        if len(chunk) < self.CHUNK:
-            chunk = np.pad(chunk, (0, self.CHUNK - len(chunk)), mode='constant')
-        
+        # Tail audio is all zeros - just advance and return the silence chunk
         self.tail_silence_index = end_index
-        return chunk.tobytes()
+        return self._silence
     
     def handle_ptt(self):
         """Handle PTT control based on mode"""
@@ -1680,7 +2626,7 @@ class ParrotBox:
         if not self.is_recording:
             self.recorded_audio = []
             self.is_recording = True
-            self.record_start_time = time.time()
+            self.record_start_time = self.now()
             print("Recording started")
             if self.on_vox_state_change:
                 self.on_vox_state_change(True)
@@ -1700,46 +2646,78 @@ class ParrotBox:
     def start_playback(self):
         """Start playing back recorded audio"""
         if not self.is_playing_back and len(self.recorded_audio) > 0:
-            # Add pre-key beep at start to trigger radio VOX
-            prekey_beep = self.repeater.generate_prekey_beep(self.RATE)
-            beep_bytes = prekey_beep.tobytes()
-            # IMPORTANT: don't mutate recorded_audio (so saved WAVs don't include the beep)
-            self.playback_audio = [beep_bytes] + list(self.recorded_audio)
-            print(f"Playback started (with {len(prekey_beep)/self.RATE:.3f}s pre-key beep)")
-            
+            # Add pre-key beep at start to trigger radio VOX.
+            # IMPORTANT: don't mutate recorded_audio (so saved WAVs don't
+            # include the beep) - the playback cursor emits the beep first
+            # and then indexes the recording in place, so no O(N) list
+            # copy happens at playback start
+            beep_bytes = self.repeater.generate_prekey_bytes(self.RATE)
+            self._playback_beep = beep_bytes
+            self.playback_audio = self.recorded_audio
+            print(f"Playback started (with {len(beep_bytes)/2/self.RATE:.3f}s pre-key beep)")
+
             self.is_playing_back = True
             self.playback_index = 0
     
+    def _next_playback_chunk(self):
+        """Two-segment playback cursor: pre-key beep, then the recording.
+
+        Indexes recorded_audio directly (the recording only mutates by
+        rebinding, never in place during playback) and returns None when
+        both segments are exhausted.
+        """
+        beep = self._playback_beep
+        if beep is not None:
+            self._playback_beep = None
+            return beep
+        if self.playback_index < len(self.playback_audio):
+            out = self.playback_audio[self.playback_index]
+            self.playback_index += 1
+            return out
+        return None
+
     def stop_playback(self):
         """Stop playback"""
         if self.is_playing_back:
             self.is_playing_back = False
             self.playback_index = 0
             self.playback_audio = []
+            self._playback_beep = None
             print("Playback stopped")
             
             if self.on_recording_complete:
                 self.on_recording_complete()
 
-            # In Timed Auto-Replay, immediately go back into recording so it keeps looping
+            # In Timed Auto-Replay, go back into recording so it keeps looping
             if self.recording_mode == RecordingMode.TIMED_REPLAY and self.is_running:
-                # Small delay avoids capturing any lingering audio from the end of playback
-                threading.Timer(0.15, self.start_recording).start()
+                # Small delay avoids capturing any lingering audio from the
+                # end of playback. Stamped as a deadline the timed-replay
+                # handler waits out - no Timer thread spawned per loop
+                self._restart_at = self.now() + 0.15
     
     def save_recording(self, filename):
         """Save recorded audio to WAV file"""
         if not self.recorded_audio:
             return False
-        
+        return self._write_wav(filename, self.recorded_audio)
+
+    def _write_wav(self, filename, frames):
+        """Write captured frames to a WAV file.
+
+        Safe to run off-thread with a snapshot reference: starting a new
+        recording swaps in a fresh list rather than mutating this one.
+        """
         try:
             with wave.open(filename, 'wb') as wf:
                 wf.setnchannels(self.CHANNELS)
                 wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
                 wf.setframerate(self.RATE)
-                
-                for chunk in self.recorded_audio:
-                    wf.writeframes(chunk)
-            
+
+                # One join + one write: writeframes patches the header on
+                # every call, so feeding it chunk-by-chunk costs thousands
+                # of small seeks/writes on a long recording
+                wf.writeframes(b"".join(frames))
+
             print(f"Recording saved to {filename}")
             return True
         except Exception as e:
@@ -1773,11 +2751,11 @@ class ParrotBox:
                 print(f"⚠️ Weather service not enabled")
         
         elif action == "time":
+            # Single datetime.now() and inline format specs - one clock
+            # read and no intermediate strftime strings
             now = datetime.now()
-            time_str = now.strftime("%I:%M %p")
-            date_str = now.strftime("%A, %B %d, %Y")
-            text = f"The current time is {time_str}. Today is {date_str}"
-            print(f"🕐 Time: {time_str}, {date_str}")
+            text = f"The current time is {now:%I:%M %p}. Today is {now:%A, %B %d, %Y}"
+            print(f"🕐 Time: {now:%I:%M %p}, {now:%A, %B %d, %Y}")
         
         elif action.startswith("custom"):
             # Custom message
@@ -1786,34 +2764,65 @@ class ParrotBox:
         
         # Queue the announcement
         if text:
-            print(f"\n📢 Response Text: {text}")
-            print(f"\n⏱️  TIMING:")
-            print(f"   ▶️ Response queued NOW")
-            print(f"   ⏳ Un-key your radio")
-            print(f"   ⏳ Wait for VOX to drop (0.5-1s)")
-            print(f"   ⏳ TTS generation in progress...")
-            print(f"   🔊 Announcement will play in 1-3 seconds")
-            print(f"="*60 + "\n")
+            # One joined print instead of seven write syscalls
+            print("\n".join([
+                f"\n📢 Response Text: {text}",
+                "\n⏱️  TIMING:",
+                "   ▶️ Response queued NOW",
+                "   ⏳ Un-key your radio",
+                "   ⏳ Wait for VOX to drop (0.5-1s)",
+                "   ⏳ TTS generation in progress...",
+                "   🔊 Announcement will play in 1-3 seconds",
+                "="*60 + "\n",
+            ]))
             self.announcement_queue.put(text)
     
+    def set_recording_mode(self, mode):
+        """Switch recording mode and rebind the per-callback handler"""
+        self.recording_mode = mode
+        self._process_fn = self._mode_handlers[mode]
+
+    @staticmethod
+    def _build_gain_lut(gain):
+        """int16-bit-pattern -> scaled-and-saturated int16 lookup table"""
+        vals = np.arange(65536, dtype=np.uint16).astype(np.int16).astype(np.int32)
+        return np.clip(vals * float(gain), -32768, 32767).astype(np.int16)
+
+    def set_input_gain(self, gain):
+        """Update input gain and rebuild its saturation LUT off the RT thread"""
+        # LUT before gain: the callback branches on the gain value, so the
+        # table must already be in place when it does
+        self._in_gain_lut = self._build_gain_lut(gain) if gain != 1.0 else None
+        self.input_gain = gain
+
+    def set_output_gain(self, gain):
+        """Update output gain and rebuild its saturation LUT off the RT thread"""
+        self._out_gain_lut = self._build_gain_lut(gain) if gain != 1.0 else None
+        self.output_gain = gain
+
     def set_delay(self, delay_seconds):
         """Update delay time for continuous mode"""
         self.DELAY_SECONDS = delay_seconds
-        new_buffer_size = int(self.RATE / self.CHUNK * self.DELAY_SECONDS)
-        
-        old_buffer = list(self.audio_buffer)
-        self.audio_buffer = deque(maxlen=new_buffer_size)
-        
-        silence = np.zeros(self.CHUNK, dtype=np.int16).tobytes()
-        for _ in range(new_buffer_size):
-            if old_buffer:
-                self.audio_buffer.append(old_buffer.pop(0))
-            else:
-                self.audio_buffer.append(silence)
+        new_buffer_size = max(1, int(self.RATE / self.CHUNK * self.DELAY_SECONDS))
+
+        # Rebuild the ring oldest-first so the existing delayed audio keeps
+        # playing out in order, padded with silence if the delay grew
+        new_ring = np.zeros((new_buffer_size, self.CHUNK), dtype=np.int16)
+        n_keep = min(self.buffer_size, new_buffer_size)
+        idx = (self._delay_write + np.arange(n_keep)) % self.buffer_size
+        new_ring[:n_keep] = self.audio_buffer[idx]
+
+        self.audio_buffer = new_ring
+        self.buffer_size = new_buffer_size
+        self._delay_write = 0
     
     def cleanup(self):
         """Clean up resources"""
         self.stop()
+        # cancel_futures only exists on 3.9+; on 3.8 just don't wait
+        kwargs = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+        self._tts_pool.shutdown(wait=False, **kwargs)
+        self._io_pool.shutdown(wait=False, **kwargs)
         self.ptt_controller.disconnect()
         self.audio.terminate()
 
@@ -1838,6 +2847,38 @@ class ParrotBoxGUI:
         
         self.update_job = None
         self.recordings_history = []
+        self._recordings_mtime = 0.0  # recordings dir mtime at last list refresh
+        self.recordings_listbox = None  # created when the Recordings tab is first shown
+        # Chunks per second, pre-divided for the VOX attack/release math
+        self._rate_per_chunk = self.parrot.RATE / self.parrot.CHUNK
+        self._save_after_id = None  # pending debounced config save
+        self._last_saved_items = None  # snapshot of the last config written to disk
+        # Fixed font for the slider value labels: pinning it at creation
+        # keeps the per-drag .config(text=...) updates from re-resolving
+        # font/padding through Tcl's option database
+        self._value_font = tkfont.nametofont("TkDefaultFont")
+        # Shared label styles: one Tcl font parse each instead of
+        # re-parsing the same ('Arial', n) tuples per label construction
+        style = ttk.Style(root)
+        style.configure("Title.TLabel", font=('Arial', 12, 'bold'))
+        style.configure("Section.TLabel", font=('Arial', 10, 'bold'))
+        style.configure("Hint.TLabel", font=('Arial', 9), foreground='gray')
+        style.configure("Fine.TLabel", font=('Arial', 8), foreground='gray')
+        # One worker thread serializes all weather HTTP work - rapid
+        # toggles queue up (latest wins) instead of spawning a thread per
+        # click and racing overlapping fetches against weather.gov
+        self._weather_q = queue.Queue()
+        threading.Thread(target=self._weather_worker, daemon=True,
+                         name="weather-worker").start()
+        # Last successful GUI-triggered fetch, keyed by coordinates and a
+        # 10-minute bucket so repeated Test Connection clicks reuse it
+        self._weather_cache_key = None
+        self._weather_cache_val = None
+        # Meter display state: smoothed levels plus last-painted values so
+        # update_levels can skip redundant Tcl writes
+        self._disp_in = self._disp_out = 0.0
+        self._last_in_int = self._last_out_int = -1
+        self._last_vox_disp = self._last_ptt_disp = self._last_fb_disp = None
 
         # Recordings directory
         self.recordings_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
@@ -1909,32 +2950,47 @@ class ParrotBoxGUI:
         audio_tab = self.create_scrollable_frame(audio_tab_container)
         self.setup_audio_tab(audio_tab)
         
-        repeater_tab_container = ttk.Frame(notebook)
-        notebook.add(repeater_tab_container, text="Repeater Settings")
-        repeater_tab = self.create_scrollable_frame(repeater_tab_container)
-        self.setup_repeater_tab(repeater_tab)
-        
-        mode_settings_tab_container = ttk.Frame(notebook)
-        notebook.add(mode_settings_tab_container, text="Mode Settings")
-        mode_settings_tab = self.create_scrollable_frame(mode_settings_tab_container)
-        self.setup_mode_settings_tab(mode_settings_tab)
-        
         settings_tab_container = ttk.Frame(notebook)
         notebook.add(settings_tab_container, text="VOX/PTT Settings")
         settings_tab = self.create_scrollable_frame(settings_tab_container)
         self.setup_settings_tab(settings_tab)
-        
-        recordings_tab_container = ttk.Frame(notebook)
-        notebook.add(recordings_tab_container, text="Recordings")
-        recordings_tab = self.create_scrollable_frame(recordings_tab_container)
-        self.setup_recordings_tab(recordings_tab)
-        
-        # DTMF/Weather Commands Tab
-        commands_tab_container = ttk.Frame(notebook)
-        notebook.add(commands_tab_container, text="DTMF Commands")
-        commands_tab = self.create_scrollable_frame(commands_tab_container)
-        self.setup_commands_tab(commands_tab)
-    
+
+        # The remaining tabs hold only configuration widgets whose engine
+        # settings load_settings_from_config applies regardless, so their
+        # content is built lazily on first visit instead of at startup
+        self._pending_tabs = {}
+        for title, builder in (("Repeater Settings", self.setup_repeater_tab),
+                               ("Mode Settings", self.setup_mode_settings_tab),
+                               ("Recordings", self.setup_recordings_tab),
+                               ("DTMF Commands", self.setup_commands_tab)):
+            container = ttk.Frame(notebook)
+            notebook.add(container, text=title)
+            self._pending_tabs[str(container)] = builder
+
+        # VOX/PTT ahead of the lazy tabs keeps it eager (the status loop
+        # touches its feedback label), but display order should stay the
+        # same as it always was
+        notebook.insert(4, settings_tab_container)
+
+        # Track whether the Audio Devices tab (the only one with waveform
+        # canvases) is showing, so hidden traces aren't redrawn
+        self._audio_tab_visible = False
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build lazily constructed tab content on first visit"""
+        notebook = event.widget
+        selected = notebook.select()
+        builder = self._pending_tabs.pop(selected, None)
+        if builder is not None:
+            builder(self.create_scrollable_frame(self.root.nametowidget(selected)))
+            # Populate the freshly built widgets from config
+            self.load_settings_from_config()
+        tab_index = notebook.index(selected)
+        if tab_index == 5 and self.recordings_listbox is not None:
+            self._refresh_recordings_list()
+        self._audio_tab_visible = tab_index == 1
+
     def setup_main_tab(self, parent):
         """Setup main control tab"""
         
@@ -1944,7 +3000,7 @@ class ParrotBoxGUI:
         
         # Author info
         author_label = ttk.Label(parent, text="by NHscan | host@nhscan.com", 
-                                font=('Arial', 9), foreground='gray')
+                                style="Hint.TLabel")
         author_label.pack(pady=2)
         title_label.pack(pady=10)
         
@@ -2055,14 +3111,14 @@ class ParrotBoxGUI:
         
         # Config status
         config_info = ttk.Label(parent, text="💾 Settings auto-save", 
-                               font=('Arial', 8), foreground='gray')
+                               style="Fine.TLabel")
         config_info.pack(pady=5)
     
     def setup_audio_tab(self, parent):
         """Setup audio devices configuration tab"""
         
         ttk.Label(parent, text="Audio Device Configuration", 
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         # Input device
         input_frame = ttk.LabelFrame(parent, text="Input Device (Microphone/Line-In)", padding="10")
@@ -2080,7 +3136,7 @@ class ParrotBoxGUI:
         self.input_device_combo.pack(side='left', padx=5)
         
         ttk.Button(input_select_frame, text="Refresh Devices",
-                  command=self.refresh_audio_devices).pack(side='left', padx=5)
+                  command=lambda: self.refresh_audio_devices(force=True)).pack(side='left', padx=5)
         
         # Input level with canvas for waveform
         input_monitor_frame = ttk.Frame(input_frame)
@@ -2099,6 +3155,7 @@ class ParrotBoxGUI:
         ttk.Label(input_wave_frame, text="Waveform:").pack(anchor='w', padx=5)
         self.input_waveform = tk.Canvas(input_wave_frame, height=60, bg='black')
         self.input_waveform.pack(fill='x', padx=5, pady=5)
+        self.input_waveform.bind('<Configure>', self._on_wave_resize)
         
         # Output device
         output_frame = ttk.LabelFrame(parent, text="Output Device (Speaker/Line-Out)", padding="10")
@@ -2132,6 +3189,7 @@ class ParrotBoxGUI:
         ttk.Label(output_wave_frame, text="Waveform:").pack(anchor='w', padx=5)
         self.output_waveform = tk.Canvas(output_wave_frame, height=60, bg='black')
         self.output_waveform.pack(fill='x', padx=5, pady=5)
+        self.output_waveform.bind('<Configure>', self._on_wave_resize)
         
         # Live Volume Controls
         volume_frame = ttk.LabelFrame(parent, text="Live Volume Controls", padding="10")
@@ -2141,36 +3199,16 @@ class ParrotBoxGUI:
                  wraplength=600).pack(anchor='w', pady=5)
         
         # Input gain
-        input_gain_frame = ttk.Frame(volume_frame)
-        input_gain_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(input_gain_frame, text="Input Gain:").pack(side='left', padx=5)
-        
         self.input_gain_var = tk.DoubleVar(value=1.0)
-        ttk.Scale(input_gain_frame, from_=0.0, to=2.0,
-                 variable=self.input_gain_var,
-                 orient=tk.HORIZONTAL,
-                 length=300,
-                 command=self.update_input_gain).pack(side='left', padx=5)
-        
-        self.input_gain_label = ttk.Label(input_gain_frame, text="100%")
-        self.input_gain_label.pack(side='left', padx=5)
-        
+        self.input_gain_label = self._labeled_slider(
+            volume_frame, "Input Gain:", self.input_gain_var, 0.0, 2.0,
+            self.update_input_gain, "100%", length=300)
+
         # Output gain
-        output_gain_frame = ttk.Frame(volume_frame)
-        output_gain_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(output_gain_frame, text="Output Gain:").pack(side='left', padx=5)
-        
         self.output_gain_var = tk.DoubleVar(value=1.0)
-        ttk.Scale(output_gain_frame, from_=0.0, to=2.0,
-                 variable=self.output_gain_var,
-                 orient=tk.HORIZONTAL,
-                 length=300,
-                 command=self.update_output_gain).pack(side='left', padx=5)
-        
-        self.output_gain_label = ttk.Label(output_gain_frame, text="100%")
-        self.output_gain_label.pack(side='left', padx=5)
+        self.output_gain_label = self._labeled_slider(
+            volume_frame, "Output Gain:", self.output_gain_var, 0.0, 2.0,
+            self.update_output_gain, "100%", length=300)
         
         # Apply button
         apply_frame = ttk.Frame(parent)
@@ -2180,78 +3218,112 @@ class ParrotBoxGUI:
                   command=self.apply_audio_devices,
                   width=40).pack()
         
-        # Waveform buffers
-        self.input_waveform_data = deque(maxlen=300)
-        self.output_waveform_data = deque(maxlen=300)
-        
+        # Waveform history: fixed float32 rings with a shared write cursor
+        # (no deque append/evict churn, and the level math vectorizes)
+        self.input_waveform_data = np.zeros(300, dtype=np.float32)
+        self.output_waveform_data = np.zeros(300, dtype=np.float32)
+        self._wave_idx = 0
+        # Consecutive all-silent update ticks; once past the ring length
+        # the display is flat and updates can be skipped
+        self._wave_silent_ticks = 0
+        # Canvas size the static grid was last drawn at, and the
+        # persistent waveform item id, per canvas
+        self._wave_grid_sizes = {}
+        self._wave_items = {}
+        # Current canvas sizes, maintained by the <Configure> bindings
+        self._wave_sizes = {}
+        
+        # Cached (input_list, output_list, timestamp) from the last
+        # enumeration, plus the lists last pushed into the comboboxes
+        self._device_cache = None
+        self._last_in_devices = None
+        self._last_out_devices = None
+
         # Initialize
         self.refresh_audio_devices()
     
-    def refresh_audio_devices(self):
+    def refresh_audio_devices(self, force=False):
         """Refresh available audio devices"""
+        # Device enumeration is a PortAudio round-trip per device, so cache
+        # the lists and only re-enumerate on the Refresh button or after
+        # the cache goes stale
+        if not force and self._device_cache is not None:
+            # Cached lists were already pushed into the comboboxes when
+            # they were enumerated - nothing to reassign
+            if time.monotonic() - self._device_cache[2] < 30.0:
+                return
+
         try:
             audio = pyaudio.PyAudio()
-            
+
             input_devices = ["Default"]
             output_devices = ["Default"]
-            
-            for i in range(audio.get_device_count()):
-                info = audio.get_device_info_by_index(i)
-                name = f"{i}: {info['name']}"
-                
-                if info['maxInputChannels'] > 0:
-                    input_devices.append(name)
-                if info['maxOutputChannels'] > 0:
-                    output_devices.append(name)
-            
-            audio.terminate()
-            
-            self.input_device_combo['values'] = input_devices
-            self.output_device_combo['values'] = output_devices
-            
+
+            try:
+                for i in range(audio.get_device_count()):
+                    info = audio.get_device_info_by_index(i)
+                    name = f"{i}: {info['name']}"
+
+                    if info['maxInputChannels'] > 0:
+                        input_devices.append(name)
+                    if info['maxOutputChannels'] > 0:
+                        output_devices.append(name)
+            finally:
+                audio.terminate()
+
+            self._device_cache = (input_devices, output_devices, time.monotonic())
+
+            # Only push changed lists into the comboboxes - reassigning
+            # values makes Tk re-parse the list and re-layout the dropdown
+            # even when nothing was hot-plugged
+            new_in = tuple(input_devices)
+            if new_in != self._last_in_devices:
+                self._last_in_devices = new_in
+                self.input_device_combo['values'] = input_devices
+            new_out = tuple(output_devices)
+            if new_out != self._last_out_devices:
+                self._last_out_devices = new_out
+                self.output_device_combo['values'] = output_devices
+
             print(f"Found {len(input_devices)-1} input devices, {len(output_devices)-1} output devices")
-            
+
         except Exception as e:
             print(f"Error refreshing audio devices: {e}")
             messagebox.showerror("Error", f"Failed to list audio devices:\n{e}")
     
+    @staticmethod
+    def _parse_dev_index(selection):
+        """Parse the device index from a '4: Device Name' selection string"""
+        head, sep, _ = selection.partition(':')
+        return int(head) if sep and head.isdigit() else None
+
     def apply_audio_devices(self):
         """Apply audio device changes"""
         input_dev = self.input_device_var.get()
         output_dev = self.output_device_var.get()
-        
+
         # Parse device indices from selection strings
         # Format is: "4: CABLE Input (VB-Audio Virtual C"
         # Extract the number before the colon
-        
-        try:
-            if input_dev and input_dev != "Default":
-                input_index = int(input_dev.split(':')[0])
-                self.parrot.input_device_index = input_index
-                print(f"Set input device index to: {input_index}")
-            else:
-                self.parrot.input_device_index = None
-                print("Set input device to default")
-        except (ValueError, IndexError):
-            print(f"Could not parse input device index from: {input_dev}")
-            self.parrot.input_device_index = None
-        
-        try:
-            if output_dev and output_dev != "Default":
-                output_index = int(output_dev.split(':')[0])
-                self.parrot.output_device_index = output_index
-                print(f"Set output device index to: {output_index}")
-            else:
-                self.parrot.output_device_index = None
-                print("Set output device to default")
-        except (ValueError, IndexError):
-            print(f"Could not parse output device index from: {output_dev}")
-            self.parrot.output_device_index = None
+
+        input_index = self._parse_dev_index(input_dev) if input_dev else None
+        self.parrot.input_device_index = input_index
+        if input_index is not None:
+            print(f"Set input device index to: {input_index}")
+        else:
+            print("Set input device to default")
+
+        output_index = self._parse_dev_index(output_dev) if output_dev else None
+        self.parrot.output_device_index = output_index
+        if output_index is not None:
+            print(f"Set output device index to: {output_index}")
+        else:
+            print("Set output device to default")
         
         # Save to config
         self.config["input_device"] = input_dev
         self.config["output_device"] = output_dev
-        self.save_config()
+        self._schedule_save()
         
         messagebox.showinfo("Device Changes", 
                            f"Audio devices configured:\nInput: {input_dev}\nOutput: {output_dev}\n\n" +
@@ -2261,59 +3333,140 @@ class ParrotBoxGUI:
         """Update waveform displays"""
         if not self.parrot.is_running:
             return
-        
+
+        # Keep appending level history while hidden (so the trace is
+        # current when the tab comes back) but skip the redraws - nobody
+        # can see them
+        if not self._audio_tab_visible:
+            idx = self._wave_idx % 300
+            self.input_waveform_data[idx] = self.parrot.input_level
+            self.output_waveform_data[idx] = self.parrot.output_level
+            self._wave_idx += 1
+            return
+
+        # Once silence has persisted long enough that the rings are all
+        # zero and the traces are already flat, skip the append and the
+        # redraw entirely - keeps the event loop idle on a quiet channel
+        silent = self.parrot.input_level == 0 and self.parrot.output_level == 0
+        if silent and self._wave_silent_ticks > 300:
+            return
+        self._wave_silent_ticks = self._wave_silent_ticks + 1 if silent else 0
+
         # Get current audio levels (already calculated in audio callback)
-        input_level = self.parrot.input_level
-        output_level = self.parrot.output_level
-        
-        # Add to waveform buffers
-        self.input_waveform_data.append(input_level)
-        self.output_waveform_data.append(output_level)
-        
+        # and write them into the ring buffers
+        idx = self._wave_idx % 300
+        self.input_waveform_data[idx] = self.parrot.input_level
+        self.output_waveform_data[idx] = self.parrot.output_level
+        self._wave_idx += 1
+
         # Draw input waveform
-        self.draw_waveform(self.input_waveform, self.input_waveform_data, 'green')
-        
+        self.draw_waveform(self.input_waveform,
+                           self._wave_history(self.input_waveform_data), 'green')
+
         # Draw output waveform
-        self.draw_waveform(self.output_waveform, self.output_waveform_data, 'yellow')
+        self.draw_waveform(self.output_waveform,
+                           self._wave_history(self.output_waveform_data), 'yellow')
+
+    def _wave_history(self, ring):
+        """Ring contents ordered oldest-to-newest"""
+        n = self._wave_idx
+        if n <= 300:
+            return ring[:n]
+        cut = n % 300
+        return np.concatenate((ring[cut:], ring[:cut]))
     
+    def _on_wave_resize(self, event):
+        """Cache waveform canvas sizes so redraws skip the winfo queries"""
+        self._wave_sizes[event.widget] = (event.width, event.height)
+
     def draw_waveform(self, canvas, data, color):
         """Draw waveform on canvas"""
-        canvas.delete("all")
-        
         if len(data) < 2:
+            canvas.delete("wave")
+            self._wave_items.pop(canvas, None)
             return
-        
-        width = canvas.winfo_width()
-        height = canvas.winfo_height()
-        
+
+        # Cached by the <Configure> binding - no per-frame winfo round-trips
+        width, height = self._wave_sizes.get(canvas, (0, 0))
         if width <= 1:
             width = 600
-        
-        # Draw grid
-        for i in range(0, 101, 25):
-            y = height - (i / 100.0 * height)
-            canvas.create_line(0, y, width, y, fill='gray20', dash=(2, 2))
-        
-        # Draw waveform
-        points = []
-        data_list = list(data)
-        for i, level in enumerate(data_list):
-            x = (i / len(data_list)) * width
-            y = height - (min(level, 100) / 100.0 * height)
-            points.append((x, y))
-        
-        if len(points) > 1:
-            for i in range(len(points) - 1):
-                canvas.create_line(points[i][0], points[i][1],
-                                 points[i+1][0], points[i+1][1],
-                                 fill=color, width=2)
+        if height <= 1:
+            height = 60
+
+        # Static grid: drawn once per canvas size and left alone across
+        # frames (only the tagged waveform item is replaced below)
+        if self._wave_grid_sizes.get(canvas) != (width, height):
+            canvas.delete("all")
+            self._wave_items.pop(canvas, None)
+            for i in range(0, 101, 25):
+                y = height - (i / 100.0 * height)
+                canvas.create_line(0, y, width, y, fill='gray20', dash=(2, 2))
+            self._wave_grid_sizes[canvas] = (width, height)
+
+        # Downsample to a peak envelope when the canvas is narrower than
+        # the buffer - Tk collapses sub-pixel segments to a pixel anyway,
+        # so feeding it more than ~one point per column is wasted coords
+        stride = len(data) // width
+        if stride > 1:
+            data = data[:(len(data) // stride) * stride].reshape(-1, stride).max(axis=1)
+
+        # One polyline item for the whole trace: Tk item creation is the
+        # dominant cost, so ~300 per-segment create_line calls collapse
+        # into a single item whose coordinates are mutated in place.
+        # Coordinates come out of one vectorized pass over the ring
+        n = len(data)
+        ys = height - np.minimum(data, 100.0) * (height / 100.0)
+        flat = np.empty(2 * n, dtype=np.float32)
+        flat[0::2] = np.arange(n, dtype=np.float32) * (width / n)
+        flat[1::2] = ys
+        coords = flat.tolist()
+
+        item = self._wave_items.get(canvas)
+        if item is None:
+            # (Re)created after grid rebuilds; mutated thereafter -
+            # coords() updates the existing item without re-entering the
+            # Tk item allocator every frame
+            self._wave_items[canvas] = canvas.create_line(
+                *coords, fill=color, width=2, tags="wave")
+        else:
+            canvas.coords(item, *coords)
     
+    def _labeled_slider(self, parent, text, variable, from_, to, command,
+                        initial, length=200, label_width=None, expand=False,
+                        on_release=None):
+        """Build a Label + Scale + value Label row, returning the value label
+
+        Every settings tab repeats this same widget group; one factory keeps
+        widget construction (and Tcl configure traffic at startup) down.
+        """
+        frame = ttk.Frame(parent)
+        frame.pack(fill='x', pady=5)
+
+        if text:
+            ttk.Label(frame, text=text).pack(side='left', padx=5)
+
+        scale = ttk.Scale(frame, from_=from_, to=to,
+                          variable=variable,
+                          orient=tk.HORIZONTAL,
+                          command=command)
+        if on_release is not None:
+            scale.bind('<ButtonRelease-1>', on_release)
+        if expand:
+            scale.pack(side='left', fill='x', expand=True, padx=5)
+        else:
+            scale.config(length=length)
+            scale.pack(side='left', padx=5)
+
+        value_label = ttk.Label(frame, text=initial, width=label_width,
+                                font=self._value_font)
+        value_label.pack(side='left', padx=5)
+        return value_label
+
     def setup_repeater_tab(self, parent):
         """Setup repeater configuration tab"""
-        """Setup repeater configuration tab"""
         
         ttk.Label(parent, text="Repeater Configuration", 
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         # Callsign
         callsign_frame = ttk.LabelFrame(parent, text="Station Identification", padding="10")
@@ -2334,20 +3487,10 @@ class ParrotBoxGUI:
                        command=self.toggle_auto_id).pack(anchor='w', pady=5)
         
         # ID interval
-        interval_frame = ttk.Frame(callsign_frame)
-        interval_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(interval_frame, text="ID Interval (minutes):").pack(side='left', padx=5)
-        
         self.id_interval_var = tk.DoubleVar(value=10.0)
-        ttk.Scale(interval_frame, from_=5.0, to=15.0,
-                 variable=self.id_interval_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_id_interval).pack(side='left', padx=5)
-        
-        self.id_interval_label = ttk.Label(interval_frame, text="10 min")
-        self.id_interval_label.pack(side='left', padx=5)
+        self.id_interval_label = self._labeled_slider(
+            callsign_frame, "ID Interval (minutes):", self.id_interval_var,
+            5.0, 15.0, self.update_id_interval, "10 min")
         
         # Courtesy tone
         tone_frame = ttk.LabelFrame(parent, text="Courtesy Tone", padding="10")
@@ -2358,71 +3501,31 @@ class ParrotBoxGUI:
                        variable=self.courtesy_tone_var,
                        command=self.toggle_courtesy_tone).pack(anchor='w', pady=5)
         
-        tone_freq_frame = ttk.Frame(tone_frame)
-        tone_freq_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(tone_freq_frame, text="Tone Frequency (Hz):").pack(side='left', padx=5)
-        
         self.tone_freq_var = tk.DoubleVar(value=1000)
-        ttk.Scale(tone_freq_frame, from_=500, to=2000,
-                 variable=self.tone_freq_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_tone_freq).pack(side='left', padx=5)
-        
-        self.tone_freq_label = ttk.Label(tone_freq_frame, text="1000 Hz")
-        self.tone_freq_label.pack(side='left', padx=5)
-        
+        self.tone_freq_label = self._labeled_slider(
+            tone_frame, "Tone Frequency (Hz):", self.tone_freq_var,
+            500, 2000, self.update_tone_freq, "1000 Hz")
+
         # Courtesy tone volume
-        tone_vol_frame = ttk.Frame(tone_frame)
-        tone_vol_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(tone_vol_frame, text="Tone Volume:").pack(side='left', padx=5)
-        
         self.tone_volume_var = tk.DoubleVar(value=0.5)
-        ttk.Scale(tone_vol_frame, from_=0.0, to=1.0,
-                 variable=self.tone_volume_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_tone_volume).pack(side='left', padx=5)
-        
-        self.tone_volume_label = ttk.Label(tone_vol_frame, text="50%")
-        self.tone_volume_label.pack(side='left', padx=5)
-        
+        self.tone_volume_label = self._labeled_slider(
+            tone_frame, "Tone Volume:", self.tone_volume_var,
+            0.0, 1.0, self.update_tone_volume, "50%")
+
         # Courtesy tone duration
-        tone_dur_frame = ttk.Frame(tone_frame)
-        tone_dur_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(tone_dur_frame, text="Tone Duration (seconds):").pack(side='left', padx=5)
-        
         self.tone_duration_var = tk.DoubleVar(value=0.5)
-        ttk.Scale(tone_dur_frame, from_=0.1, to=2.0,
-                 variable=self.tone_duration_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_tone_duration).pack(side='left', padx=5)
-        
-        self.tone_duration_label = ttk.Label(tone_dur_frame, text="0.5 sec")
-        self.tone_duration_label.pack(side='left', padx=5)
+        self.tone_duration_label = self._labeled_slider(
+            tone_frame, "Tone Duration (seconds):", self.tone_duration_var,
+            0.1, 2.0, self.update_tone_duration, "0.5 sec")
         
         # Timeout timer
         timeout_frame = ttk.LabelFrame(parent, text="Timeout Timer", padding="10")
         timeout_frame.pack(fill='x', padx=10, pady=10)
         
-        timeout_entry_frame = ttk.Frame(timeout_frame)
-        timeout_entry_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(timeout_entry_frame, text="Max TX Time (seconds):").pack(side='left', padx=5)
-        
         self.timeout_var = tk.DoubleVar(value=180)
-        ttk.Scale(timeout_entry_frame, from_=60, to=300,
-                 variable=self.timeout_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_timeout).pack(side='left', padx=5)
-        
-        self.timeout_label = ttk.Label(timeout_entry_frame, text="180 sec")
-        self.timeout_label.pack(side='left', padx=5)
+        self.timeout_label = self._labeled_slider(
+            timeout_frame, "Max TX Time (seconds):", self.timeout_var,
+            60, 300, self.update_timeout, "180 sec")
         
         # PTT Pre-delay
         ptt_delay_frame = ttk.LabelFrame(parent, text="PTT Pre-Delay", padding="10")
@@ -2431,20 +3534,10 @@ class ParrotBoxGUI:
         ttk.Label(ptt_delay_frame, text="Delay before speaking (allows PTT to key up):", 
                  wraplength=400).pack(anchor='w', pady=5)
         
-        delay_control_frame = ttk.Frame(ptt_delay_frame)
-        delay_control_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(delay_control_frame, text="Pre-delay (seconds):").pack(side='left', padx=5)
-        
         self.ptt_predelay_var = tk.DoubleVar(value=1.0)
-        ttk.Scale(delay_control_frame, from_=0.0, to=3.0,
-                 variable=self.ptt_predelay_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_ptt_predelay).pack(side='left', padx=5)
-        
-        self.ptt_predelay_label = ttk.Label(delay_control_frame, text="1.0 sec")
-        self.ptt_predelay_label.pack(side='left', padx=5)
+        self.ptt_predelay_label = self._labeled_slider(
+            ptt_delay_frame, "Pre-delay (seconds):", self.ptt_predelay_var,
+            0.0, 3.0, self.update_ptt_predelay, "1.0 sec")
         
         # Tail Silence (VOX Drop Time)
         tail_frame = ttk.LabelFrame(parent, text="Tail Silence (VOX Drop)", padding="10")
@@ -2453,20 +3546,10 @@ class ParrotBoxGUI:
         ttk.Label(tail_frame, text="Silence after transmission to drop radio VOX cleanly:", 
                  wraplength=400).pack(anchor='w', pady=5)
         
-        tail_control_frame = ttk.Frame(tail_frame)
-        tail_control_frame.pack(fill='x', pady=5)
-        
-        ttk.Label(tail_control_frame, text="Tail silence (seconds):").pack(side='left', padx=5)
-        
         self.tail_silence_var = tk.DoubleVar(value=0.5)
-        ttk.Scale(tail_control_frame, from_=0.0, to=2.0,
-                 variable=self.tail_silence_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_tail_silence).pack(side='left', padx=5)
-        
-        self.tail_silence_label = ttk.Label(tail_control_frame, text="0.5 sec")
-        self.tail_silence_label.pack(side='left', padx=5)
+        self.tail_silence_label = self._labeled_slider(
+            tail_frame, "Tail silence (seconds):", self.tail_silence_var,
+            0.0, 2.0, self.update_tail_silence, "0.5 sec")
         
         # Custom announcement
         announce_frame = ttk.LabelFrame(parent, text="Custom Announcement", padding="10")
@@ -2484,7 +3567,7 @@ class ParrotBoxGUI:
         """Setup mode-specific settings tab"""
         
         ttk.Label(parent, text="Recording Mode Settings",
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         # Timed Replay Mode Settings
         timed_frame = ttk.LabelFrame(parent, text="Timed Replay Mode", padding="10")
@@ -2492,18 +3575,11 @@ class ParrotBoxGUI:
         
         ttk.Label(timed_frame, text="Maximum record time before auto-playback:").pack(anchor='w', pady=5)
         
-        timer_control = ttk.Frame(timed_frame)
-        timer_control.pack(fill='x', pady=5)
-        
         self.timer_var = tk.DoubleVar(value=30.0)
-        timer_slider = ttk.Scale(timer_control, from_=5, to=300,
-                                variable=self.timer_var,
-                                orient='horizontal',
-                                command=self.update_timer_label)
-        timer_slider.pack(side='left', fill='x', expand=True, padx=5)
-        
-        self.timer_value_label = ttk.Label(timer_control, text="30s", width=8)
-        self.timer_value_label.pack(side='left', padx=5)
+        self.timer_value_label = self._labeled_slider(
+            timed_frame, None, self.timer_var, 5, 300,
+            self.update_timer_label, "30s", label_width=8, expand=True,
+            on_release=self._apply_mode_settings)
         
         # Continuous Delay Mode Settings
         delay_frame = ttk.LabelFrame(parent, text="Continuous Delay Line Mode", padding="10")
@@ -2511,65 +3587,53 @@ class ParrotBoxGUI:
         
         ttk.Label(delay_frame, text="Delay time (seconds):").pack(anchor='w', pady=5)
         
-        delay_control = ttk.Frame(delay_frame)
-        delay_control.pack(fill='x', pady=5)
-        
         self.delay_var = tk.DoubleVar(value=2.0)
-        delay_slider = ttk.Scale(delay_control, from_=0.5, to=10.0,
-                                variable=self.delay_var,
-                                orient='horizontal',
-                                command=self.update_delay_label)
-        delay_slider.pack(side='left', fill='x', expand=True, padx=5)
-        
-        self.delay_value_label = ttk.Label(delay_control, text="2.0s", width=8)
-        self.delay_value_label.pack(side='left', padx=5)
+        self.delay_value_label = self._labeled_slider(
+            delay_frame, None, self.delay_var, 0.5, 10.0,
+            self.update_delay_label, "2.0s", label_width=8, expand=True,
+            on_release=self._apply_mode_settings)
         
         # PTT Pre-key time for delay mode
         ttk.Label(delay_frame, text="PTT Pre-Key Time (seconds):").pack(anchor='w', pady=5)
         
-        ptt_prekey_control = ttk.Frame(delay_frame)
-        ptt_prekey_control.pack(fill='x', pady=5)
-        
         self.ptt_prekey_delay_var = tk.DoubleVar(value=0.5)
-        ptt_prekey_slider = ttk.Scale(ptt_prekey_control, from_=0.0, to=2.0,
-                                variable=self.ptt_prekey_delay_var,
-                                orient='horizontal',
-                                command=self.update_ptt_prekey_label)
-        ptt_prekey_slider.pack(side='left', fill='x', expand=True, padx=5)
-        
-        self.ptt_prekey_delay_label = ttk.Label(ptt_prekey_control, text="0.5s", width=8)
-        self.ptt_prekey_delay_label.pack(side='left', padx=5)
+        self.ptt_prekey_delay_label = self._labeled_slider(
+            delay_frame, None, self.ptt_prekey_delay_var, 0.0, 2.0,
+            self.update_ptt_prekey_label, "0.5s", label_width=8, expand=True,
+            on_release=self._apply_mode_settings)
         
         ttk.Label(delay_frame, text="PTT activates this many seconds BEFORE audio transmits.\n" +
                  "Prevents radio from cutting off first word (0.3-1.0s recommended).",
-                 font=('Arial', 8), foreground='gray', wraplength=600).pack(anchor='w', pady=2)
+                 style="Fine.TLabel", wraplength=600).pack(anchor='w', pady=2)
         
         # Info
         info_text = ("These settings only apply when using their respective modes.\n"
                     "Repeater Mode has no configurable delays as it operates in real-time.")
-        ttk.Label(parent, text=info_text, font=('Arial', 9), 
-                 foreground='gray', wraplength=700).pack(pady=10)
+        ttk.Label(parent, text=info_text, style="Hint.TLabel",
+                 wraplength=700).pack(pady=10)
     
     def update_timer_label(self, value):
-        """Update timer label"""
-        val = int(float(value))
-        self.timer_value_label.config(text=f"{val}s")
-        self.parrot.max_record_time = val
-        self.save_config()
-    
+        """Update timer label (value applied at end of drag)"""
+        self.timer_value_label.config(text=f"{int(float(value))}s")
+
     def update_delay_label(self, value):
-        """Update delay label"""
-        val = float(value)
-        self.delay_value_label.config(text=f"{val:.1f}s")
-        self.parrot.DELAY_SECONDS = val
-        self.save_config()
-    
+        """Update delay label (value applied at end of drag)"""
+        self.delay_value_label.config(text=f"{float(value):.1f}s")
+
     def update_ptt_prekey_label(self, value):
-        """Update PTT pre-key label"""
-        val = float(value)
-        self.ptt_prekey_delay_label.config(text=f"{val:.1f}s")
-        self.parrot.ptt_prekey_time = val
-        self.save_config()
+        """Update PTT pre-key label (value applied at end of drag)"""
+        self.ptt_prekey_delay_label.config(text=f"{float(value):.1f}s")
+
+    def _apply_mode_settings(self, event=None):
+        """Push the mode-settings slider values to the audio engine
+
+        Bound to slider button-release so the engine sees one settled
+        value per drag instead of a parameter flip per drag pixel.
+        """
+        self.parrot.max_record_time = int(self.timer_var.get())
+        self.parrot.DELAY_SECONDS = float(self.delay_var.get())
+        self.parrot.ptt_prekey_time = float(self.ptt_prekey_delay_var.get())
+        self._schedule_save()
     
     def setup_settings_tab(self, parent):
         """Setup VOX and PTT settings tab"""
@@ -2614,22 +3678,14 @@ class ParrotBoxGUI:
         
         ttk.Label(holdoff_control, text="Holdoff Time (mute input after output):").pack(anchor='w', padx=5)
         
-        holdoff_slider_frame = ttk.Frame(holdoff_control)
-        holdoff_slider_frame.pack(fill='x', padx=5, pady=2)
-        
         self.feedback_holdoff_var = tk.DoubleVar(value=1.5)
-        ttk.Scale(holdoff_slider_frame, from_=0.5, to=5.0,
-                 variable=self.feedback_holdoff_var,
-                 orient=tk.HORIZONTAL,
-                 length=300,
-                 command=self.update_feedback_holdoff).pack(side='left', padx=5)
-        
-        self.feedback_holdoff_label = ttk.Label(holdoff_slider_frame, text="1.5s", width=6)
-        self.feedback_holdoff_label.pack(side='left', padx=5)
+        self.feedback_holdoff_label = self._labeled_slider(
+            holdoff_control, None, self.feedback_holdoff_var, 0.5, 5.0,
+            self.update_feedback_holdoff, "1.5s", length=300, label_width=6)
         
         ttk.Label(feedback_frame, 
                  text="💡 Lower = faster response but may allow feedback  |  Higher = prevents feedback but adds delay",
-                 font=('Arial', 8), foreground='gray', wraplength=500).pack(anchor='w', pady=2, padx=5)
+                 style="Fine.TLabel", wraplength=500).pack(anchor='w', pady=2, padx=5)
         
         # Status indicator
         self.feedback_status_frame = ttk.Frame(feedback_frame)
@@ -2639,47 +3695,26 @@ class ParrotBoxGUI:
         self.feedback_status_label = ttk.Label(self.feedback_status_frame, text="● Active", foreground='green')
         self.feedback_status_label.pack(side='left')
         
-        thresh_frame = ttk.Frame(vox_frame)
-        thresh_frame.pack(fill='x', pady=5)
-        ttk.Label(thresh_frame, text="VOX Threshold:").pack(side='left', padx=5)
         self.vox_threshold_var = tk.DoubleVar(value=5.0)
-        ttk.Scale(thresh_frame, from_=1.0, to=20.0,
-                 variable=self.vox_threshold_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_vox_threshold).pack(side='left', padx=5)
-        self.vox_threshold_label = ttk.Label(thresh_frame, text="5.0%")
-        self.vox_threshold_label.pack(side='left', padx=5)
-        
-        attack_frame = ttk.Frame(vox_frame)
-        attack_frame.pack(fill='x', pady=5)
-        ttk.Label(attack_frame, text="Attack Time:").pack(side='left', padx=5)
+        self.vox_threshold_label = self._labeled_slider(
+            vox_frame, "VOX Threshold:", self.vox_threshold_var,
+            1.0, 20.0, self.update_vox_threshold, "5.0%")
+
         self.vox_attack_var = tk.DoubleVar(value=0.1)
-        ttk.Scale(attack_frame, from_=0.05, to=1.0,
-                 variable=self.vox_attack_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_vox_attack).pack(side='left', padx=5)
-        self.vox_attack_label = ttk.Label(attack_frame, text="0.1s")
-        self.vox_attack_label.pack(side='left', padx=5)
-        
-        release_frame = ttk.Frame(vox_frame)
-        release_frame.pack(fill='x', pady=5)
-        ttk.Label(release_frame, text="Release Time:").pack(side='left', padx=5)
+        self.vox_attack_label = self._labeled_slider(
+            vox_frame, "Attack Time:", self.vox_attack_var,
+            0.05, 1.0, self.update_vox_attack, "0.1s")
+
         self.vox_release_var = tk.DoubleVar(value=0.5)
-        ttk.Scale(release_frame, from_=0.1, to=3.0,
-                 variable=self.vox_release_var,
-                 orient=tk.HORIZONTAL,
-                 length=200,
-                 command=self.update_vox_release).pack(side='left', padx=5)
-        self.vox_release_label = ttk.Label(release_frame, text="0.5s")
-        self.vox_release_label.pack(side='left', padx=5)
+        self.vox_release_label = self._labeled_slider(
+            vox_frame, "Release Time:", self.vox_release_var,
+            0.1, 3.0, self.update_vox_release, "0.5s")
         
         # PTT Control
         ptt_frame = ttk.LabelFrame(parent, text="PTT Control", padding="10")
         ptt_frame.pack(fill='x', padx=10, pady=10)
         
-        ttk.Label(ptt_frame, text="PTT Mode:", font=('Arial', 10, 'bold')).pack(anchor='w', pady=5)
+        ttk.Label(ptt_frame, text="PTT Mode:", style="Section.TLabel").pack(anchor='w', pady=5)
         
         self.ptt_mode_var = tk.StringVar(value=PTTMode.VOX.value)
         
@@ -2742,7 +3777,7 @@ class ParrotBoxGUI:
         audio_info_frame.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(audio_info_frame, text="Audio Troubleshooting:", 
-                 font=('Arial', 10, 'bold')).pack(anchor='w', pady=5)
+                 style="Section.TLabel").pack(anchor='w', pady=5)
         ttk.Button(audio_info_frame, text="Show Audio Devices",
                   command=self.show_audio_devices).pack(anchor='w', pady=5)
         
@@ -2753,7 +3788,7 @@ class ParrotBoxGUI:
         ttk.Label(debug_frame, 
                  text="Enable to see detailed console output for troubleshooting.\n" +
                       "Disable for cleaner output (recommended for .exe distribution).",
-                 font=('Arial', 9), foreground='gray').pack(anchor='w', pady=5)
+                 style="Hint.TLabel").pack(anchor='w', pady=5)
         
         self.debug_mode_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(debug_frame, text="Enable Debug Mode (Verbose Console Output)", 
@@ -2764,7 +3799,7 @@ class ParrotBoxGUI:
         """Setup recordings tab"""
         
         ttk.Label(parent, text="Saved Recordings", 
-                 font=('Arial', 12, 'bold')).pack(pady=10)
+                 style="Title.TLabel").pack(pady=10)
         
         list_frame = ttk.Frame(parent)
         list_frame.pack(fill='both', expand=True, padx=10, pady=10)
@@ -2772,18 +3807,55 @@ class ParrotBoxGUI:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side='right', fill='y')
         
-        self.recordings_listbox = tk.Listbox(list_frame, 
-                                             yscrollcommand=scrollbar.set,
-                                             height=20)
+        # Treeview instead of Listbox: rows live in Tk's internal item
+        # store and only the visible ones are rendered, so the list stays
+        # responsive after months of saved recordings
+        self.recordings_listbox = ttk.Treeview(list_frame, columns=('name',),
+                                               show='headings',
+                                               yscrollcommand=scrollbar.set,
+                                               height=20)
+        self.recordings_listbox.heading('name', text='Recording')
         self.recordings_listbox.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=self.recordings_listbox.yview)
-        
+
         btn_frame = ttk.Frame(parent)
         btn_frame.pack(pady=10)
-        
+
         ttk.Button(btn_frame, text="Open Folder",
                   command=self.open_recordings_folder).pack(side='left', padx=5)
-    
+
+        self._refresh_recordings_list()
+
+    def _insert_recording(self, name):
+        """Add a recording name at the top of the recordings list"""
+        self.recordings_listbox.insert('', 0, values=(name,))
+
+    def _refresh_recordings_list(self):
+        """Repopulate the recordings list from disk if the folder changed.
+
+        The directory mtime is cached so revisiting the tab is a single
+        stat when nothing was added or deleted; individual saves insert
+        into the already-populated list directly.
+        """
+        try:
+            mtime = os.stat(self.recordings_dir).st_mtime
+        except OSError:
+            return
+        if mtime == self._recordings_mtime:
+            return
+        self._recordings_mtime = mtime
+        try:
+            entries = [e for e in os.scandir(self.recordings_dir)
+                       if e.is_file() and e.name.lower().endswith('.wav')]
+        except OSError:
+            return
+        # Newest first, matching how live saves insert at the top
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        tree = self.recordings_listbox
+        tree.delete(*tree.get_children())
+        for entry in entries:
+            tree.insert('', 'end', values=(entry.name,))
+
     def setup_commands_tab(self, parent):
         """Setup DTMF commands and weather configuration tab"""
         
@@ -2803,7 +3875,9 @@ class ParrotBoxGUI:
         zip_frame.pack(fill='x', pady=5)
         ttk.Label(zip_frame, text="ZIP Code:").pack(side='left', padx=5)
         self.weather_zip_var = tk.StringVar(value="03894")
-        zip_entry = ttk.Entry(zip_frame, textvariable=self.weather_zip_var, width=10)
+        zip_entry = ttk.Entry(zip_frame, textvariable=self.weather_zip_var, width=10,
+                              validate='key',
+                              validatecommand=(self.root.register(self._is_zip), '%P'))
         zip_entry.pack(side='left', padx=5)
         ttk.Button(zip_frame, text="Update Weather", 
                   command=self.update_weather_zip).pack(side='left', padx=5)
@@ -2819,12 +3893,16 @@ class ParrotBoxGUI:
         
         ttk.Label(coord_entry_frame, text="Latitude:").pack(side='left', padx=5)
         self.weather_lat_var = tk.StringVar(value="")
-        lat_entry = ttk.Entry(coord_entry_frame, textvariable=self.weather_lat_var, width=12)
+        lat_entry = ttk.Entry(coord_entry_frame, textvariable=self.weather_lat_var, width=12,
+                              validate='key',
+                              validatecommand=(self.root.register(self._is_lat), '%P'))
         lat_entry.pack(side='left', padx=5)
         
         ttk.Label(coord_entry_frame, text="Longitude:").pack(side='left', padx=5)
         self.weather_lon_var = tk.StringVar(value="")
-        lon_entry = ttk.Entry(coord_entry_frame, textvariable=self.weather_lon_var, width=12)
+        lon_entry = ttk.Entry(coord_entry_frame, textvariable=self.weather_lon_var, width=12,
+                              validate='key',
+                              validatecommand=(self.root.register(self._is_lon), '%P'))
         lon_entry.pack(side='left', padx=5)
         
         ttk.Button(coord_entry_frame, text="Set Coordinates", 
@@ -2844,7 +3922,7 @@ class ParrotBoxGUI:
         
         ttk.Label(weather_frame, text="Note: Weather updates every 30 minutes automatically.\n" +
                  "DTMF 0001 will play full weather report.",
-                 font=('Arial', 8), foreground='gray').pack(anchor='w', pady=2)
+                 style="Fine.TLabel").pack(anchor='w', pady=2)
         
         # DTMF Detection
         dtmf_frame = ttk.LabelFrame(parent, text="DTMF Detection", padding="10")
@@ -2857,14 +3935,14 @@ class ParrotBoxGUI:
         
         ttk.Label(dtmf_frame, text="DTMF commands are 4-digit codes (e.g., 0001, 0002)\n" +
                  "Key up, dial the code, and the repeater will respond.",
-                 font=('Arial', 9), foreground='gray').pack(anchor='w', pady=5)
+                 style="Hint.TLabel").pack(anchor='w', pady=5)
         
         # DTMF Command Mapping
         commands_frame = ttk.LabelFrame(parent, text="DTMF Command Configuration", padding="10")
         commands_frame.pack(fill='x', padx=10, pady=10)
         
         # Fixed commands
-        ttk.Label(commands_frame, text="Fixed Commands:", font=('Arial', 10, 'bold')).pack(anchor='w', pady=5)
+        ttk.Label(commands_frame, text="Fixed Commands:", style="Section.TLabel").pack(anchor='w', pady=5)
         ttk.Label(commands_frame, text="0001 → Weather Report (full weather information)",
                  font=('Arial', 9)).pack(anchor='w', padx=20)
         ttk.Label(commands_frame, text="0002 → Time & Date (current time and date)",
@@ -2872,23 +3950,32 @@ class ParrotBoxGUI:
         
         # Custom messages
         ttk.Label(commands_frame, text="\nCustom Message Commands:", 
-                 font=('Arial', 10, 'bold')).pack(anchor='w', pady=5)
-        
-        # Create entry fields for custom commands
+                 style="Section.TLabel").pack(anchor='w', pady=5)
+        
+        # Create entry fields for custom commands.  One gridded frame for
+        # all eight rows instead of a packed Frame per row - a single
+        # geometry pass at tab build rather than one per row
+        grid_frame = ttk.Frame(commands_frame)
+        grid_frame.pack(fill='x', pady=2)
+        grid_frame.columnconfigure(1, weight=1)
+
         self.dtmf_custom_vars = {}
-        for i in range(3, 11):  # 0003 through 0010
-            code = f"000{i}" if i < 10 else f"00{i}"
-            custom_key = f"custom{i-2}"
-            
-            cmd_frame = ttk.Frame(commands_frame)
-            cmd_frame.pack(fill='x', pady=2)
-            
-            ttk.Label(cmd_frame, text=f"{code} →", width=8).pack(side='left', padx=5)
-            
+        # Keys whose entry text changed since the last save - lets Save
+        # skip untouched messages (and the config write when none changed)
+        self._dtmf_dirty = set()
+        # Config key per message, derived once instead of per save
+        self._dtmf_keys = {}
+        for row, i in enumerate(range(3, 11)):  # 0003 through 0010
+            ttk.Label(grid_frame, text=f"{i:04d} →", width=8).grid(
+                row=row, column=0, sticky='w', padx=5, pady=2)
+
             var = tk.StringVar(value=f"Custom message {i-2}")
-            self.dtmf_custom_vars[custom_key] = var
-            entry = ttk.Entry(cmd_frame, textvariable=var, width=60)
-            entry.pack(side='left', fill='x', expand=True, padx=5)
+            self.dtmf_custom_vars[f"custom{i-2}"] = var
+            self._dtmf_keys[f"custom{i-2}"] = f"dtmf_message_custom{i-2}"
+            var.trace_add('write',
+                          lambda *a, k=f"custom{i-2}": self._dtmf_dirty.add(k))
+            ttk.Entry(grid_frame, textvariable=var, width=60).grid(
+                row=row, column=1, sticky='ew', padx=5, pady=2)
         
         # Test DTMF
         test_frame = ttk.Frame(commands_frame)
@@ -2925,17 +4012,33 @@ class ParrotBoxGUI:
         self.parrot.weather.enabled = enabled
         if enabled:
             self.weather_status_label.config(text="Weather: Enabled", foreground='green')
-            # Fetch weather immediately
-            threading.Thread(target=self.fetch_weather_background, daemon=True).start()
+            # Fetch weather immediately and keep it refreshed in the background
+            self.parrot.weather.start_background_refresh()
+            self._weather_q.put(self.fetch_weather_background)
         else:
             self.weather_status_label.config(text="Weather: Disabled", foreground='gray')
-        self.save_config()
+        self._schedule_save()
     
     def toggle_weather_in_id(self):
         """Toggle weather in ID"""
         self.parrot.include_weather_in_id = self.weather_include_id_var.get()
-        self.save_config()
+        self._schedule_save()
     
+    @staticmethod
+    def _is_lat(proposed):
+        """Key validator: latitude in progress (sign, 2 digits, decimals)"""
+        return _LAT_PARTIAL.match(proposed) is not None
+
+    @staticmethod
+    def _is_lon(proposed):
+        """Key validator: longitude in progress (sign, 3 digits, decimals)"""
+        return _LON_PARTIAL.match(proposed) is not None
+
+    @staticmethod
+    def _is_zip(proposed):
+        """Key validator: up to five digits"""
+        return _ZIP_PARTIAL.match(proposed) is not None
+
     def update_weather_zip(self):
         """Update weather ZIP code"""
         zip_code = self.weather_zip_var.get()
@@ -2944,127 +4047,175 @@ class ParrotBoxGUI:
         self.parrot.weather.latitude = None
         self.parrot.weather.longitude = None
         self.weather_status_label.config(text="Weather: Updating...", foreground='orange')
-        threading.Thread(target=self.fetch_weather_background, daemon=True).start()
-        self.save_config()
+        self._weather_q.put(self.fetch_weather_background)
+        self._schedule_save()
     
     def set_manual_coords(self):
         """Set manual coordinates"""
-        try:
-            lat = float(self.weather_lat_var.get())
-            lon = float(self.weather_lon_var.get())
-            
-            if not (-90 <= lat <= 90):
-                messagebox.showerror("Error", "Latitude must be between -90 and 90")
-                return
-            if not (-180 <= lon <= 180):
-                messagebox.showerror("Error", "Longitude must be between -180 and 180")
-                return
-            
-            self.parrot.weather.set_coordinates(lat, lon)
-            self.weather_status_label.config(text=f"Coordinates set: {lat:.4f}, {lon:.4f}", foreground='blue')
-            
-            # Fetch weather with these coordinates
-            threading.Thread(target=self.fetch_weather_background, daemon=True).start()
-            self.save_config()
-            
-        except ValueError:
+        lat_text = self.weather_lat_var.get()
+        lon_text = self.weather_lon_var.get()
+        # Key validation only admits partial numbers, so check the final
+        # form here instead of letting float() raise
+        if not (_COORD_FULL.match(lat_text) and _COORD_FULL.match(lon_text)):
             messagebox.showerror("Error", "Please enter valid decimal coordinates\nExample: Lat 43.6039, Lon -71.2356")
+            return
+        lat = float(lat_text)
+        lon = float(lon_text)
+
+        if not (-90 <= lat <= 90):
+            messagebox.showerror("Error", "Latitude must be between -90 and 90")
+            return
+        if not (-180 <= lon <= 180):
+            messagebox.showerror("Error", "Longitude must be between -180 and 180")
+            return
+
+        self.parrot.weather.set_coordinates(lat, lon)
+        self.weather_status_label.config(text=f"Coordinates set: {lat:.4f}, {lon:.4f}", foreground='blue')
+
+        # Fetch weather with these coordinates
+        self._weather_q.put(self.fetch_weather_background)
+        self._schedule_save()
     
+    def _weather_worker(self):
+        """Run queued weather tasks one at a time, newest first"""
+        while True:
+            task = self._weather_q.get()
+            # Collapse bursts - only the most recent queued task matters
+            try:
+                while True:
+                    task = self._weather_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                task()
+            except Exception as e:
+                print(f"Weather task error: {e}")
+
     def test_weather_connection(self):
         """Test weather API connectivity"""
         self.weather_status_label.config(text="Testing connection...", foreground='orange')
-        threading.Thread(target=self._test_weather_thread, daemon=True).start()
+        self._weather_q.put(self._test_weather_thread)
     
+    def _set_weather_status(self, text, fg):
+        """Update the weather status label from a worker thread
+
+        Tk isn't thread-safe, so the .config call is marshalled onto the
+        event loop via after() instead of touching the widget directly.
+        """
+        self.root.after(0, lambda: self.weather_status_label.config(
+            text=text, foreground=fg))
+
     def _test_weather_thread(self):
         """Background thread for testing weather connection"""
         try:
-            import requests
-            
-            # Test 1: Can we reach the internet?
-            print("\n🧪 WEATHER CONNECTION TEST")
-            print("="*60)
-            print("Test 1: Internet connectivity...")
-            try:
-                response = requests.get("https://www.google.com", timeout=5)
-                print(f"✅ Internet: OK (Status {response.status_code})")
-            except:
-                print("❌ Internet: FAILED - No internet connection")
-                self.weather_status_label.config(text="Test: No internet connection", foreground='red')
-                return
-            
-            # Test 2: Can we reach weather.gov?
-            print("Test 2: Weather.gov API...")
-            try:
-                headers = {"User-Agent": "HamRadioRepeater/1.0 (Python-requests)"}
-                response = requests.get("https://api.weather.gov/", headers=headers, timeout=10)
-                print(f"✅ Weather.gov: OK (Status {response.status_code})")
-            except Exception as e:
-                print(f"❌ Weather.gov: FAILED - {e}")
-                self.weather_status_label.config(text=f"Test: Cannot reach weather.gov", foreground='red')
-                return
-            
-            # Test 3: Can we geocode?
-            print("Test 3: Geocoding API...")
+            # Reuse the weather service's pooled session so the probes
+            # share its keep-alive connections (and its User-Agent)
+            # instead of paying a fresh TLS handshake per test
+            session = self.parrot.weather._session
+
+            logger.debug("🧪 WEATHER CONNECTION TEST")
+
+            # Tests 1-3 are independent probes, so fire them together and
+            # pay the slowest round-trip once instead of all three in a row
             zip_code = self.weather_zip_var.get()
-            try:
-                url = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
-                params = {"address": zip_code, "benchmark": "2020", "format": "json"}
-                response = requests.get(url, params=params, timeout=10)
+            geocode_url = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
+            geocode_params = {"address": zip_code, "benchmark": "2020", "format": "json"}
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                internet_f = ex.submit(session.get, "https://www.google.com", timeout=5)
+                weather_f = ex.submit(session.get, "https://api.weather.gov/", timeout=10)
+                geocode_f = ex.submit(session.get, geocode_url,
+                                      params=geocode_params, timeout=10)
+
+                # Test 1: Can we reach the internet?
+                logger.debug("Test 1: Internet connectivity...")
+                try:
+                    response = internet_f.result()
+                    logger.debug("✅ Internet: OK (Status %s)", response.status_code)
+                except:
+                    logger.debug("❌ Internet: FAILED - No internet connection")
+                    self._set_weather_status("Test: No internet connection", 'red')
+                    return
+
+                # Test 2: Can we reach weather.gov?
+                logger.debug("Test 2: Weather.gov API...")
+                try:
+                    response = weather_f.result()
+                    logger.debug("✅ Weather.gov: OK (Status %s)", response.status_code)
+                except Exception as e:
+                    logger.debug("❌ Weather.gov: FAILED - %s", e)
+                    self._set_weather_status("Test: Cannot reach weather.gov", 'red')
+                    return
+
+                # Test 3: Can we geocode?
+                logger.debug("Test 3: Geocoding API...")
+                try:
+                    response = geocode_f.result()
+                except Exception as e:
+                    logger.debug("⚠️ Geocoding: FAILED - %s (use manual coordinates)", e)
+                    self._set_weather_status("Test: Use manual coordinates", 'orange')
+                    return
                 if response.status_code == 200:
                     data = response.json()
                     if data.get("result", {}).get("addressMatches"):
-                        print(f"✅ Geocoding: OK (found ZIP {zip_code})")
+                        logger.debug("✅ Geocoding: OK (found ZIP %s)", zip_code)
                     else:
-                        print(f"⚠️ Geocoding: ZIP not found - try different ZIP or use manual coordinates")
-                        self.weather_status_label.config(text=f"Test: ZIP {zip_code} not found", foreground='orange')
+                        logger.debug("⚠️ Geocoding: ZIP not found - try different ZIP or manual coordinates")
+                        self._set_weather_status(f"Test: ZIP {zip_code} not found", 'orange')
                         return
                 else:
-                    print(f"❌ Geocoding: HTTP {response.status_code}")
-            except Exception as e:
-                print(f"⚠️ Geocoding: FAILED - {e}")
-                print("   You can use manual coordinates instead")
-                self.weather_status_label.config(text="Test: Use manual coordinates", foreground='orange')
-                return
-            
+                    logger.debug("❌ Geocoding: HTTP %s", response.status_code)
+
             # Test 4: Full weather fetch
-            print("Test 4: Full weather fetch...")
-            weather = self.parrot.weather.fetch_weather()
+            logger.debug("Test 4: Full weather fetch...")
+            weather = self._cached_fetch()
             if weather:
-                print(f"✅ ALL TESTS PASSED!")
-                print(f"   Temperature: {weather['temperature']}°{weather['unit']}")
-                print(f"   Conditions: {weather['conditions']}")
-                print("="*60 + "\n")
-                self.weather_status_label.config(
-                    text=f"Test: SUCCESS! {weather['temperature']}°{weather['unit']}", 
-                    foreground='green')
+                logger.debug("✅ ALL TESTS PASSED! %s°%s, %s",
+                             weather['temperature'], weather['unit'],
+                             weather['conditions'])
+                self._set_weather_status(
+                    f"Test: SUCCESS! {weather['temperature']}°{weather['unit']}", 'green')
             else:
-                print(f"❌ Weather fetch failed - check console for details")
-                print("="*60 + "\n")
-                self.weather_status_label.config(text="Test: Failed - check console", foreground='red')
-                
+                logger.debug("❌ Weather fetch failed")
+                self._set_weather_status("Test: Failed - enable Debug Mode for details", 'red')
+
         except Exception as e:
-            print(f"❌ Test error: {e}")
-            import traceback
-            traceback.print_exc()
-            self.weather_status_label.config(text=f"Test: Error - {str(e)[:30]}", foreground='red')
+            logger.debug("❌ Test error: %s", e, exc_info=True)
+            self._set_weather_status(f"Test: Error - {str(e)[:30]}", 'red')
     
+    def _cached_fetch(self):
+        """Fetch weather, reusing the last result for identical coordinates.
+
+        The service already rate-limits by update_interval, but rapid
+        Test Connection clicks can still stack real fetches; this keeps
+        the answer for the same (lat, lon) within a 10-minute bucket.
+        """
+        key = (self.parrot.weather.latitude, self.parrot.weather.longitude,
+               int(time.monotonic() // 600))
+        if key == self._weather_cache_key:
+            return self._weather_cache_val
+        weather = self.parrot.weather.fetch_weather()
+        if weather:
+            self._weather_cache_key = key
+            self._weather_cache_val = weather
+        return weather
+
     def fetch_weather_background(self):
         """Fetch weather in background thread"""
         try:
-            weather = self.parrot.weather.fetch_weather()
+            weather = self._cached_fetch()
             if weather:
-                self.weather_status_label.config(
-                    text=f"Weather: {weather['temperature']}°{weather['unit']}, {weather['conditions']}", 
-                    foreground='green')
+                self._set_weather_status(
+                    f"Weather: {weather['temperature']}°{weather['unit']}, {weather['conditions']}",
+                    'green')
             else:
-                self.weather_status_label.config(text="Weather: Failed to fetch", foreground='red')
+                self._set_weather_status("Weather: Failed to fetch", 'red')
         except Exception as e:
-            self.weather_status_label.config(text=f"Weather: Error - {e}", foreground='red')
+            self._set_weather_status(f"Weather: Error - {e}", 'red')
     
     def toggle_dtmf(self):
         """Toggle DTMF detection"""
         self.parrot.dtmf.enabled = self.dtmf_enabled_var.get()
-        self.save_config()
+        self._schedule_save()
     
     def test_dtmf_command(self):
         """Test a DTMF command"""
@@ -3077,119 +4228,123 @@ class ParrotBoxGUI:
             messagebox.showwarning("Warning", "Start the system first to test commands")
             return
         
-        print(f"🧪 Testing DTMF command: {command}")
+        logger.debug("🧪 Testing DTMF command: %s", command)
         self.parrot.handle_dtmf_command(command)
         messagebox.showinfo("Test", f"DTMF command {command} queued!\nListen for the announcement.")
     
     def save_dtmf_settings(self):
-        """Save all DTMF custom messages"""
-        # Update custom messages
-        for key, var in self.dtmf_custom_vars.items():
-            self.parrot.dtmf_messages[key] = var.get()
-        
-        self.save_config()
+        """Save the DTMF custom messages that actually changed"""
+        if self._dtmf_dirty:
+            self.parrot.dtmf_messages.update(
+                {key: self.dtmf_custom_vars[key].get() for key in self._dtmf_dirty})
+            self._dtmf_dirty.clear()
+            self.save_config()
         messagebox.showinfo("Saved", "DTMF settings saved!")
     
+    # Declarative map of the regular config fields: config key, default,
+    # Tk variable attribute, how the value lands on the audio engine, and
+    # (optionally) the value label plus its formatter.  Irregular fields
+    # (enums, device strings, coordinates, fan-out flags) stay as explicit
+    # code in load_settings_from_config below.
+    _SETTINGS_SPEC = [
+        ("callsign", "WRKC123", "callsign_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'callsign', v),
+         None, None),
+        ("id_interval", 10.0, "id_interval_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'id_interval', v * 60),
+         "id_interval_label", lambda v: f"{int(v)} min"),
+        ("courtesy_tone_enabled", True, "courtesy_tone_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'enable_courtesy_tone', v),
+         None, None),
+        ("courtesy_tone_freq", 1000, "tone_freq_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'courtesy_tone_freq', v),
+         "tone_freq_label", lambda v: f"{int(v)} Hz"),
+        ("courtesy_tone_volume", 0.5, "tone_volume_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'courtesy_tone_volume', v),
+         "tone_volume_label", lambda v: f"{int(v*100)}%"),
+        ("courtesy_tone_duration", 0.5, "tone_duration_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'courtesy_tone_duration', v),
+         "tone_duration_label", lambda v: f"{v:.1f} sec"),
+        ("auto_id_enabled", True, "auto_id_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'auto_id_enabled', v),
+         None, None),
+        ("input_gain", 1.0, "input_gain_var",
+         lambda gui, v: gui.parrot.set_input_gain(v),
+         "input_gain_label", lambda v: f"{int(v*100)}%"),
+        ("output_gain", 1.0, "output_gain_var",
+         lambda gui, v: gui.parrot.set_output_gain(v),
+         "output_gain_label", lambda v: f"{int(v*100)}%"),
+        ("timeout_duration", 180, "timeout_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'timeout_duration', v),
+         "timeout_label", lambda v: f"{int(v)} sec"),
+        ("ptt_pre_delay", 1.0, "ptt_predelay_var",
+         lambda gui, v: setattr(gui.parrot, 'ptt_pre_delay', v),
+         "ptt_predelay_label", lambda v: f"{v:.1f} sec"),
+        ("tail_silence", 0.5, "tail_silence_var",
+         lambda gui, v: setattr(gui.parrot.repeater, 'tail_silence_duration', v),
+         "tail_silence_label", lambda v: f"{v:.1f} sec"),
+        ("vox_enabled", False, "vox_enable_var",
+         lambda gui, v: setattr(gui.parrot, 'vox_enabled', v),
+         None, None),
+        ("vox_threshold", 5.0, "vox_threshold_var",
+         lambda gui, v: setattr(gui.parrot.vox, 'threshold', v),
+         "vox_threshold_label", lambda v: f"{v:.1f}%"),
+        ("feedback_holdoff_time", 1.5, "feedback_holdoff_var",
+         lambda gui, v: setattr(gui.parrot, 'feedback_holdoff_time', v),
+         "feedback_holdoff_label", lambda v: f"{v:.1f}s"),
+        ("max_record_time", 30.0, "timer_var",
+         lambda gui, v: setattr(gui.parrot, 'max_record_time', v),
+         "timer_value_label", lambda v: f"{int(v)}s"),
+        ("delay_time", 2.0, "delay_var",
+         lambda gui, v: setattr(gui.parrot, 'DELAY_SECONDS', v),
+         "delay_value_label", lambda v: f"{v:.1f}s"),
+        ("ptt_prekey_time", 0.5, "ptt_prekey_delay_var",
+         lambda gui, v: setattr(gui.parrot, 'ptt_prekey_time', v),
+         "ptt_prekey_delay_label", lambda v: f"{v:.1f}s"),
+        ("weather_zip", "03894", "weather_zip_var",
+         lambda gui, v: setattr(gui.parrot.weather, 'zip_code', v),
+         None, None),
+        ("weather_include_in_id", False, "weather_include_id_var",
+         lambda gui, v: setattr(gui.parrot, 'include_weather_in_id', v),
+         None, None),
+        ("dtmf_enabled", False, "dtmf_enabled_var",
+         lambda gui, v: setattr(gui.parrot.dtmf, 'enabled', v),
+         None, None),
+    ]
+
     def load_settings_from_config(self):
         """Load all settings from config and apply to GUI"""
         try:
-            # Repeater settings
-            if hasattr(self, 'callsign_var'):
-                self.callsign_var.set(self.config.get("callsign", "WRKC123"))
-                self.parrot.repeater.callsign = self.callsign_var.get()
-            
-            if hasattr(self, 'id_interval_var'):
-                id_interval = self.config.get("id_interval", 10.0)
-                self.id_interval_var.set(id_interval)
-                self.parrot.repeater.id_interval = id_interval * 60
-                self.id_interval_label.config(text=f"{int(id_interval)} min")
-            
-            if hasattr(self, 'courtesy_tone_var'):
-                courtesy_enabled = self.config.get("courtesy_tone_enabled", True)
-                self.courtesy_tone_var.set(courtesy_enabled)
-                self.parrot.repeater.enable_courtesy_tone = courtesy_enabled
-            
-            if hasattr(self, 'tone_freq_var'):
-                tone_freq = self.config.get("courtesy_tone_freq", 1000)
-                self.tone_freq_var.set(tone_freq)
-                self.parrot.repeater.courtesy_tone_freq = tone_freq
-                self.tone_freq_label.config(text=f"{int(tone_freq)} Hz")
-            
-            if hasattr(self, 'tone_volume_var'):
-                tone_volume = self.config.get("courtesy_tone_volume", 0.5)
-                self.tone_volume_var.set(tone_volume)
-                self.parrot.repeater.courtesy_tone_volume = tone_volume
-                self.tone_volume_label.config(text=f"{int(tone_volume*100)}%")
-            
-            if hasattr(self, 'tone_duration_var'):
-                tone_duration = self.config.get("courtesy_tone_duration", 0.5)
-                self.tone_duration_var.set(tone_duration)
-                self.parrot.repeater.courtesy_tone_duration = tone_duration
-                self.tone_duration_label.config(text=f"{tone_duration:.1f} sec")
-            
-            if hasattr(self, 'auto_id_var'):
-                auto_id_enabled = self.config.get("auto_id_enabled", True)
-                self.auto_id_var.set(auto_id_enabled)
-                self.parrot.repeater.auto_id_enabled = auto_id_enabled
-            
-            # Audio gain settings
-            if hasattr(self, 'input_gain_var'):
-                input_gain = self.config.get("input_gain", 1.0)
-                self.input_gain_var.set(input_gain)
-                self.parrot.input_gain = input_gain
-                self.input_gain_label.config(text=f"{int(input_gain*100)}%")
-            
-            if hasattr(self, 'output_gain_var'):
-                output_gain = self.config.get("output_gain", 1.0)
-                self.output_gain_var.set(output_gain)
-                self.parrot.output_gain = output_gain
-                self.output_gain_label.config(text=f"{int(output_gain*100)}%")
-            
-            if hasattr(self, 'timeout_var'):
-                timeout = self.config.get("timeout_duration", 180)
-                self.timeout_var.set(timeout)
-                self.parrot.repeater.timeout_duration = timeout
-                self.timeout_label.config(text=f"{int(timeout)} sec")
-            
-            if hasattr(self, 'ptt_predelay_var'):
-                ptt_delay = self.config.get("ptt_pre_delay", 1.0)
-                self.ptt_predelay_var.set(ptt_delay)
-                self.parrot.ptt_pre_delay = ptt_delay
-                self.ptt_predelay_label.config(text=f"{ptt_delay:.1f} sec")
-            
-            if hasattr(self, 'tail_silence_var'):
-                tail_silence = self.config.get("tail_silence", 0.5)
-                self.tail_silence_var.set(tail_silence)
-                self.parrot.repeater.tail_silence_duration = tail_silence
-                self.tail_silence_label.config(text=f"{tail_silence:.1f} sec")
-            
-            # VOX settings
-            if hasattr(self, 'vox_enable_var'):
-                vox_enabled = self.config.get("vox_enabled", False)
-                self.vox_enable_var.set(vox_enabled)
-                self.parrot.vox_enabled = vox_enabled
-            
-            if hasattr(self, 'vox_threshold_var'):
-                vox_threshold = self.config.get("vox_threshold", 5.0)
-                self.vox_threshold_var.set(vox_threshold)
-                self.parrot.vox.threshold = vox_threshold
-                self.vox_threshold_label.config(text=f"{vox_threshold:.1f}%")
-            
+            # Regular fields: one data-driven pass instead of a hasattr
+            # wall of get/set/label triplets per field.  The engine always
+            # gets the value; the Tk variable and label only exist once
+            # their (possibly lazily built) tab has been shown
+            for key, default, var_name, apply, label_name, fmt in self._SETTINGS_SPEC:
+                value = self.config.get(key, default)
+                apply(self, value)
+                var = getattr(self, var_name, None)
+                if var is None:
+                    continue
+                var.set(value)
+                if label_name is not None:
+                    getattr(self, label_name).config(text=fmt(value))
+
+            # VOX timing sets both the time and its derived sample count
             if hasattr(self, 'vox_attack_var'):
                 vox_attack = self.config.get("vox_attack", 0.1)
                 self.vox_attack_var.set(vox_attack)
                 self.parrot.vox.attack_time = vox_attack
-                self.parrot.vox.attack_samples = int(self.parrot.RATE * vox_attack / 1024)
+                self.parrot.vox.attack_samples = int(vox_attack * self._rate_per_chunk)
                 self.vox_attack_label.config(text=f"{vox_attack:.2f}s")
             
             if hasattr(self, 'vox_release_var'):
                 vox_release = self.config.get("vox_release", 0.5)
                 self.vox_release_var.set(vox_release)
                 self.parrot.vox.release_time = vox_release
-                self.parrot.vox.release_samples = int(self.parrot.RATE * vox_release / 1024)
+                self.parrot.vox.release_samples = int(vox_release * self._rate_per_chunk)
                 self.vox_release_label.config(text=f"{vox_release:.2f}s")
             
-            # Feedback protection settings
+            # Feedback protection status label depends on the value
             if hasattr(self, 'feedback_protection_var'):
                 feedback_enabled = self.config.get("feedback_protection_enabled", True)
                 self.feedback_protection_var.set(feedback_enabled)
@@ -3199,20 +4354,13 @@ class ParrotBoxGUI:
                 else:
                     self.feedback_status_label.config(text="○ Disabled", foreground='red')
             
-            if hasattr(self, 'feedback_holdoff_var'):
-                holdoff_time = self.config.get("feedback_holdoff_time", 1.5)
-                self.feedback_holdoff_var.set(holdoff_time)
-                self.parrot.feedback_holdoff_time = holdoff_time
-                self.feedback_holdoff_label.config(text=f"{holdoff_time:.1f}s")
-            
             # PTT settings
             if hasattr(self, 'ptt_mode_var'):
                 ptt_mode = self.config.get("ptt_mode", "VOX")
                 self.ptt_mode_var.set(ptt_mode)
-                for mode in PTTMode:
-                    if mode.value == ptt_mode:
-                        self.parrot.ptt_mode = mode
-                        break
+                mode = _PTT_BY_VALUE.get(ptt_mode)
+                if mode is not None:
+                    self.parrot.ptt_mode = mode
             
             if hasattr(self, 'serial_port_var') and hasattr(self, 'serial_combo'):
                 serial_port = self.config.get("serial_port", "")
@@ -3223,208 +4371,140 @@ class ParrotBoxGUI:
             if hasattr(self, 'mode_var'):
                 recording_mode = self.config.get("recording_mode", "Repeater Mode")
                 self.mode_var.set(recording_mode)
-                for mode in RecordingMode:
-                    if mode.value == recording_mode:
-                        self.parrot.recording_mode = mode
-                        break
-            
-            if hasattr(self, 'timer_var'):
-                max_time = self.config.get("max_record_time", 30.0)
-                self.timer_var.set(max_time)
-                self.parrot.max_record_time = max_time
-                self.timer_value_label.config(text=f"{int(max_time)}s")
-            
-            if hasattr(self, 'delay_var'):
-                delay_time = self.config.get("delay_time", 2.0)
-                self.delay_var.set(delay_time)
-                self.parrot.DELAY_SECONDS = delay_time
-                self.delay_value_label.config(text=f"{delay_time:.1f}s")
-            
-            if hasattr(self, 'ptt_prekey_delay_var'):
-                ptt_prekey = self.config.get("ptt_prekey_time", 0.5)
-                self.ptt_prekey_delay_var.set(ptt_prekey)
-                self.parrot.ptt_prekey_time = ptt_prekey
-                self.ptt_prekey_delay_label.config(text=f"{ptt_prekey:.1f}s")
+                mode = _RECMODE_BY_VALUE.get(recording_mode)
+                if mode is not None:
+                    self.parrot.set_recording_mode(mode)
             
             # Audio devices - parse and set device indices
             input_dev = self.config.get("input_device", "Default")
             output_dev = self.config.get("output_device", "Default")
             
             if input_dev and input_dev != "Default":
-                try:
-                    input_index = int(input_dev.split(':')[0])
+                input_index = self._parse_dev_index(input_dev)
+                if input_index is not None:
                     self.parrot.input_device_index = input_index
                     print(f"Loaded input device index: {input_index}")
                     # Also update GUI dropdown
                     if hasattr(self, 'input_device_var'):
                         self.input_device_var.set(input_dev)
-                except (ValueError, IndexError):
-                    pass
             
             if output_dev and output_dev != "Default":
-                try:
-                    output_index = int(output_dev.split(':')[0])
+                output_index = self._parse_dev_index(output_dev)
+                if output_index is not None:
                     self.parrot.output_device_index = output_index
                     print(f"Loaded output device index: {output_index}")
                     # Also update GUI dropdown
                     if hasattr(self, 'output_device_var'):
                         self.output_device_var.set(output_dev)
-                except (ValueError, IndexError):
-                    pass
             
             # Weather settings
+            weather_enabled = self.config.get("weather_enabled", False)
+            self.parrot.weather.enabled = weather_enabled
             if hasattr(self, 'weather_enabled_var'):
-                weather_enabled = self.config.get("weather_enabled", False)
                 self.weather_enabled_var.set(weather_enabled)
-                self.parrot.weather.enabled = weather_enabled
                 if weather_enabled:
                     self.weather_status_label.config(text="Weather: Enabled", foreground='green')
-            
-            if hasattr(self, 'weather_zip_var'):
-                weather_zip = self.config.get("weather_zip", "03894")
-                self.weather_zip_var.set(weather_zip)
-                self.parrot.weather.zip_code = weather_zip
-            
-            if hasattr(self, 'weather_include_id_var'):
-                weather_in_id = self.config.get("weather_include_in_id", False)
-                self.weather_include_id_var.set(weather_in_id)
-                self.parrot.include_weather_in_id = weather_in_id
-            
+
             # Manual coordinates
-            if hasattr(self, 'weather_lat_var'):
-                weather_lat = self.config.get("weather_manual_lat", "")
-                weather_lon = self.config.get("weather_manual_lon", "")
-                if weather_lat and weather_lon:
+            weather_lat = self.config.get("weather_manual_lat", "")
+            weather_lon = self.config.get("weather_manual_lon", "")
+            if weather_lat and weather_lon:
+                if hasattr(self, 'weather_lat_var'):
                     self.weather_lat_var.set(weather_lat)
                     self.weather_lon_var.set(weather_lon)
-                    try:
-                        lat = float(weather_lat)
-                        lon = float(weather_lon)
-                        self.parrot.weather.set_coordinates(lat, lon)
-                    except:
-                        pass
-            
-            # DTMF settings
-            if hasattr(self, 'dtmf_enabled_var'):
-                dtmf_enabled = self.config.get("dtmf_enabled", False)
-                self.dtmf_enabled_var.set(dtmf_enabled)
-                self.parrot.dtmf.enabled = dtmf_enabled
+                try:
+                    lat = float(weather_lat)
+                    lon = float(weather_lon)
+                    self.parrot.weather.set_coordinates(lat, lon)
+                except:
+                    pass
             
-            # Debug mode
+            # Debug mode fans out to every subsystem (and the logger, so
+            # a saved debug-on survives a restart)
             if hasattr(self, 'debug_mode_var'):
                 debug_mode = self.config.get("debug_mode", False)
                 self.debug_mode_var.set(debug_mode)
-                self.parrot.debug_mode = debug_mode
-                self.parrot.weather.debug_mode = debug_mode
-                self.parrot.dtmf.debug_mode = debug_mode
+                self._apply_debug_mode(debug_mode)
             
             # DTMF custom messages
-            if hasattr(self, 'dtmf_custom_vars'):
-                for key, var in self.dtmf_custom_vars.items():
-                    msg = self.config.get(f"dtmf_message_{key}", f"Custom message {key[-1]}")
+            custom_vars = getattr(self, 'dtmf_custom_vars', {})
+            for n in range(1, 9):
+                key = f"custom{n}"
+                msg = self.config.get(f"dtmf_message_{key}", f"Custom message {n}")
+                self.parrot.dtmf_messages[key] = msg
+                var = custom_vars.get(key)
+                if var is not None:
                     var.set(msg)
-                    self.parrot.dtmf_messages[key] = msg
-            
+            if custom_vars:
+                # Loading isn't a user edit - the traces fired above
+                self._dtmf_dirty.clear()
+
             print("Settings loaded from config")
         except Exception as e:
             print(f"Error loading some settings: {e}")
     
+    def _schedule_save(self):
+        """Debounced save_config for slider callbacks.
+
+        A drag fires the callback once per pixel, and saving synchronously
+        wrote the JSON config to disk mid-drag. Coalesce to a single save
+        250ms after the last movement; cheap label updates stay immediate.
+        """
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(250, self._flush_save)
+
+    def _flush_save(self):
+        """Run the deferred config save"""
+        self._save_after_id = None
+        self.save_config()
+
     def save_config(self):
-        """Save current settings to config - with safe hasattr checks"""
-        try:
-            # Core settings - these should always exist
-            if hasattr(self, 'callsign_var'):
-                self.config["callsign"] = self.callsign_var.get()
-            if hasattr(self, 'id_interval_var'):
-                self.config["id_interval"] = self.id_interval_var.get()
-            if hasattr(self, 'courtesy_tone_var'):
-                self.config["courtesy_tone_enabled"] = self.courtesy_tone_var.get()
-            if hasattr(self, 'tone_freq_var'):
-                self.config["courtesy_tone_freq"] = self.tone_freq_var.get()
-            if hasattr(self, 'tone_volume_var'):
-                self.config["courtesy_tone_volume"] = self.tone_volume_var.get()
-            if hasattr(self, 'tone_duration_var'):
-                self.config["courtesy_tone_duration"] = self.tone_duration_var.get()
-            if hasattr(self, 'auto_id_var'):
-                self.config["auto_id_enabled"] = self.auto_id_var.get()
-            if hasattr(self, 'input_gain_var'):
-                self.config["input_gain"] = self.input_gain_var.get()
-            if hasattr(self, 'output_gain_var'):
-                self.config["output_gain"] = self.output_gain_var.get()
-            if hasattr(self, 'timeout_var'):
-                self.config["timeout_duration"] = self.timeout_var.get()
-            if hasattr(self, 'ptt_predelay_var'):
-                self.config["ptt_pre_delay"] = self.ptt_predelay_var.get()
-            if hasattr(self, 'tail_silence_var'):
-                self.config["tail_silence"] = self.tail_silence_var.get()
-            
-            # VOX settings
-            if hasattr(self, 'vox_enable_var'):
-                self.config["vox_enabled"] = self.vox_enable_var.get()
-            if hasattr(self, 'vox_threshold_var'):
-                self.config["vox_threshold"] = self.vox_threshold_var.get()
-            if hasattr(self, 'vox_attack_var'):
-                self.config["vox_attack"] = self.vox_attack_var.get()
-            if hasattr(self, 'vox_release_var'):
-                self.config["vox_release"] = self.vox_release_var.get()
-            
-            # Feedback protection settings
-            if hasattr(self, 'feedback_protection_var'):
-                self.config["feedback_protection_enabled"] = self.feedback_protection_var.get()
-            if hasattr(self, 'feedback_holdoff_var'):
-                self.config["feedback_holdoff_time"] = self.feedback_holdoff_var.get()
-            
-            # PTT settings
-            if hasattr(self, 'ptt_mode_var'):
-                self.config["ptt_mode"] = self.ptt_mode_var.get()
-            if hasattr(self, 'serial_port_var'):
-                self.config["serial_port"] = self.serial_port_var.get()
-            
-            # Mode settings
-            if hasattr(self, 'mode_var'):
-                self.config["recording_mode"] = self.mode_var.get()
-            
-            # Optional mode-specific settings
-            if hasattr(self, 'timer_var'):
-                self.config["max_record_time"] = self.timer_var.get()
-            
-            if hasattr(self, 'delay_var'):
-                self.config["delay_time"] = self.delay_var.get()
-            
-            if hasattr(self, 'ptt_prekey_delay_var'):
-                self.config["ptt_prekey_time"] = self.ptt_prekey_delay_var.get()
-            
-            # Weather settings
-            if hasattr(self, 'weather_enabled_var'):
-                self.config["weather_enabled"] = self.weather_enabled_var.get()
-            if hasattr(self, 'weather_zip_var'):
-                self.config["weather_zip"] = self.weather_zip_var.get()
-            if hasattr(self, 'weather_include_id_var'):
-                self.config["weather_include_in_id"] = self.weather_include_id_var.get()
-            if hasattr(self, 'weather_lat_var'):
-                self.config["weather_manual_lat"] = self.weather_lat_var.get()
-            if hasattr(self, 'weather_lon_var'):
-                self.config["weather_manual_lon"] = self.weather_lon_var.get()
-            
-            # DTMF settings
-            if hasattr(self, 'dtmf_enabled_var'):
-                self.config["dtmf_enabled"] = self.dtmf_enabled_var.get()
-            
-            # Debug mode
-            if hasattr(self, 'debug_mode_var'):
-                self.config["debug_mode"] = self.debug_mode_var.get()
-            
-            # DTMF custom messages
-            if hasattr(self, 'dtmf_custom_vars'):
-                for key, var in self.dtmf_custom_vars.items():
-                    self.config[f"dtmf_message_{key}"] = var.get()
-            
-            # Save to file
-            self.config_manager.save_config(self.config)
-        except Exception as e:
-            print(f"Warning: Error saving config: {e}")
-            # Don't crash if save fails
-    
+        """Save current settings to config"""
+        # Gather everything into one local dict and land it on
+        # self.config with a single update call
+        updates = {}
+
+        # Regular fields come straight from the declarative spec
+        for key, _default, var_name, *_rest in self._SETTINGS_SPEC:
+            var = getattr(self, var_name, None)
+            if var is not None:
+                updates[key] = var.get()
+
+        # Fields with no engine-side entry in the spec
+        for key, var_name in (
+            ("vox_attack", 'vox_attack_var'),
+            ("vox_release", 'vox_release_var'),
+            ("feedback_protection_enabled", 'feedback_protection_var'),
+            ("ptt_mode", 'ptt_mode_var'),
+            ("serial_port", 'serial_port_var'),
+            ("recording_mode", 'mode_var'),
+            ("weather_enabled", 'weather_enabled_var'),
+            ("weather_manual_lat", 'weather_lat_var'),
+            ("weather_manual_lon", 'weather_lon_var'),
+            ("debug_mode", 'debug_mode_var'),
+        ):
+            var = getattr(self, var_name, None)
+            if var is not None:
+                updates[key] = var.get()
+
+        # DTMF custom messages (config keys precomputed at tab build)
+        for key, var in getattr(self, 'dtmf_custom_vars', {}).items():
+            updates[self._dtmf_keys[key]] = var.get()
+
+        self.config.update(updates)
+
+        # Skip the serialize + fsync when nothing actually changed
+        # since the last write (sliders often report repeat values)
+        items = tuple(sorted(self.config.items()))
+        if items == self._last_saved_items:
+            return
+        # ConfigManager reports failure by returning False, so only
+        # remember the snapshot when the write actually landed -
+        # otherwise a full disk would silently pin the skip forever
+        if self.config_manager.save_config(self.config):
+            self._last_saved_items = items
+
     def save_config_menu(self):
         """Save configuration from File menu"""
         self.save_config()
@@ -3457,6 +4537,7 @@ class ParrotBoxGUI:
             if self.parrot.recording_mode in [RecordingMode.CONTINUOUS_DELAY, RecordingMode.MANUAL]:
                 self.start_rec_button.config(state='normal')
             
+            self.parrot._levels_needed = True
             self.update_levels()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start:\n{e}")
@@ -3475,30 +4556,29 @@ class ParrotBoxGUI:
         if self.update_job:
             self.root.after_cancel(self.update_job)
             self.update_job = None
-        
+
+        self.parrot._levels_needed = False
         self.reset_levels()
     
     def change_mode(self):
         """Change recording mode"""
-        mode_name = self.mode_var.get()
-        for mode in RecordingMode:
-            if mode.value == mode_name:
-                # Reset any in-progress record/play when switching modes
-                self.parrot.is_recording = False
-                self.parrot.is_playing_back = False
-                self.parrot.playback_index = 0
-                self.parrot.record_start_time = 0
-                self.parrot.recorded_audio = []
-
-                self.parrot.recording_mode = mode
-                print(f"Mode changed to: {mode.value}")
-
-                # If system is running and we switched into Timed Auto-Replay,
-                # begin the loop immediately.
-                if self.parrot.is_running and mode == RecordingMode.TIMED_REPLAY:
-                    self.parrot.start_recording()
-                break
-        self.save_config()
+        mode = _RECMODE_BY_VALUE.get(self.mode_var.get())
+        if mode is not None:
+            # Reset any in-progress record/play when switching modes
+            self.parrot.is_recording = False
+            self.parrot.is_playing_back = False
+            self.parrot.playback_index = 0
+            self.parrot.record_start_time = 0
+            self.parrot.recorded_audio = []
+
+            self.parrot.set_recording_mode(mode)
+            print(f"Mode changed to: {mode.value}")
+
+            # If system is running and we switched into Timed Auto-Replay,
+            # begin the loop immediately.
+            if self.parrot.is_running and mode == RecordingMode.TIMED_REPLAY:
+                self.parrot.start_recording()
+        self._schedule_save()
     
     def manual_id(self):
         """Manually trigger station ID"""
@@ -3511,13 +4591,11 @@ class ParrotBoxGUI:
             messagebox.showinfo("Info", "Start the system first, then test audio")
             return
         
-        # Generate a test beep
+        # Queue the beep through the announcement pipeline - the TTS
+        # thread is the ready queue's only producer, so the GUI must not
+        # put PCM into it directly
         print("Generating test beep...")
-        test_audio = self.parrot.repeater.generate_courtesy_tone(self.parrot.RATE)
-        print(f"Test beep generated: {len(test_audio)} samples, peak: {np.abs(test_audio).max()}")
-        
-        # Queue it for playback
-        self.parrot.announcement_ready_queue.put(test_audio)
+        self.parrot.queue_test_beep()
         messagebox.showinfo("Test", "Test beep queued! You should hear a tone.\nCheck your speakers/output device if you don't hear anything.")
     
     def manual_save_recording(self):
@@ -3550,15 +4628,30 @@ class ParrotBoxGUI:
         )
         
         if filename:
-            if self.parrot.save_recording(filename):
-                # Add to list
-                self.recordings_history.append(filename)
-                if hasattr(self, 'recordings_listbox'):
-                    basename = os.path.basename(filename)
-                    self.recordings_listbox.insert(0, basename)
-                messagebox.showinfo("Success", f"Recording saved!\n{filename}")
-            else:
-                messagebox.showerror("Error", "Failed to save recording")
+            self.parrot._io_pool.submit(
+                self._write_recording_bg, filename,
+                self.parrot.recorded_audio, True)
+
+    def _write_recording_bg(self, path, frames, notify=False):
+        """Write a WAV on the engine's I/O pool and update the GUI after.
+
+        A multi-minute recording is a multi-MB write; doing it here keeps
+        the thread that finished the recording (and the UI) responsive.
+        """
+        if self.parrot._write_wav(path, frames):
+            self.recordings_history.append(path)
+            name = os.path.basename(path)
+            def done():
+                if self.recordings_listbox is not None:
+                    self._insert_recording(name)
+                if notify:
+                    messagebox.showinfo("Success", f"Recording saved!\n{path}")
+            self.root.after(0, done)
+        elif notify:
+            self.root.after(0, lambda: messagebox.showerror(
+                "Error", "Failed to save recording"))
+        else:
+            print("Recording complete but failed to save WAV")
     
     def start_recording_clicked(self):
         """Start recording button clicked"""
@@ -3598,37 +4691,47 @@ class ParrotBoxGUI:
     
     def show_audio_devices(self):
         """Show available audio devices"""
-        devices_info = "Available Audio Devices:\n\n"
-        
+        # PortAudio enumeration can take tens of ms per device, so run it
+        # off the Tk thread and open the window once the text is ready
+        threading.Thread(target=self._enumerate_devices, daemon=True).start()
+
+    def _enumerate_devices(self):
+        """Background thread: build the device listing, then show it"""
         try:
+            parts = ["Available Audio Devices:\n\n"]
             audio = pyaudio.PyAudio()
-            for i in range(audio.get_device_count()):
-                info = audio.get_device_info_by_index(i)
-                devices_info += f"Device {i}: {info['name']}\n"
-                devices_info += f"  Inputs: {info['maxInputChannels']}, Outputs: {info['maxOutputChannels']}\n"
-                devices_info += f"  Default Rate: {info['defaultSampleRate']}\n\n"
-            audio.terminate()
-            
-            # Create a scrollable text window
-            window = tk.Toplevel(self.root)
-            window.title("Audio Devices")
-            window.geometry("600x400")
-            
-            text = tk.Text(window, wrap='word')
-            text.pack(fill='both', expand=True, padx=10, pady=10)
-            text.insert('1.0', devices_info)
-            text.config(state='disabled')
-            
-            ttk.Button(window, text="Close", command=window.destroy).pack(pady=5)
-            
+            try:
+                for i in range(audio.get_device_count()):
+                    info = audio.get_device_info_by_index(i)
+                    parts.append(f"Device {i}: {info['name']}\n")
+                    parts.append(f"  Inputs: {info['maxInputChannels']}, Outputs: {info['maxOutputChannels']}\n")
+                    parts.append(f"  Default Rate: {info['defaultSampleRate']}\n\n")
+            finally:
+                audio.terminate()
+            devices_info = "".join(parts)
+            self.root.after(0, lambda: self._show_devices_window(devices_info))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to get audio devices:\n{e}")
+            self.root.after(0, lambda: messagebox.showerror(
+                "Error", f"Failed to get audio devices:\n{e}"))
+
+    def _show_devices_window(self, devices_info):
+        """Open the scrollable device-listing window (main thread)"""
+        window = tk.Toplevel(self.root)
+        window.title("Audio Devices")
+        window.geometry("600x400")
+
+        text = tk.Text(window, wrap='word')
+        text.pack(fill='both', expand=True, padx=10, pady=10)
+        text.insert('1.0', devices_info)
+        text.config(state='disabled')
+
+        ttk.Button(window, text="Close", command=window.destroy).pack(pady=5)
     
     def update_callsign(self):
         """Update repeater callsign"""
         callsign = self.callsign_var.get().strip().upper()
         self.parrot.repeater.callsign = callsign
-        self.save_config()
+        self._schedule_save()
         print(f"Callsign updated to: {callsign}")
     
     def update_id_interval(self, value):
@@ -3636,38 +4739,38 @@ class ParrotBoxGUI:
         interval = float(value)
         self.id_interval_label.config(text=f"{int(interval)} min")
         self.parrot.repeater.id_interval = interval * 60  # Convert to seconds
-        self.save_config()
+        self._schedule_save()
     
     def toggle_courtesy_tone(self):
         """Toggle courtesy tone"""
         self.parrot.repeater.enable_courtesy_tone = self.courtesy_tone_var.get()
-        self.save_config()
+        self._schedule_save()
     
     def update_tone_freq(self, value):
         """Update courtesy tone frequency"""
         freq = float(value)
         self.tone_freq_label.config(text=f"{int(freq)} Hz")
         self.parrot.repeater.courtesy_tone_freq = freq
-        self.save_config()
+        self._schedule_save()
     
     def update_tone_volume(self, value):
         """Update courtesy tone volume"""
         volume = float(value)
         self.tone_volume_label.config(text=f"{int(volume*100)}%")
         self.parrot.repeater.courtesy_tone_volume = volume
-        self.save_config()
+        self._schedule_save()
     
     def update_tone_duration(self, value):
         """Update courtesy tone duration"""
         duration = float(value)
         self.tone_duration_label.config(text=f"{duration:.1f} sec")
         self.parrot.repeater.courtesy_tone_duration = duration
-        self.save_config()
+        self._schedule_save()
     
     def toggle_auto_id(self):
         """Toggle automatic ID announcements"""
         self.parrot.repeater.auto_id_enabled = self.auto_id_var.get()
-        self.save_config()
+        self._schedule_save()
         if self.auto_id_var.get():
             print("Automatic ID announcements enabled")
         else:
@@ -3677,36 +4780,36 @@ class ParrotBoxGUI:
         """Update input gain"""
         gain = float(value)
         self.input_gain_label.config(text=f"{int(gain*100)}%")
-        self.parrot.input_gain = gain
-        self.save_config()
+        self.parrot.set_input_gain(gain)
+        self._schedule_save()
     
     def update_output_gain(self, value):
         """Update output gain"""
         gain = float(value)
         self.output_gain_label.config(text=f"{int(gain*100)}%")
-        self.parrot.output_gain = gain
-        self.save_config()
+        self.parrot.set_output_gain(gain)
+        self._schedule_save()
     
     def update_timeout(self, value):
         """Update timeout timer"""
         timeout = float(value)
         self.timeout_label.config(text=f"{int(timeout)} sec")
         self.parrot.repeater.timeout_duration = timeout
-        self.save_config()
+        self._schedule_save()
     
     def update_ptt_predelay(self, value):
         """Update PTT pre-delay"""
         delay = float(value)
         self.ptt_predelay_label.config(text=f"{delay:.1f} sec")
         self.parrot.ptt_pre_delay = delay
-        self.save_config()
+        self._schedule_save()
     
     def update_tail_silence(self, value):
         """Update tail silence duration"""
         duration = float(value)
         self.tail_silence_label.config(text=f"{duration:.1f} sec")
         self.parrot.repeater.tail_silence_duration = duration
-        self.save_config()
+        self._schedule_save()
     
     def toggle_feedback_protection(self):
         """Toggle feedback protection"""
@@ -3720,14 +4823,14 @@ class ParrotBoxGUI:
             self.feedback_status_label.config(text="○ Disabled", foreground='red')
             print("Feedback protection DISABLED")
         
-        self.save_config()
+        self._schedule_save()
     
     def update_feedback_holdoff(self, value):
         """Update feedback protection holdoff time"""
         holdoff = float(value)
         self.feedback_holdoff_label.config(text=f"{holdoff:.1f}s")
         self.parrot.feedback_holdoff_time = holdoff
-        self.save_config()
+        self._schedule_save()
     
     def update_delay(self, value):
         """Update delay value for continuous mode"""
@@ -3735,14 +4838,14 @@ class ParrotBoxGUI:
         self.delay_value_label.config(text=f"{delay:.1f}s")
         if self.parrot.is_running:
             self.parrot.set_delay(delay)
-        self.save_config()
+        self._schedule_save()
     
     def update_timer(self, value):
         """Update max record time"""
         timer = float(value)
         self.timer_value_label.config(text=f"{int(timer)}s")
         self.parrot.max_record_time = timer
-        self.save_config()
+        self._schedule_save()
     
     def send_custom_announcement(self):
         """Send custom announcement"""
@@ -3755,15 +4858,24 @@ class ParrotBoxGUI:
     def toggle_vox(self):
         """Toggle VOX"""
         self.parrot.vox_enabled = self.vox_enable_var.get()
-        self.save_config()
+        self._schedule_save()
     
+    def _apply_debug_mode(self, enabled):
+        """Fan the debug flag out to every subsystem and the logger"""
+        self.parrot.debug_mode = enabled
+        self.parrot.weather.debug_mode = enabled
+        self.parrot.dtmf.debug_mode = enabled
+        self.parrot.ptt_controller.debug_mode = enabled
+        self.config_manager.debug_mode = enabled
+        logger.setLevel(logging.DEBUG if enabled else logging.WARNING)
+        if enabled and not logger.handlers:
+            logger.addHandler(logging.StreamHandler())
+
     def toggle_debug_mode(self):
         """Toggle debug mode"""
         debug_enabled = self.debug_mode_var.get()
-        self.parrot.debug_mode = debug_enabled
-        self.parrot.weather.debug_mode = debug_enabled
-        self.parrot.dtmf.debug_mode = debug_enabled
-        self.save_config()
+        self._apply_debug_mode(debug_enabled)
+        self._schedule_save()
         if debug_enabled:
             print("🔧 Debug mode ENABLED - Verbose console output active")
         else:
@@ -3774,33 +4886,31 @@ class ParrotBoxGUI:
         threshold = float(value)
         self.vox_threshold_label.config(text=f"{threshold:.1f}%")
         self.parrot.vox.threshold = threshold
-        self.save_config()
+        self._schedule_save()
     
     def update_vox_attack(self, value):
         """Update VOX attack time"""
         attack = float(value)
         self.vox_attack_label.config(text=f"{attack:.2f}s")
         self.parrot.vox.attack_time = attack
-        self.parrot.vox.attack_samples = int(self.parrot.RATE * attack / 1024)
-        self.save_config()
+        self.parrot.vox.attack_samples = int(attack * self._rate_per_chunk)
+        self._schedule_save()
     
     def update_vox_release(self, value):
         """Update VOX release time"""
         release = float(value)
         self.vox_release_label.config(text=f"{release:.2f}s")
         self.parrot.vox.release_time = release
-        self.parrot.vox.release_samples = int(self.parrot.RATE * release / 1024)
-        self.save_config()
+        self.parrot.vox.release_samples = int(release * self._rate_per_chunk)
+        self._schedule_save()
     
     def change_ptt_mode(self):
         """Change PTT mode"""
-        mode_name = self.ptt_mode_var.get()
-        for mode in PTTMode:
-            if mode.value == mode_name:
-                self.parrot.ptt_mode = mode
-                print(f"PTT mode changed to: {mode.value}")
-                break
-        self.save_config()
+        mode = _PTT_BY_VALUE.get(self.ptt_mode_var.get())
+        if mode is not None:
+            self.parrot.ptt_mode = mode
+            print(f"PTT mode changed to: {mode.value}")
+        self._schedule_save()
     
     def refresh_serial_ports(self):
         """Refresh serial ports"""
@@ -3829,7 +4939,7 @@ class ParrotBoxGUI:
                 self.connect_button.config(text="Disconnect")
                 self.serial_status_label.config(text=f"● Connected to {port} ({relay_type})", 
                                               foreground='green')
-                self.save_config()  # Save the port
+                self._schedule_save()  # Save the port
             else:
                 messagebox.showerror("Error", f"Failed to connect to {port}")
     
@@ -3837,7 +4947,7 @@ class ParrotBoxGUI:
         """Change relay type"""
         relay_type = self.relay_type_var.get()
         self.parrot.ptt_controller.set_relay_type(relay_type)
-        self.save_config()
+        self._schedule_save()
         print(f"Relay type changed to: {relay_type}")
         
         # If already connected, reconnect with new type
@@ -3864,46 +4974,62 @@ class ParrotBoxGUI:
     def update_levels(self):
         """Update audio levels"""
         if self.parrot.is_running:
-            input_level = min(100, self.parrot.input_level)
-            self.input_level_bar['value'] = input_level
-            self.input_level_label.config(text=f"{int(input_level)}%")
-            
-            output_level = min(100, self.parrot.output_level)
-            self.output_level_bar['value'] = output_level
-            self.output_level_label.config(text=f"{int(output_level)}%")
-            
-            # Update audio device tab levels
-            if hasattr(self, 'input_device_level_bar'):
-                self.input_device_level_bar['value'] = input_level
-                self.input_device_level_label.config(text=f"{int(input_level)}%")
-            
-            if hasattr(self, 'output_device_level_bar'):
-                self.output_device_level_bar['value'] = output_level
-                self.output_device_level_label.config(text=f"{int(output_level)}%")
-            
+            # One-pole smoothing for the meters, and skip the Tcl writes
+            # entirely when the displayed integer hasn't changed - during
+            # steady audio most ticks repaint nothing
+            self._disp_in += 0.3 * (min(100, self.parrot.input_level) - self._disp_in)
+            self._disp_out += 0.3 * (min(100, self.parrot.output_level) - self._disp_out)
+            in_int = int(self._disp_in)
+            out_int = int(self._disp_out)
+
+            # The device-tab mirrors and the feedback label live on the
+            # eagerly built Audio/VOX tabs, so no existence probes needed
+            # on this 20 Hz path
+            if in_int != self._last_in_int:
+                self._last_in_int = in_int
+                self.input_level_bar['value'] = in_int
+                self.input_level_label.config(text=f"{in_int}%")
+                self.input_device_level_bar['value'] = in_int
+                self.input_device_level_label.config(text=f"{in_int}%")
+
+            if out_int != self._last_out_int:
+                self._last_out_int = out_int
+                self.output_level_bar['value'] = out_int
+                self.output_level_label.config(text=f"{out_int}%")
+                self.output_device_level_bar['value'] = out_int
+                self.output_device_level_label.config(text=f"{out_int}%")
+
             # Update waveforms
-            if hasattr(self, 'update_waveforms'):
-                self.update_waveforms()
-            
-            # VOX status
-            if self.parrot.vox.is_active:
-                self.vox_status_label.config(text="● Active", foreground='green')
-            else:
-                self.vox_status_label.config(text="○ Inactive", foreground='black')
-            
-            # PTT status
-            if self.parrot.ptt_controller.ptt_active or self.parrot.is_announcing:
-                self.ptt_status_label.config(text="● PTT ON", foreground='red')
-            else:
-                self.ptt_status_label.config(text="○ PTT OFF", foreground='black')
-            
-            # Feedback protection status
-            if hasattr(self, 'feedback_status_label') and self.parrot.feedback_protection_enabled:
-                if self.parrot.is_in_holdoff:
-                    self.feedback_status_label.config(text="● Muting Input", foreground='orange')
+            self.update_waveforms()
+
+            # VOX status (repainted only on change)
+            vox_active = self.parrot.vox.is_active
+            if vox_active != self._last_vox_disp:
+                self._last_vox_disp = vox_active
+                if vox_active:
+                    self.vox_status_label.config(text="● Active", foreground='green')
                 else:
-                    self.feedback_status_label.config(text="● Active", foreground='green')
-            
+                    self.vox_status_label.config(text="○ Inactive", foreground='black')
+
+            # PTT status (repainted only on change)
+            ptt_on = self.parrot.ptt_controller.ptt_active or self.parrot.is_announcing
+            if ptt_on != self._last_ptt_disp:
+                self._last_ptt_disp = ptt_on
+                if ptt_on:
+                    self.ptt_status_label.config(text="● PTT ON", foreground='red')
+                else:
+                    self.ptt_status_label.config(text="○ PTT OFF", foreground='black')
+
+            # Feedback protection status (repainted only on change)
+            if self.parrot.feedback_protection_enabled:
+                holdoff = self.parrot.is_in_holdoff
+                if holdoff != self._last_fb_disp:
+                    self._last_fb_disp = holdoff
+                    if holdoff:
+                        self.feedback_status_label.config(text="● Muting Input", foreground='orange')
+                    else:
+                        self.feedback_status_label.config(text="● Active", foreground='green')
+
             self.update_job = self.root.after(50, self.update_levels)
     
     def reset_levels(self):
@@ -3914,6 +5040,10 @@ class ParrotBoxGUI:
         self.output_level_label.config(text="0%")
         self.vox_status_label.config(text="○ Inactive", foreground='black')
         self.ptt_status_label.config(text="○ PTT OFF", foreground='black')
+        # Clear the display caches so the next run repaints everything
+        self._disp_in = self._disp_out = 0.0
+        self._last_in_int = self._last_out_int = -1
+        self._last_vox_disp = self._last_ptt_disp = self._last_fb_disp = None
     
     def on_recording_complete(self):
         """Recording complete callback"""
@@ -3927,14 +5057,10 @@ class ParrotBoxGUI:
             filename = f"recording_{mode}_{ts}.wav"
             path = os.path.join(self.recordings_dir, filename)
 
-            if self.parrot.save_recording(path):
-                # Keep a simple history list and UI listbox
-                self.recordings_history.append(path)
-                if hasattr(self, 'recordings_listbox'):
-                    # Show newest at top
-                    self.recordings_listbox.insert(0, filename)
-            else:
-                print("Recording complete but failed to save WAV")
+            # Hand the write to the engine's I/O pool; the list/history
+            # update happens from the worker once the file is on disk
+            self.parrot._io_pool.submit(
+                self._write_recording_bg, path, self.parrot.recorded_audio)
         except Exception as e:
             print(f"Error saving recording: {e}")
     
@@ -3968,6 +5094,11 @@ class ParrotBoxGUI:
         """Handle window close"""
         if self.parrot.is_running:
             self.stop_parrot()
+        # A debounced save may still be pending - cancel it and save
+        # synchronously so the last slider position isn't lost
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         self.save_config()  # Save config on exit
         self.parrot.cleanup()
         self.root.destroy()